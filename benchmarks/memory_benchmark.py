@@ -0,0 +1,115 @@
+import argparse
+import gc
+import os
+import subprocess
+import sys
+import tempfile
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SLOTTED_MODEL = "models/gold_transaction_model.py"
+
+
+def get_before_revision():
+    # The "before" models are the ones from just before __slots__ was added,
+    # read straight from git history.
+    commits = subprocess.run(
+        ["git", "log", "--format=%H", "--reverse", "-S__slots__", "--",
+         SLOTTED_MODEL],
+        cwd=ROOT, capture_output=True, text=True, check=True).stdout.split()
+    return commits[0] + "^"
+
+
+def export_revision(revision, directory):
+    archive = subprocess.run(
+        ["git", "archive", revision, "models", "enums"],
+        cwd=ROOT, capture_output=True, check=True).stdout
+    subprocess.run(["tar", "-x", "-C", directory], input=archive, check=True)
+
+
+def build_models(rows, share_exchange_rate):
+    from enums.currency_type_enum import CurrencyType
+    from enums.gold_type_enum import GoldType
+    from models.currency_transaction_model import CurrencyTransaction
+    from models.exchange_rate_model import ExchangeRate
+    from models.gold_transaction_model import GoldTransaction
+
+    transactions = []
+    exchange_rate = ExchangeRate(2, CurrencyType.USD, 25137.0, 1, 1, 2024)
+    for index in range(rows):
+        day = index % 28 + 1
+        month = index % 12 + 1
+        if index % 2 == 0:
+            transactions.append(GoldTransaction(
+                f"GLD{index:07}", day, month, 2024, 85200000.0 + index,
+                float(index % 10 + 1), GoldType(index % 3)))
+        else:
+            if not share_exchange_rate:
+                # The previous loader built one ExchangeRate per row.
+                exchange_rate = ExchangeRate(
+                    2, CurrencyType.USD, 25137.0, 1, 1, 2024)
+            transactions.append(CurrencyTransaction(
+                f"CUR{index:07}", day, month, 2024, float(index),
+                CurrencyType.USD, exchange_rate))
+    return transactions
+
+
+def measure(directory, rows, share_exchange_rate):
+    # Each case runs in its own interpreter, so both model versions can be
+    # imported under the same package names.
+    command = [sys.executable, os.path.abspath(__file__), "--measure",
+               directory, "--rows", str(rows)]
+    if share_exchange_rate:
+        command.append("--share-exchange-rate")
+    output = subprocess.run(command, capture_output=True, text=True,
+                            check=True).stdout
+    current, peak = output.split()
+    return int(current), int(peak)
+
+
+def run_measurement(args):
+    sys.path.insert(0, args.measure)
+    build_models(1, args.share_exchange_rate)
+
+    gc.collect()
+    tracemalloc.start()
+    transactions = build_models(args.rows, args.share_exchange_rate)
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del transactions
+    print(current, peak)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compare memory used by the baseline and slotted models.")
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--before", default=None,
+                        help="git revision of the models to compare against")
+    parser.add_argument("--measure", help=argparse.SUPPRESS)
+    parser.add_argument("--share-exchange-rate", action="store_true",
+                        help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.measure is not None:
+        run_measurement(args)
+        return
+
+    before_revision = args.before or get_before_revision()
+    with tempfile.TemporaryDirectory() as directory:
+        export_revision(before_revision, directory)
+        before, before_peak = measure(directory, args.rows, False)
+    after, after_peak = measure(ROOT, args.rows, True)
+
+    print(f"Rows: {args.rows:,} (half gold, half currency)")
+    print(f"Before ({before_revision}, one ExchangeRate per row): "
+          f"{before / args.rows:,.1f} bytes/transaction, "
+          f"peak {before_peak / 2 ** 20:,.1f} MiB")
+    print(f"After (working tree, shared ExchangeRate): "
+          f"{after / args.rows:,.1f} bytes/transaction, "
+          f"peak {after_peak / 2 ** 20:,.1f} MiB")
+    print(f"Saved: {(before - after) / before:.1%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,6 @@
+from enum import Enum
+
+
+class TransactionType(Enum):
+    GOLD = 0
+    CURRENCY = 1
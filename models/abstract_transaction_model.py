@@ -2,6 +2,9 @@ from abc import ABC, abstractmethod
 
 
 class AbstractTransaction(ABC):
+    __slots__ = ("_id", "_day", "_month", "_year", "_unit_price", "_quantity",
+                 "_total_amount")
+
     def __init__(self, id, day, month, year, *args):
         self._id = id
         self._day = day
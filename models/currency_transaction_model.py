@@ -3,6 +3,8 @@ from enums.currency_type_enum import CurrencyType
 
 
 class CurrencyTransaction(Transaction):
+    __slots__ = ("_currency_type", "_exchange_rate")
+
     def __init__(self, id, day, month, year, quantity,
                  currency_type, exchange_rate, isdeleted=False):
         self._currency_type = currency_type
@@ -1,4 +1,7 @@
 class ExchangeRate:
+    __slots__ = ("_id", "_currency_type", "_rate", "_effective_day",
+                 "_effective_month", "_effective_year")
+
     def __init__(self, id, currency_type, rate, effective_day, effective_month,
                  effective_year):
         self._id = id
@@ -2,6 +2,8 @@ from models.transaction_model import Transaction
 
 
 class GoldTransaction(Transaction):
+    __slots__ = ("_gold_type",)
+
     def __init__(self, id, day, month, year, unit_price, quantity, gold_type,
                  isdeleted=False):
         super().__init__(id, day, month, year, unit_price, quantity,
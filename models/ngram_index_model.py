@@ -0,0 +1,87 @@
+class NGramIndex:
+    GRAM_SIZE = 3
+
+    def __init__(self, transactions=()):
+        self._postings = {}
+        self._entries = {}
+        for transaction in transactions:
+            self.add(transaction)
+
+    def get_grams(self, text):
+        grams = set()
+        for size in range(1, self.GRAM_SIZE + 1):
+            for start in range(len(text) - size + 1):
+                grams.add(text[start:start + size])
+        return grams
+
+    def add(self, transaction):
+        id = transaction._id
+        entries = self._entries.get(id)
+        if entries is None:
+            entries = self._entries[id] = {}
+            for gram in self.get_grams(id):
+                self._postings.setdefault(gram, {})[id] = None
+        entries[transaction] = None
+
+    def remove(self, transaction):
+        id = transaction._id
+        entries = self._entries.get(id)
+        if entries is None or transaction not in entries:
+            return
+
+        del entries[transaction]
+        if entries:
+            return
+
+        del self._entries[id]
+        for gram in self.get_grams(id):
+            posting = self._postings[gram]
+            del posting[id]
+            if not posting:
+                del self._postings[gram]
+
+    def replace(self, current, transaction):
+        # Edits keep the id, so the transaction keeps its place in results.
+        entries = self._entries[current._id]
+        self._entries[current._id] = {
+            (transaction if entry is current else entry): None
+            for entry in entries
+        }
+
+    def clear(self):
+        self._postings = {}
+        self._entries = {}
+
+    def get_postings(self, text):
+        size = min(len(text), self.GRAM_SIZE)
+        return [self._postings.get(text[start:start + size], {})
+                for start in range(len(text) - size + 1)]
+
+    def estimate(self, text):
+        if not text:
+            return len(self._entries)
+        return min(len(posting) for posting in self.get_postings(text))
+
+    def get_candidates(self, text):
+        if not text:
+            return list(self._entries)
+
+        postings = self.get_postings(text)
+        if not all(postings):
+            return []
+
+        # Postings keep ids in the order they were first added, so walking
+        # the shortest one gives results in that same order.
+        postings.sort(key=len)
+        return [id for id in postings[0]
+                if all(id in posting for posting in postings[1:])]
+
+    def get_transactions(self, ids):
+        transactions = []
+        for id in ids:
+            transactions.extend(self._entries[id])
+        return transactions
+
+    def search(self, text):
+        return self.get_transactions(
+            id for id in self.get_candidates(text) if text in id)
@@ -0,0 +1,68 @@
+import numpy as np
+
+from enums.transaction_type_enum import TransactionType
+from enums.gold_type_enum import GoldType
+from enums.currency_type_enum import CurrencyType
+
+
+class PeriodTotals:
+    SUBTYPE_COUNT = max(len(GoldType), len(CurrencyType))
+    # Each period gets one slot for its total, then per type one slot for
+    # the type total followed by one slot per subtype.
+    TYPE_STRIDE = SUBTYPE_COUNT + 1
+    KEY_COUNT = 1 + len(TransactionType) * TYPE_STRIDE
+
+    def __init__(self, periods, store, positions):
+        self._periods = periods
+        starts = np.array([start.toordinal() for start, end in periods],
+                          dtype=np.int64)
+        ends = np.array([end.toordinal() for start, end in periods],
+                        dtype=np.int64)
+
+        dates = store.get_column("date")[positions]
+        indexes = np.searchsorted(starts, dates, side="right") - 1
+        mask = (indexes >= 0) & (dates <= ends[indexes])
+        positions = positions[mask]
+        indexes = indexes[mask]
+
+        types = store.get_column("type")[positions].astype(np.int64)
+        subtypes = store.get_column("subtype")[positions].astype(np.int64)
+        amounts = store.get_column("total_amount")[positions]
+
+        period_slots = indexes * self.KEY_COUNT
+        type_slots = period_slots + 1 + types * self.TYPE_STRIDE
+        slots = np.concatenate(
+            [period_slots, type_slots, type_slots + 1 + subtypes])
+
+        # bincount adds the weights of a slot in position order, so every
+        # total matches a plain running sum over the same rows.
+        size = len(periods) * self.KEY_COUNT
+        self._counts = np.bincount(slots, minlength=size).reshape(
+            -1, self.KEY_COUNT)
+        self._total_amounts = np.bincount(
+            slots, weights=np.tile(amounts, 3), minlength=size).reshape(
+            -1, self.KEY_COUNT)
+
+    def __len__(self):
+        return len(self._periods)
+
+    def get_key(self, transaction_type=None, subtype=None):
+        if transaction_type is None:
+            return 0
+        key = 1 + transaction_type.value * self.TYPE_STRIDE
+        if subtype is not None:
+            key += 1 + subtype.value
+        return key
+
+    def get_total_amount(self, index, transaction_type=None, subtype=None):
+        key = self.get_key(transaction_type, subtype)
+        if not self._counts[index, key]:
+            return 0
+        return float(self._total_amounts[index, key])
+
+    def get_total_amounts(self, transaction_type=None, subtype=None):
+        key = self.get_key(transaction_type, subtype)
+        counts = self._counts[:, key].tolist()
+        total_amounts = self._total_amounts[:, key].tolist()
+        return [total_amount if count else 0
+                for count, total_amount in zip(counts, total_amounts)]
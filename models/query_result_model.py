@@ -0,0 +1,35 @@
+from enums.transaction_type_enum import TransactionType
+from models.gold_transaction_model import GoldTransaction
+from models.transaction_aggregate_model import TransactionAggregate
+
+
+class QueryResult:
+    def __init__(self, transactions):
+        self._transactions = transactions
+        self._transactions_by_type = None
+        self._aggregate = None
+
+    def __len__(self):
+        return len(self._transactions)
+
+    def get_transactions(self, transaction_type=None):
+        if transaction_type is None:
+            return self._transactions
+
+        if self._transactions_by_type is None:
+            self._transactions_by_type = {
+                TransactionType.GOLD: [],
+                TransactionType.CURRENCY: []
+            }
+            for transaction in self._transactions:
+                if isinstance(transaction, GoldTransaction):
+                    key = TransactionType.GOLD
+                else:
+                    key = TransactionType.CURRENCY
+                self._transactions_by_type[key].append(transaction)
+        return self._transactions_by_type[transaction_type]
+
+    def get_aggregate(self):
+        if self._aggregate is None:
+            self._aggregate = TransactionAggregate(self._transactions)
+        return self._aggregate
@@ -0,0 +1,57 @@
+from enums.transaction_type_enum import TransactionType
+from models.gold_transaction_model import GoldTransaction
+
+
+class TransactionAggregate:
+    def __init__(self, transactions=()):
+        self._counts = {}
+        self._total_amounts = {}
+        for transaction in transactions:
+            self.add(transaction)
+
+    def get_keys(self, transaction):
+        if isinstance(transaction, GoldTransaction):
+            transaction_type = TransactionType.GOLD
+            subtype = transaction._gold_type
+        else:
+            transaction_type = TransactionType.CURRENCY
+            subtype = transaction._currency_type
+        period = (transaction._year, transaction._month)
+
+        return [
+            (None, None, None),
+            (None, transaction_type, None),
+            (None, transaction_type, subtype),
+            (period, None, None),
+            (period, transaction_type, None),
+            (period, transaction_type, subtype)
+        ]
+
+    def add(self, transaction):
+        for key in self.get_keys(transaction):
+            self._counts[key] = self._counts.get(key, 0) + 1
+            self._total_amounts[key] = \
+                self._total_amounts.get(key, 0) + transaction._total_amount
+
+    def remove(self, transaction):
+        for key in self.get_keys(transaction):
+            count = self._counts.get(key, 0) - 1
+            if count <= 0:
+                # Dropping empty keys keeps rounding residue from piling up
+                # in totals that should read zero.
+                self._counts.pop(key, None)
+                self._total_amounts.pop(key, None)
+            else:
+                self._counts[key] = count
+                self._total_amounts[key] -= transaction._total_amount
+
+    def clear(self):
+        self._counts = {}
+        self._total_amounts = {}
+
+    def get_count(self, transaction_type=None, subtype=None, period=None):
+        return self._counts.get((period, transaction_type, subtype), 0)
+
+    def get_total_amount(self, transaction_type=None, subtype=None,
+                         period=None):
+        return self._total_amounts.get((period, transaction_type, subtype), 0)
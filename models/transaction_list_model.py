@@ -1,30 +1,120 @@
-from models.gold_transaction_model import GoldTransaction
-from models.currency_transaction_model import CurrencyTransaction
+import calendar
+import datetime
+
+from models.ngram_index_model import NGramIndex
+from models.period_totals_model import PeriodTotals
+from models.query_cache_model import QueryCache
+from models.query_result_model import QueryResult
+from models.transaction_aggregate_model import TransactionAggregate
+from models.transaction_ordering_model import TransactionOrdering
+from models.transaction_query_model import TransactionQuery
+from models.transaction_store_model import TransactionStore
 
 
 class TransactionList:
     def __init__(self):
-        self._transactions = []
-        self._total_gold_transactions = 0
-        self._total_currency_transactions = 0
-        self._total_gold_amount = 0.0
-        self._total_currency_amount = 0.0
+        self._store = TransactionStore()
+        self._aggregate = TransactionAggregate()
+        self._id_index = NGramIndex()
+        self._query_cache = QueryCache()
+        self._query_backend = None
 
     def add_transaction(self, transaction):
-        self._transactions.append(transaction)
-        if isinstance(transaction, GoldTransaction):
-            self._total_gold_transactions += 1
-            self._total_gold_amount += transaction._total_amount
-        elif isinstance(transaction, CurrencyTransaction):
-            self._total_currency_transactions += 1
-            self._total_currency_amount += transaction._total_amount
+        self._store.append(transaction)
+        self._aggregate.add(transaction)
+        self._id_index.add(transaction)
 
     def remove_transaction(self, transaction):
-        if transaction in self._transactions:
-            self._transactions.remove(transaction)
+        if self._store.remove(transaction):
+            self._aggregate.remove(transaction)
+            self._id_index.remove(transaction)
+
+    def update_transaction(self, transaction):
+        current = self._store.get(transaction._id)
+        if current is None:
+            self.add_transaction(transaction)
+            return
+
+        self._store.replace(current, transaction)
+        self._aggregate.remove(current)
+        self._aggregate.add(transaction)
+        self._id_index.replace(current, transaction)
+
+    def get(self, id):
+        return self._store.get(id)
+
+    def contains(self, id):
+        return self._store.contains(id)
 
     def get_transactions(self):
-        return self._transactions
+        return self._store.get_transactions()
+
+    def get_store(self):
+        return self._store
+
+    def get_aggregate(self):
+        return self._aggregate
+
+    def get_transactions_between(self, start_date=None, end_date=None):
+        start = None if start_date is None else start_date.toordinal()
+        end = None if end_date is None else end_date.toordinal()
+        return self._store.get_rows(self._store.find_by_date_range(start, end))
+
+    def find(self, query):
+        return self.run_query(query).get_transactions()
+
+    def run_query(self, query):
+        # The store version moves on every change, so a cached result is
+        # never served for data it was not computed from.
+        key = (query.get_key(), self._store.get_version())
+        result = self._query_cache.get(key)
+        if result is None:
+            if self._query_backend is None:
+                transactions = self._store.get_rows(
+                    query.get_positions(self._store, self._id_index))
+            else:
+                transactions = [
+                    self._store.get(id)
+                    for id in self._query_backend.find_ids(query)]
+            result = QueryResult(transactions)
+            self._query_cache.put(key, result)
+        return result
+
+    def set_query_backend(self, backend):
+        self._query_backend = backend
+        self._query_cache.clear()
+
+    def get_ordering(self, query):
+        if self._query_backend is None:
+            return TransactionOrdering(self.find(query), self._store)
+        return self._query_backend.get_ordering(query, self)
+
+    def get_amount_histogram(self, edges, query=None):
+        if self._query_backend is not None:
+            return self._query_backend.get_amount_histogram(
+                edges, query or TransactionQuery())
+        if query is None:
+            return self._store.get_amount_histogram(edges)
+        return self._store.get_amount_histogram(
+            edges, query.get_positions(self._store, self._id_index))
+
+    def get_period_totals(self, periods, start_date=None, end_date=None):
+        if start_date is None:
+            start_date = periods[0][0]
+        if end_date is None:
+            end_date = periods[-1][1]
+        positions = self._store.find_by_date_range(start_date.toordinal(),
+                                                   end_date.toordinal())
+        return PeriodTotals(periods, self._store, positions)
+
+    def get_transactions_by_month_year(self, month, year):
+        last_day = calendar.monthrange(year, month)[1]
+        return self.find(TransactionQuery(
+            start_date=datetime.date(year, month, 1),
+            end_date=datetime.date(year, month, last_day)))
 
     def clear(self):
-        self._transactions = []
+        self._store.clear()
+        self._aggregate.clear()
+        self._id_index.clear()
+        self._query_cache.clear()
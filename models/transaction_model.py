@@ -2,6 +2,8 @@ from models.abstract_transaction_model import AbstractTransaction
 
 
 class Transaction(AbstractTransaction):
+    __slots__ = ("_isdeleted",)
+
     def __init__(self, id, day, month, year, *args, isdeleted=False):
         super().__init__(id, day, month, year, *args)
         self._isdeleted = isdeleted
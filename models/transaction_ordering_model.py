@@ -0,0 +1,76 @@
+import numpy as np
+
+
+class TransactionOrdering:
+    def __init__(self, transactions, store):
+        self._transactions = transactions
+        self._store = store
+        self._version = None
+        self._orders = {}
+
+    def __len__(self):
+        return len(self._transactions)
+
+    def get_sort_keys(self, sort_key):
+        transactions = self._transactions
+        if sort_key == "date":
+            return np.fromiter(
+                (transaction._year * 10000 + transaction._month * 100 +
+                 transaction._day for transaction in transactions),
+                dtype=np.int64, count=len(transactions))
+        if sort_key == "total_amount":
+            return np.fromiter(
+                (transaction._total_amount for transaction in transactions),
+                dtype=np.float64, count=len(transactions))
+        raise ValueError(f"Unsupported sort key: {sort_key}")
+
+    def get_order(self, sort_key, descending):
+        version = self._store.get_version()
+        if version != self._version:
+            self._orders = {}
+            self._version = version
+
+        if (sort_key, descending) not in self._orders:
+            keys = self.get_sort_keys(sort_key)
+            if descending:
+                keys = -keys
+            # Ties keep list order either way, as sorted(reverse=True) does.
+            order = np.argsort(keys, kind="stable")
+            self._orders[(sort_key, descending)] = (keys[order], order)
+
+        return self._orders[(sort_key, descending)]
+
+    def locate(self, sorted_keys, order, cursor, side):
+        key, position = cursor
+        low = np.searchsorted(sorted_keys, key, side="left")
+        high = np.searchsorted(sorted_keys, key, side="right")
+        return low + np.searchsorted(order[low:high], position, side=side)
+
+    def get_page_after(self, sort_key, descending, cursor, limit):
+        sorted_keys, order = self.get_order(sort_key, descending)
+        start = 0
+        if cursor is not None:
+            start = self.locate(sorted_keys, order, cursor, "right")
+        return self.get_page(sorted_keys, order, start, start + limit)
+
+    def get_page_before(self, sort_key, descending, cursor, limit):
+        sorted_keys, order = self.get_order(sort_key, descending)
+        end = len(order)
+        if cursor is not None:
+            end = self.locate(sorted_keys, order, cursor, "left")
+        return self.get_page(sorted_keys, order, max(end - limit, 0), end)
+
+    def get_page_at(self, sort_key, descending, start, limit):
+        sorted_keys, order = self.get_order(sort_key, descending)
+        return self.get_page(sorted_keys, order, start, start + limit)
+
+    def get_page(self, sorted_keys, order, start, end):
+        end = min(end, len(order))
+        transactions = [self._transactions[position]
+                        for position in order[start:end]]
+        if start >= end:
+            return transactions, (None, None)
+
+        first_cursor = (sorted_keys[start], order[start])
+        last_cursor = (sorted_keys[end - 1], order[end - 1])
+        return transactions, (first_cursor, last_cursor)
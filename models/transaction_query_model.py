@@ -0,0 +1,114 @@
+import numpy as np
+
+from enums.transaction_type_enum import TransactionType
+from enums.gold_type_enum import GoldType
+from enums.currency_type_enum import CurrencyType
+
+
+class TransactionQuery:
+    SUBTYPE_TYPES = {
+        GoldType: TransactionType.GOLD,
+        CurrencyType: TransactionType.CURRENCY
+    }
+
+    # Dates are inclusive on both ends; amounts include min_amount and
+    # exclude max_amount, as the amount ranges of the filter window do.
+    def __init__(self, start_date=None, end_date=None, transaction_type=None,
+                 subtype=None, min_amount=None, max_amount=None,
+                 id_pattern=None, deleted=None):
+        self._start_date = start_date
+        self._end_date = end_date
+        self._transaction_type = transaction_type
+        self._subtype = subtype
+        self._min_amount = min_amount
+        self._max_amount = max_amount
+        self._id_pattern = id_pattern
+        self._deleted = deleted
+
+    def get_date_range(self):
+        start = None
+        end = None
+        if self._start_date is not None:
+            start = self._start_date.toordinal()
+        if self._end_date is not None:
+            end = self._end_date.toordinal()
+        return start, end
+
+    def get_key(self):
+        # Queries that select the same rows share a key however they were
+        # spelled, so they share a cache entry too.
+        start, end = self.get_date_range()
+        transaction_type = self._transaction_type
+        if self._subtype is not None:
+            transaction_type = self.SUBTYPE_TYPES[type(self._subtype)]
+        min_amount = None
+        max_amount = None
+        if self._min_amount is not None:
+            min_amount = float(self._min_amount)
+        if self._max_amount is not None:
+            max_amount = float(self._max_amount)
+        return (start, end, transaction_type, self._subtype, min_amount,
+                max_amount, self._id_pattern, self._deleted)
+
+    def get_candidates(self, store, id_index):
+        # Start from whichever index leaves fewer rows to check.
+        start, end = self.get_date_range()
+        count = store.count_by_date_range(start, end)
+        use_amounts = False
+        if self._min_amount is not None or self._max_amount is not None:
+            amount_count = store.count_by_amount_range(self._min_amount,
+                                                       self._max_amount)
+            if amount_count < count:
+                count = amount_count
+                use_amounts = True
+
+        if self._id_pattern is not None and \
+                id_index.estimate(self._id_pattern) < count:
+            return store.get_positions(id_index.search(self._id_pattern))
+        if use_amounts:
+            return store.find_by_amount_range(self._min_amount,
+                                              self._max_amount)
+        return store.find_by_date_range(start, end)
+
+    def get_mask(self, store, positions):
+        mask = np.ones(len(positions), dtype=bool)
+
+        start, end = self.get_date_range()
+        if start is not None or end is not None:
+            dates = store.get_column("date")[positions]
+            if start is not None:
+                mask &= dates >= start
+            if end is not None:
+                mask &= dates <= end
+
+        transaction_type = self._transaction_type
+        if self._subtype is not None:
+            transaction_type = self.SUBTYPE_TYPES[type(self._subtype)]
+            mask &= store.get_column("subtype")[positions] == \
+                self._subtype.value
+        if transaction_type is not None:
+            mask &= store.get_column("type")[positions] == \
+                transaction_type.value
+
+        if self._min_amount is not None or self._max_amount is not None:
+            amounts = store.get_column("total_amount")[positions]
+            if self._min_amount is not None:
+                mask &= amounts >= self._min_amount
+            if self._max_amount is not None:
+                mask &= amounts < self._max_amount
+
+        if self._deleted is not None:
+            mask &= store.get_column("deleted")[positions] == self._deleted
+
+        if self._id_pattern is not None:
+            ids = store.get_column("id")[positions]
+            mask &= np.fromiter((self._id_pattern in id for id in ids),
+                                dtype=bool, count=len(ids))
+
+        return mask
+
+    def get_positions(self, store, id_index):
+        # Rows come back in store order whichever index picked them, so the
+        # same query always lists its results the same way.
+        positions = self.get_candidates(store, id_index)
+        return np.sort(positions[self.get_mask(store, positions)])
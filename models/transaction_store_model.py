@@ -0,0 +1,231 @@
+import datetime
+from itertools import compress
+import numpy as np
+
+from enums.transaction_type_enum import TransactionType
+from models.gold_transaction_model import GoldTransaction
+
+
+class TransactionStore:
+    INITIAL_CAPACITY = 1024
+
+    COLUMN_TYPES = {
+        "id": object,
+        "date": np.int64,
+        "type": np.int8,
+        "subtype": np.int8,
+        "total_amount": np.float64,
+        "deleted": np.bool_
+    }
+
+    def __init__(self):
+        self._size = 0
+        self._transactions = []
+        self._positions = {}
+        self._removed = []
+        self._version = 0
+        self._sorted_indexes = {}
+        self._columns = {
+            name: np.empty(self.INITIAL_CAPACITY, dtype=dtype)
+            for name, dtype in self.COLUMN_TYPES.items()
+        }
+
+    def __len__(self):
+        return self._size - len(self._removed)
+
+    def append(self, transaction):
+        if self._size == len(self._columns["id"]):
+            self.grow(2 * self._size)
+
+        self._transactions.append(transaction)
+        self._positions.setdefault(transaction._id, self._size)
+        self.write_row(self._size, transaction)
+        self._size += 1
+        self._version += 1
+
+    def get(self, id):
+        position = self._positions.get(id)
+        if position is None:
+            return None
+        return self._transactions[position]
+
+    def contains(self, id):
+        return id in self._positions
+
+    def remove(self, transaction):
+        position = self._positions.get(transaction._id)
+        if position is None or self._transactions[position] is not transaction:
+            # Only rows sharing an id with an earlier row miss the index.
+            self.compact()
+            try:
+                position = self._transactions.index(transaction)
+            except ValueError:
+                return False
+
+        self.remove_at(position)
+        return True
+
+    def replace(self, current, transaction):
+        position = self._positions.get(current._id)
+        if position is None or self._transactions[position] is not current:
+            self.compact()
+            position = self._transactions.index(current)
+
+        self._transactions[position] = transaction
+        self.write_row(position, transaction)
+        self._version += 1
+
+    def remove_at(self, position):
+        # Removed rows are only marked here and dropped together by the
+        # next read, so removal stays O(1) and the rows keep their order.
+        removed = self._transactions[position]
+        if self._positions.get(removed._id) == position:
+            del self._positions[removed._id]
+
+        self._removed.append(position)
+        self._version += 1
+
+    def compact(self):
+        if not self._removed:
+            return
+
+        keep = np.ones(self._size, dtype=bool)
+        keep[self._removed] = False
+        size = int(np.count_nonzero(keep))
+        for column in self._columns.values():
+            column[:size] = column[:self._size][keep]
+        self._columns["id"][size:self._size] = None
+
+        self._transactions[:] = compress(self._transactions, keep)
+        self._positions = {}
+        for position, transaction in enumerate(self._transactions):
+            self._positions.setdefault(transaction._id, position)
+
+        self._size = size
+        self._removed = []
+
+    def clear(self):
+        self._size = 0
+        self._transactions = []
+        self._positions = {}
+        self._removed = []
+        self._columns["id"][:] = None
+        self._version += 1
+
+    def grow(self, capacity):
+        for name, column in self._columns.items():
+            new_column = np.empty(capacity, dtype=column.dtype)
+            new_column[:self._size] = column[:self._size]
+            self._columns[name] = new_column
+
+    def write_row(self, position, transaction):
+        columns = self._columns
+        columns["id"][position] = transaction._id
+        columns["date"][position] = datetime.date(
+            transaction._year, transaction._month,
+            transaction._day).toordinal()
+        columns["total_amount"][position] = transaction._total_amount
+        columns["deleted"][position] = bool(transaction._isdeleted)
+
+        if isinstance(transaction, GoldTransaction):
+            columns["type"][position] = TransactionType.GOLD.value
+            columns["subtype"][position] = transaction._gold_type.value
+        else:
+            columns["type"][position] = TransactionType.CURRENCY.value
+            columns["subtype"][position] = transaction._currency_type.value
+
+    def get_version(self):
+        return self._version
+
+    def get_sorted_index(self, name):
+        self.compact()
+        # Sorted copies are rebuilt lazily, once per version that is queried.
+        index = self._sorted_indexes.get(name)
+        if index is None or index[0] != self._version:
+            values = self._columns[name][:self._size]
+            order = np.argsort(values, kind="stable")
+            index = (self._version, values[order], order)
+            self._sorted_indexes[name] = index
+        return index[1], index[2]
+
+    def get_index_bounds(self, name, start=None, end=None, end_side="right"):
+        sorted_values = self.get_sorted_index(name)[0]
+
+        low = 0
+        high = len(sorted_values)
+        if start is not None:
+            low = np.searchsorted(sorted_values, start, side="left")
+        if end is not None:
+            high = np.searchsorted(sorted_values, end, side=end_side)
+
+        return low, max(low, high)
+
+    def find_by_index(self, name, start=None, end=None, end_side="right"):
+        self.compact()
+        if start is None and end is None:
+            return np.arange(self._size)
+
+        order = self.get_sorted_index(name)[1]
+        low, high = self.get_index_bounds(name, start, end, end_side)
+        return np.sort(order[low:high])
+
+    def get_date_bounds(self, start=None, end=None):
+        return self.get_index_bounds("date", start, end)
+
+    def count_by_date_range(self, start=None, end=None):
+        low, high = self.get_date_bounds(start, end)
+        return high - low
+
+    def find_by_date_range(self, start=None, end=None):
+        return self.find_by_index("date", start, end)
+
+    # Amount ranges include their lower end and exclude their upper end.
+    def get_amount_bounds(self, min_amount=None, max_amount=None):
+        return self.get_index_bounds("total_amount", min_amount, max_amount,
+                                     end_side="left")
+
+    def count_by_amount_range(self, min_amount=None, max_amount=None):
+        low, high = self.get_amount_bounds(min_amount, max_amount)
+        return high - low
+
+    def find_by_amount_range(self, min_amount=None, max_amount=None):
+        return self.find_by_index("total_amount", min_amount, max_amount,
+                                  end_side="left")
+
+    def get_amount_histogram(self, edges, positions=None):
+        # One binary search per edge counts every bucket between them,
+        # from below the first edge to the last edge and above.
+        if positions is None:
+            sorted_amounts = self.get_sorted_index("total_amount")[0]
+        else:
+            sorted_amounts = np.sort(
+                self.get_column("total_amount")[positions])
+        below = np.searchsorted(sorted_amounts, edges, side="left")
+        return np.diff(np.concatenate(
+            ([0], below, [len(sorted_amounts)]))).tolist()
+
+    def get_positions(self, transactions):
+        self.compact()
+        positions = np.empty(len(transactions), dtype=np.int64)
+        for i, transaction in enumerate(transactions):
+            position = self._positions.get(transaction._id)
+            if position is None or \
+                    self._transactions[position] is not transaction:
+                position = self._transactions.index(transaction)
+            positions[i] = position
+        return np.sort(positions)
+
+    def get_column(self, name):
+        self.compact()
+        column = self._columns[name][:self._size]
+        column.flags.writeable = False
+        return column
+
+    def get_transactions(self):
+        self.compact()
+        return self._transactions
+
+    def get_rows(self, positions):
+        self.compact()
+        transactions = self._transactions
+        return [transactions[position] for position in positions]
@@ -0,0 +1,70 @@
+from abc import ABC, abstractmethod
+
+
+class AbstractStorage(ABC):
+    ID_PREFIXES = {"gold": "GLD", "currency": "CUR"}
+
+    TRANSACTION_COLUMNS = [
+        "id", "day", "month", "year", "unit_price", "quantity", "type",
+        "gold_type", "isdeleted", "exchange_rate_id", "currency_type",
+        "exchange_rate", "effective_day", "effective_month", "effective_year"
+    ]
+
+    # Spreadsheets store flags as booleans, numbers or "TRUE"/"FALSE" text.
+    BOOLEAN_VALUES = {
+        "true": True, "1": True, "1.0": True,
+        "false": False, "0": False, "0.0": False
+    }
+
+    @classmethod
+    def to_boolean(cls, series):
+        values = series.astype(str).str.strip().str.lower().map(
+            cls.BOOLEAN_VALUES)
+        valid = values.notna().to_numpy(dtype=bool)
+        return values.where(valid, False).to_numpy(dtype=bool), valid
+
+    @abstractmethod
+    def load(self):
+        pass
+
+    @abstractmethod
+    def get_exchange_rates(self):
+        pass
+
+    @abstractmethod
+    def has_transaction(self, id):
+        pass
+
+    @abstractmethod
+    def get_record(self, id):
+        pass
+
+    @abstractmethod
+    def generate_id(self, transaction_type):
+        pass
+
+    @abstractmethod
+    def add_transaction(self, new_data):
+        pass
+
+    @abstractmethod
+    def update_transaction(self, id, fields):
+        pass
+
+    @abstractmethod
+    def delete_transaction(self, id):
+        pass
+
+    def close(self):
+        pass
+
+    def get_query_backend(self):
+        # Storages that can answer TransactionQuery on their own indexes
+        # return themselves; the rest are queried in memory.
+        return None
+
+    def get_exchange_rate(self, currency_type):
+        for exchange_rate in self.get_exchange_rates():
+            if exchange_rate["currency_type"] == currency_type:
+                return exchange_rate
+        return None
@@ -0,0 +1,165 @@
+import numpy as np
+import pandas as pd
+
+from enums.gold_type_enum import GoldType
+from enums.currency_type_enum import CurrencyType
+from storage.abstract_storage import AbstractStorage
+
+
+class ValidationReport:
+    def __init__(self):
+        self._missing_columns = []
+        self._fields = []
+        self._rows = []
+
+    def add_missing_column(self, column):
+        self._missing_columns.append(column)
+
+    def add_invalid_rows(self, field, mask):
+        rows = np.flatnonzero(mask)
+        if rows.size:
+            self._fields.append(field)
+            self._rows.append(rows)
+
+    def is_valid(self):
+        return not self._missing_columns and not self._rows
+
+    def get_errors(self):
+        if not self._rows:
+            return []
+
+        rows = np.concatenate(self._rows)
+        field_codes = np.concatenate([
+            np.full(len(field_rows), code)
+            for code, field_rows in enumerate(self._rows)
+        ])
+        order = np.lexsort((field_codes, rows))
+
+        return [(int(rows[i]) + 1, self._fields[field_codes[i]])
+                for i in order]
+
+    def format_summary(self, max_rows=20):
+        lines = [f"Missing column '{column}'"
+                 for column in self._missing_columns]
+
+        fields_by_row = {}
+        for row, field in self.get_errors():
+            fields_by_row.setdefault(row, []).append(f"'{field}'")
+
+        if fields_by_row:
+            lines.append(f"Found {len(fields_by_row)} invalid rows:")
+        for row, fields in list(fields_by_row.items())[:max_rows]:
+            lines.append(f"Row {row}: {', '.join(fields)}")
+        if len(fields_by_row) > max_rows:
+            lines.append(f"... and {len(fields_by_row) - max_rows} more rows")
+
+        return "\n".join(lines)
+
+
+class DataValidator:
+    REQUIRED_COLUMNS = AbstractStorage.TRANSACTION_COLUMNS
+
+    # Any text with at least one visible character is accepted as an id.
+    ID_PATTERN = r"(?s).*\S.*"
+
+    DAYS_IN_MONTH = np.array([31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31])
+
+    def validate(self, df_transactions):
+        report = ValidationReport()
+
+        for column in self.REQUIRED_COLUMNS:
+            if column not in df_transactions.columns:
+                report.add_missing_column(column)
+        if not report.is_valid():
+            return report
+
+        report.add_invalid_rows(
+            "id", ~self.check_ids(df_transactions["id"]))
+
+        self.check_date(report, df_transactions, "day", "month", "year",
+                        "date", np.ones(len(df_transactions), dtype=bool))
+
+        _, isdeleted_valid = AbstractStorage.to_boolean(
+            df_transactions["isdeleted"])
+        report.add_invalid_rows("isdeleted", ~isdeleted_valid)
+
+        types = df_transactions["type"].to_numpy(dtype=object)
+        is_gold = types == "gold"
+        is_currency = types == "currency"
+        report.add_invalid_rows("type", ~(is_gold | is_currency))
+
+        _, unit_price_valid = self.to_number(df_transactions["unit_price"])
+        _, quantity_valid = self.to_number(df_transactions["quantity"])
+        report.add_invalid_rows("unit_price", is_gold & ~unit_price_valid)
+        report.add_invalid_rows(
+            "quantity", (is_gold | is_currency) & ~quantity_valid)
+
+        gold_type, gold_type_valid = self.to_integer(
+            df_transactions["gold_type"])
+        gold_type_valid &= np.isin(gold_type,
+                                   [gold.value for gold in GoldType])
+        report.add_invalid_rows("gold_type", is_gold & ~gold_type_valid)
+
+        currency_type, currency_type_valid = self.to_integer(
+            df_transactions["currency_type"])
+        currency_type_valid &= np.isin(
+            currency_type, [currency.value for currency in CurrencyType])
+        report.add_invalid_rows("currency_type",
+                                is_currency & ~currency_type_valid)
+
+        _, exchange_rate_id_valid = self.to_integer(
+            df_transactions["exchange_rate_id"])
+        report.add_invalid_rows("exchange_rate_id",
+                                is_currency & ~exchange_rate_id_valid)
+
+        _, exchange_rate_valid = self.to_number(
+            df_transactions["exchange_rate"])
+        report.add_invalid_rows("exchange_rate",
+                                is_currency & ~exchange_rate_valid)
+
+        self.check_date(report, df_transactions, "effective_day",
+                        "effective_month", "effective_year",
+                        "effective_date", is_currency)
+
+        return report
+
+    def check_date(self, report, df, day_column, month_column, year_column,
+                   date_field, rows):
+        day, day_valid = self.to_integer(df[day_column])
+        month, month_valid = self.to_integer(df[month_column])
+        year, year_valid = self.to_integer(df[year_column])
+
+        day_valid &= (day >= 1) & (day <= 31)
+        month_valid &= (month >= 1) & (month <= 12)
+        year_valid &= (year >= 1) & (year <= 9999)
+
+        report.add_invalid_rows(day_column, rows & ~day_valid)
+        report.add_invalid_rows(month_column, rows & ~month_valid)
+        report.add_invalid_rows(year_column, rows & ~year_valid)
+
+        checked = rows & day_valid & month_valid & year_valid
+        month_index = np.where(month_valid, month, 1) - 1
+        is_leap_year = (year % 4 == 0) & ((year % 100 != 0) |
+                                          (year % 400 == 0))
+        days_in_month = self.DAYS_IN_MONTH[month_index] + \
+            (is_leap_year & (month == 2))
+        report.add_invalid_rows(date_field,
+                                checked & (day > days_in_month))
+
+    def check_ids(self, ids):
+        try:
+            return ids.str.fullmatch(self.ID_PATTERN, na=False).to_numpy(
+                dtype=bool)
+        except AttributeError:
+            # The str accessor rejects columns holding no text at all.
+            return np.zeros(len(ids), dtype=bool)
+
+    def to_number(self, series):
+        values = pd.to_numeric(series, errors="coerce").to_numpy(
+            dtype=np.float64)
+        return values, np.isfinite(values)
+
+    def to_integer(self, series):
+        values, valid = self.to_number(series)
+        valid &= values == np.floor(values)
+        return np.where(valid, values, 0).astype(np.int64), valid
@@ -0,0 +1,147 @@
+import os
+import pandas as pd
+
+from storage.abstract_storage import AbstractStorage
+from storage.transaction_journal import TransactionJournal
+from storage.transaction_loader import TransactionLoader
+
+
+class ExcelStorage(AbstractStorage):
+    def __init__(self, path, checkpoint_threshold=500):
+        self._path = path
+        self._checkpoint_threshold = checkpoint_threshold
+        self._loader = TransactionLoader(path)
+        self._journal = TransactionJournal(
+            os.path.splitext(path)[0] + ".journal")
+
+        self._df_transactions = pd.DataFrame()
+        self._df_exchange_rates = pd.DataFrame()
+        self._exchange_rates = []
+        self._positions = {}
+        self._added = {}
+        self._changes = {}
+        self._type_counts = {}
+
+    def load(self):
+        df_transactions, df_exchange_rates = self._loader.read_workbook()
+        self._df_exchange_rates = df_exchange_rates
+        self._exchange_rates = df_exchange_rates.to_dict("records")
+        self.reset(df_transactions)
+
+        for operation, id, fields in self._journal.read_entries():
+            self.apply_entry(operation, id, fields)
+
+        return self.get_transactions_frame()
+
+    def reset(self, df_transactions):
+        self._df_transactions = df_transactions
+        self._added = {}
+        self._changes = {}
+
+        if "id" not in df_transactions.columns:
+            self._positions = {}
+            self._type_counts = {}
+            return
+
+        ids = df_transactions["id"].tolist()
+        self._positions = dict(zip(reversed(ids),
+                                   range(len(ids) - 1, -1, -1)))
+        self._type_counts = df_transactions["type"].value_counts().to_dict()
+
+    def get_transactions_frame(self):
+        df_transactions = self._df_transactions
+
+        if self._changes:
+            df_transactions = df_transactions.copy()
+            for id, fields in self._changes.items():
+                position = self._positions[id]
+                for column, value in fields.items():
+                    if df_transactions[column].dtype != object:
+                        df_transactions[column] = \
+                            df_transactions[column].astype(object)
+                    df_transactions.iat[
+                        position, df_transactions.columns.get_loc(column)
+                    ] = value
+
+        if self._added:
+            df_transactions = pd.concat(
+                [df_transactions, pd.DataFrame(list(self._added.values()))],
+                ignore_index=True)
+
+        return df_transactions
+
+    def get_exchange_rates(self):
+        return self._exchange_rates
+
+    def has_transaction(self, id):
+        return id in self._positions or id in self._added
+
+    def get_record(self, id):
+        if id in self._added:
+            return dict(self._added[id])
+
+        position = self._positions.get(id)
+        if position is None:
+            return None
+
+        record = self._df_transactions.iloc[position].to_dict()
+        record.update(self._changes.get(id, {}))
+        return record
+
+    def generate_id(self, transaction_type):
+        prefix = self.ID_PREFIXES[transaction_type]
+        count = self._type_counts.get(transaction_type, 0)
+        new_id = f"{prefix}{count + 1:03}"
+        while self.has_transaction(new_id):
+            count += 1
+            new_id = f"{prefix}{count + 1:03}"
+        return new_id
+
+    def add_transaction(self, new_data):
+        self.write_entry("add", new_data["id"], new_data)
+
+    def update_transaction(self, id, fields):
+        if not self.has_transaction(id):
+            raise KeyError(id)
+        self.write_entry("update", id, fields)
+
+    def delete_transaction(self, id):
+        if not self.has_transaction(id):
+            raise KeyError(id)
+        self.write_entry("delete", id, {"isdeleted": True})
+
+    def write_entry(self, operation, id, fields):
+        self._journal.append(operation, id, fields)
+        self.apply_entry(operation, id, fields)
+
+        if self._journal.get_entry_count() >= self._checkpoint_threshold:
+            self.checkpoint()
+
+    def apply_entry(self, operation, id, fields):
+        if id in self._added:
+            self._added[id].update(fields)
+        elif id in self._positions:
+            # Replaying an add that already reached the workbook before the
+            # journal was truncated simply rewrites the same values.
+            self._changes.setdefault(id, {}).update(fields)
+        elif operation == "add":
+            self._added[id] = dict(fields)
+            transaction_type = fields.get("type")
+            self._type_counts[transaction_type] = \
+                self._type_counts.get(transaction_type, 0) + 1
+
+    def checkpoint(self):
+        if not self._added and not self._changes:
+            self._journal.truncate()
+            return
+
+        df_transactions = self.get_transactions_frame()
+        with pd.ExcelWriter(self._path, engine="openpyxl", mode="a",
+                            if_sheet_exists="replace") as writer:
+            df_transactions.to_excel(
+                writer, sheet_name="transactions", index=False)
+            self._df_exchange_rates.to_excel(
+                writer, sheet_name="exchange_rates", index=False)
+
+        self.reset(df_transactions)
+        self._journal.truncate()
@@ -0,0 +1,352 @@
+import os
+import sqlite3
+import datetime
+import numpy as np
+import pandas as pd
+
+from enums.currency_type_enum import CurrencyType
+from enums.gold_type_enum import GoldType
+from enums.transaction_type_enum import TransactionType
+from storage.abstract_storage import AbstractStorage
+from storage.sqlite_transaction_ordering import SqliteTransactionOrdering
+from storage.transaction_loader import TransactionLoader
+
+
+class SqliteStorage(AbstractStorage):
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS transactions (
+            id TEXT PRIMARY KEY,
+            day INTEGER,
+            month INTEGER,
+            year INTEGER,
+            unit_price REAL,
+            quantity REAL,
+            type TEXT,
+            gold_type INTEGER,
+            isdeleted INTEGER NOT NULL DEFAULT 0,
+            exchange_rate_id INTEGER,
+            currency_type INTEGER,
+            exchange_rate REAL,
+            effective_day INTEGER,
+            effective_month INTEGER,
+            effective_year INTEGER,
+            total_amount REAL NOT NULL DEFAULT 0
+        );
+        CREATE TABLE IF NOT EXISTS exchange_rates (
+            id INTEGER PRIMARY KEY,
+            currency_type INTEGER,
+            rate REAL,
+            effective_day INTEGER,
+            effective_month INTEGER,
+            effective_year INTEGER
+        );
+    """
+
+    INDEXES = """
+        CREATE INDEX IF NOT EXISTS idx_transactions_date
+            ON transactions (year, month, day);
+        CREATE INDEX IF NOT EXISTS idx_transactions_type
+            ON transactions (type);
+        CREATE INDEX IF NOT EXISTS idx_transactions_total_amount
+            ON transactions (total_amount);
+    """
+
+    TYPE_NAMES = {
+        TransactionType.GOLD: "gold",
+        TransactionType.CURRENCY: "currency"
+    }
+
+    SUBTYPE_COLUMNS = {
+        GoldType: "gold_type",
+        CurrencyType: "currency_type"
+    }
+
+    SORT_COLUMNS = {
+        "date": ["year", "month", "day"],
+        "total_amount": ["total_amount"]
+    }
+
+    EXCHANGE_RATE_COLUMNS = [
+        "id", "currency_type", "rate", "effective_day", "effective_month",
+        "effective_year"
+    ]
+
+    def __init__(self, path, seed_path=None):
+        self._path = path
+        self._seed_path = seed_path
+        self._connection = None
+        self._exchange_rates = []
+
+    def connect(self):
+        if self._connection is None:
+            self._connection = sqlite3.connect(self._path)
+            self._connection.executescript(self.SCHEMA)
+            self.add_total_amount_column(self._connection)
+            self._connection.executescript(self.INDEXES)
+        return self._connection
+
+    def add_total_amount_column(self, connection):
+        # Databases created before total_amount was stored get the column
+        # and have it filled in once.
+        columns = [row[1] for row in connection.execute(
+            "PRAGMA table_info(transactions)")]
+        if "total_amount" in columns:
+            return
+
+        df_transactions = pd.read_sql_query(
+            f"SELECT rowid, {', '.join(self.TRANSACTION_COLUMNS)} "
+            "FROM transactions", connection)
+        with connection:
+            connection.execute(
+                "ALTER TABLE transactions "
+                "ADD COLUMN total_amount REAL NOT NULL DEFAULT 0")
+            connection.executemany(
+                "UPDATE transactions SET total_amount = ? WHERE rowid = ?",
+                zip(self.calculate_total_amounts(df_transactions).tolist(),
+                    df_transactions["rowid"].tolist()))
+
+    def close(self):
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def load(self):
+        connection = self.connect()
+
+        is_empty = connection.execute(
+            "SELECT NOT EXISTS (SELECT 1 FROM transactions)").fetchone()[0]
+        if is_empty and self._seed_path is not None \
+                and os.path.exists(self._seed_path):
+            self.import_workbook(self._seed_path)
+
+        self._exchange_rates = pd.read_sql_query(
+            "SELECT * FROM exchange_rates ORDER BY rowid",
+            connection).to_dict("records")
+
+        return pd.read_sql_query(
+            f"SELECT {', '.join(self.TRANSACTION_COLUMNS)} "
+            "FROM transactions ORDER BY rowid", connection)
+
+    def import_workbook(self, path):
+        df_transactions, df_exchange_rates = \
+            TransactionLoader(path).read_workbook()
+
+        df_transactions = df_transactions.reindex(
+            columns=self.TRANSACTION_COLUMNS)
+        # Unrecognised flags are stored as they are so validation reports
+        # them instead of them turning into deleted rows.
+        isdeleted, isdeleted_valid = self.to_boolean(
+            df_transactions["isdeleted"])
+        df_transactions["isdeleted"] = df_transactions["isdeleted"].where(
+            ~isdeleted_valid, isdeleted.astype(int))
+        df_transactions["total_amount"] = \
+            self.calculate_total_amounts(df_transactions)
+        df_exchange_rates = df_exchange_rates.reindex(
+            columns=self.EXCHANGE_RATE_COLUMNS)
+
+        with self.connect() as connection:
+            self.insert_rows(connection, "transactions", df_transactions)
+            self.insert_rows(connection, "exchange_rates", df_exchange_rates)
+
+    def insert_rows(self, connection, table, df):
+        columns = list(df.columns)
+        rows = df.astype(object).where(df.notna(), None).itertuples(
+            index=False, name=None)
+        connection.executemany(
+            f"INSERT OR IGNORE INTO {table} ({', '.join(columns)}) "
+            f"VALUES ({', '.join('?' * len(columns))})", rows)
+
+    def get_exchange_rates(self):
+        return self._exchange_rates
+
+    def has_transaction(self, id):
+        return self.connect().execute(
+            "SELECT 1 FROM transactions WHERE id = ?", (id,)
+        ).fetchone() is not None
+
+    def generate_id(self, transaction_type):
+        prefix = self.ID_PREFIXES[transaction_type]
+        count = self.connect().execute(
+            "SELECT COUNT(*) FROM transactions WHERE type = ?",
+            (transaction_type,)).fetchone()[0]
+        new_id = f"{prefix}{count + 1:03}"
+        while self.has_transaction(new_id):
+            count += 1
+            new_id = f"{prefix}{count + 1:03}"
+        return new_id
+
+    def add_transaction(self, new_data):
+        record = {column: new_data.get(column)
+                  for column in self.TRANSACTION_COLUMNS}
+        record = self.prepare_record(record)
+
+        with self.connect() as connection:
+            connection.execute(
+                f"INSERT INTO transactions ({', '.join(record)}) "
+                f"VALUES ({', '.join('?' * len(record))})",
+                list(record.values()))
+
+    def get_record(self, id):
+        row = self.connect().execute(
+            f"SELECT {', '.join(self.TRANSACTION_COLUMNS)} "
+            "FROM transactions WHERE id = ?", (id,)).fetchone()
+        if row is None:
+            return None
+        return dict(zip(self.TRANSACTION_COLUMNS, row))
+
+    def update_transaction(self, id, fields):
+        record = self.get_record(id)
+        if record is None:
+            raise KeyError(id)
+
+        record.update(fields)
+        record = self.prepare_record(record)
+
+        with self.connect() as connection:
+            connection.execute(
+                "UPDATE transactions SET "
+                f"{', '.join(f'{column} = ?' for column in record)} "
+                "WHERE id = ?", list(record.values()) + [id])
+
+    def delete_transaction(self, id):
+        with self.connect() as connection:
+            cursor = connection.execute(
+                "UPDATE transactions SET isdeleted = 1 WHERE id = ?", (id,))
+        if cursor.rowcount == 0:
+            raise KeyError(id)
+
+    def prepare_record(self, record):
+        record = {column: self.to_sql_value(value)
+                  for column, value in record.items()}
+        record["isdeleted"] = int(bool(record["isdeleted"]))
+        record["total_amount"] = float(
+            self.calculate_total_amounts(pd.DataFrame([record]))[0])
+        return record
+
+    def calculate_total_amounts(self, df_transactions):
+        # Mirrors calculate_total_amount of the transaction models, so the
+        # stored amounts match the ones shown.
+        types = df_transactions["type"].to_numpy(dtype=object)
+        unit_price = self.to_float(df_transactions["unit_price"])
+        quantity = self.to_float(df_transactions["quantity"])
+        currency_type = self.to_float(df_transactions["currency_type"])
+        exchange_rate = self.to_float(df_transactions["exchange_rate"])
+
+        currency_amount = np.where(
+            currency_type == CurrencyType.VND.value, quantity,
+            np.where(np.isin(currency_type, [CurrencyType.USD.value,
+                                             CurrencyType.EUR.value]),
+                     quantity * exchange_rate, 0.0))
+
+        return np.where(types == "gold", unit_price * quantity,
+                        np.where(types == "currency", currency_amount, 0.0))
+
+    def to_float(self, series):
+        return pd.to_numeric(series, errors="coerce").to_numpy(
+            dtype=np.float64)
+
+    def get_query_backend(self):
+        return self
+
+    def build_where(self, query):
+        (start, end, transaction_type, subtype, min_amount, max_amount,
+         id_pattern, deleted) = query.get_key()
+        # Deleted rows are never loaded, so they never match either.
+        clauses = ["isdeleted = 0"]
+        params = []
+
+        if start is not None:
+            start_date = datetime.date.fromordinal(start)
+            clauses.append("(year, month, day) >= (?, ?, ?)")
+            params.extend([start_date.year, start_date.month,
+                           start_date.day])
+        if end is not None:
+            end_date = datetime.date.fromordinal(end)
+            clauses.append("(year, month, day) <= (?, ?, ?)")
+            params.extend([end_date.year, end_date.month, end_date.day])
+        if transaction_type is not None:
+            clauses.append("type = ?")
+            params.append(self.TYPE_NAMES[transaction_type])
+        if subtype is not None:
+            clauses.append(f"{self.SUBTYPE_COLUMNS[type(subtype)]} = ?")
+            params.append(subtype.value)
+        if min_amount is not None:
+            clauses.append("total_amount >= ?")
+            params.append(min_amount)
+        if max_amount is not None:
+            clauses.append("total_amount < ?")
+            params.append(max_amount)
+        if deleted is not None:
+            clauses.append("isdeleted = ?")
+            params.append(int(deleted))
+        if id_pattern is not None:
+            clauses.append("instr(id, ?) > 0")
+            params.append(id_pattern)
+
+        return " AND ".join(clauses), params
+
+    def find_ids(self, query):
+        where, params = self.build_where(query)
+        rows = self.connect().execute(
+            f"SELECT id FROM transactions WHERE {where} ORDER BY rowid",
+            params).fetchall()
+        return [row[0] for row in rows]
+
+    def count(self, query):
+        where, params = self.build_where(query)
+        return self.connect().execute(
+            f"SELECT COUNT(*) FROM transactions WHERE {where}",
+            params).fetchone()[0]
+
+    def get_amount_histogram(self, edges, query):
+        # A row's bucket is the number of edges at or below its amount.
+        where, params = self.build_where(query)
+        bucket = " + ".join("(total_amount >= ?)" for _ in edges)
+        counts = [0] * (len(edges) + 1)
+        for index, count in self.connect().execute(
+                f"SELECT {bucket}, COUNT(*) FROM transactions "
+                f"WHERE {where} GROUP BY 1", list(edges) + params):
+            counts[index] = count
+        return counts
+
+    def get_ordering(self, query, transaction_list):
+        return SqliteTransactionOrdering(self, query, transaction_list)
+
+    def find_page(self, query, sort_key, descending, limit, cursor=None,
+                  before=False, offset=0):
+        # Rows are ordered by the sort key and then by rowid ascending, as
+        # the in-memory ordering keeps ties in list order. A cursor is the
+        # (key, rowid) of a row on screen, so a page turn seeks on the
+        # index instead of skipping rows.
+        where, params = self.build_where(query)
+        columns = self.SORT_COLUMNS[sort_key]
+        key = f"({', '.join(columns)})"
+
+        if cursor is not None:
+            values, rowid = cursor
+            placeholders = f"({', '.join('?' * len(columns))})"
+            key_operator = "<" if descending != before else ">"
+            rowid_operator = "<" if before else ">"
+            where += (f" AND ({key} {key_operator} {placeholders} OR "
+                      f"({key} = {placeholders} AND "
+                      f"rowid {rowid_operator} ?))")
+            params = params + list(values) + list(values) + [rowid]
+
+        key_direction = "DESC" if descending != before else "ASC"
+        rowid_direction = "DESC" if before else "ASC"
+        order = ", ".join(f"{column} {key_direction}" for column in columns)
+
+        rows = self.connect().execute(
+            f"SELECT id, {', '.join(columns)}, rowid FROM transactions "
+            f"WHERE {where} ORDER BY {order}, rowid {rowid_direction} "
+            "LIMIT ? OFFSET ?", params + [limit, offset]).fetchall()
+        if before:
+            rows.reverse()
+        return rows
+
+    def to_sql_value(self, value):
+        if isinstance(value, np.generic):
+            return value.item()
+        if isinstance(value, float) and np.isnan(value):
+            return None
+        return value
@@ -0,0 +1,33 @@
+class SqliteTransactionOrdering:
+    def __init__(self, storage, query, transaction_list):
+        self._storage = storage
+        self._query = query
+        self._transaction_list = transaction_list
+        self._count = None
+
+    def __len__(self):
+        if self._count is None:
+            self._count = self._storage.count(self._query)
+        return self._count
+
+    def get_page_after(self, sort_key, descending, cursor, limit):
+        return self.get_page(self._storage.find_page(
+            self._query, sort_key, descending, limit, cursor=cursor))
+
+    def get_page_before(self, sort_key, descending, cursor, limit):
+        return self.get_page(self._storage.find_page(
+            self._query, sort_key, descending, limit, cursor=cursor,
+            before=True))
+
+    def get_page_at(self, sort_key, descending, start, limit):
+        return self.get_page(self._storage.find_page(
+            self._query, sort_key, descending, limit, offset=start))
+
+    def get_page(self, rows):
+        transactions = [self._transaction_list.get(row[0]) for row in rows]
+        if not rows:
+            return transactions, (None, None)
+
+        first_cursor = (rows[0][1:-1], rows[0][-1])
+        last_cursor = (rows[-1][1:-1], rows[-1][-1])
+        return transactions, (first_cursor, last_cursor)
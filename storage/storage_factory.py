@@ -0,0 +1,20 @@
+import os
+
+from storage.excel_storage import ExcelStorage
+from storage.sqlite_storage import SqliteStorage
+
+
+class StorageFactory:
+    SQLITE_EXTENSIONS = [".db", ".sqlite", ".sqlite3"]
+
+    def create(self, path):
+        base_path, extension = os.path.splitext(path)
+        extension = extension.lower()
+
+        if extension == ".xlsx":
+            return ExcelStorage(path)
+        if extension in self.SQLITE_EXTENSIONS:
+            # An empty database is seeded from the workbook next to it.
+            return SqliteStorage(path, seed_path=base_path + ".xlsx")
+
+        raise ValueError(f"Unsupported data file: {path}")
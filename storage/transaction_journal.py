@@ -0,0 +1,64 @@
+import json
+import os
+
+import numpy as np
+
+
+class TransactionJournal:
+    def __init__(self, path):
+        self._path = path
+        self._entry_count = 0
+
+    def get_entry_count(self):
+        return self._entry_count
+
+    def read_entries(self):
+        entries = []
+
+        if not os.path.exists(self._path):
+            self._entry_count = 0
+            return entries
+
+        valid_size = 0
+        is_torn = False
+        with open(self._path, "rb") as journal_file:
+            for line in journal_file:
+                try:
+                    entry = json.loads(line) if line.strip() else None
+                except ValueError:
+                    is_torn = True
+                    break
+                valid_size += len(line)
+                if entry is not None:
+                    entries.append(
+                        (entry["operation"], entry["id"], entry["fields"]))
+
+        if is_torn:
+            # A record cut short by a crash can only be the last line
+            # written; drop it so new records start on a clean line.
+            with open(self._path, "r+b") as journal_file:
+                journal_file.truncate(valid_size)
+
+        self._entry_count = len(entries)
+        return entries
+
+    def append(self, operation, id, fields):
+        line = json.dumps({"operation": operation, "id": id,
+                           "fields": fields}, default=self.to_json_value)
+
+        with open(self._path, "a", encoding="utf-8") as journal_file:
+            journal_file.write(line + "\n")
+            journal_file.flush()
+            os.fsync(journal_file.fileno())
+
+        self._entry_count += 1
+
+    def truncate(self):
+        with open(self._path, "w", encoding="utf-8"):
+            pass
+        self._entry_count = 0
+
+    def to_json_value(self, value):
+        if isinstance(value, np.generic):
+            return value.item()
+        raise TypeError(f"Cannot write {type(value).__name__} to journal")
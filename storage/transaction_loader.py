@@ -0,0 +1,99 @@
+import pandas as pd
+
+from enums.gold_type_enum import GoldType
+from enums.currency_type_enum import CurrencyType
+from storage.abstract_storage import AbstractStorage
+from models.gold_transaction_model import GoldTransaction
+from models.exchange_rate_model import ExchangeRate
+from models.currency_transaction_model import CurrencyTransaction
+
+
+class TransactionLoader:
+    def __init__(self, path):
+        self._path = path
+
+    def read_workbook(self):
+        sheets = pd.read_excel(self._path,
+                               sheet_name=["transactions", "exchange_rates"])
+        return sheets["transactions"], sheets["exchange_rates"]
+
+    def build_transaction(self, record):
+        df_transactions = pd.DataFrame([record]).reindex(
+            columns=AbstractStorage.TRANSACTION_COLUMNS)
+        transactions = self.build_transactions(df_transactions)
+        return transactions[0] if transactions else None
+
+    def build_transactions(self, df_transactions):
+        transactions = []
+        exchange_rates = {}
+        isdeleted_values, _ = AbstractStorage.to_boolean(
+            df_transactions["isdeleted"])
+
+        rows = zip(
+            df_transactions["id"].tolist(),
+            df_transactions["day"].tolist(),
+            df_transactions["month"].tolist(),
+            df_transactions["year"].tolist(),
+            df_transactions["unit_price"].tolist(),
+            df_transactions["quantity"].tolist(),
+            df_transactions["type"].tolist(),
+            df_transactions["gold_type"].tolist(),
+            isdeleted_values.tolist(),
+            df_transactions["exchange_rate_id"].tolist(),
+            df_transactions["currency_type"].tolist(),
+            df_transactions["exchange_rate"].tolist(),
+            df_transactions["effective_day"].tolist(),
+            df_transactions["effective_month"].tolist(),
+            df_transactions["effective_year"].tolist()
+        )
+
+        for (id, day, month, year, unit_price, quantity, transaction_type,
+             gold_type, isdeleted, exchange_rate_id, currency_type, rate,
+             effective_day, effective_month, effective_year) in rows:
+            if isdeleted:
+                continue
+
+            if transaction_type == "gold":
+                transaction = GoldTransaction(
+                    id,
+                    int(day),
+                    int(month),
+                    int(year),
+                    unit_price,
+                    quantity,
+                    GoldType(int(gold_type)),
+                    isdeleted=isdeleted
+                )
+            elif transaction_type == "currency":
+                # Transactions booked against the same rate share a single
+                # ExchangeRate instead of each holding its own copy.
+                exchange_rate_key = (exchange_rate_id, currency_type, rate,
+                                     effective_day, effective_month,
+                                     effective_year)
+                exchange_rate = exchange_rates.get(exchange_rate_key)
+                if exchange_rate is None:
+                    exchange_rate = ExchangeRate(
+                        int(exchange_rate_id),
+                        CurrencyType(int(currency_type)),
+                        rate,
+                        int(effective_day),
+                        int(effective_month),
+                        int(effective_year)
+                    )
+                    exchange_rates[exchange_rate_key] = exchange_rate
+                transaction = CurrencyTransaction(
+                    id,
+                    int(day),
+                    int(month),
+                    int(year),
+                    quantity,
+                    CurrencyType(int(currency_type)),
+                    exchange_rate,
+                    isdeleted=isdeleted
+                )
+            else:
+                continue
+
+            transactions.append(transaction)
+
+        return transactions
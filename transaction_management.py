@@ -1,15 +1,19 @@
 from tkinter import messagebox
 import customtkinter
-import pandas as pd
+import os
 
-from enums.gold_type_enum import GoldType
-from enums.currency_type_enum import CurrencyType
-from models.gold_transaction_model import GoldTransaction
-from models.exchange_rate_model import ExchangeRate
-from models.currency_transaction_model import CurrencyTransaction
 from models.transaction_list_model import TransactionList
+from storage.data_validator import DataValidator
+from storage.storage_factory import StorageFactory
+from storage.transaction_loader import TransactionLoader
 from widgets.header_frame import HeaderFrame
 from widgets.tab_filter import TabFilter
+from widgets.theme_engine import ThemeEngine
+
+# A .db/.sqlite path selects the SQLite backend, which is seeded from the
+# workbook with the same name on first run.
+DATA_PATH = os.environ.get("TRANSACTION_DATA_PATH",
+                           "./resources/data/data.xlsx")
 
 
 class TransactionApp(customtkinter.CTk):
@@ -25,8 +29,12 @@ class TransactionApp(customtkinter.CTk):
         self.minsize(1720, 960)
 
         self.current_theme = "Dark-Blue"
+        self.theme_engine = ThemeEngine(self, self.current_theme)
 
         self.transaction_list = TransactionList()
+        self.transaction_loader = TransactionLoader(DATA_PATH)
+        self.storage = StorageFactory().create(DATA_PATH)
+        self.data_validator = DataValidator()
         self.load_data_from_excel()
         self.create_widget()
 
@@ -37,15 +45,19 @@ class TransactionApp(customtkinter.CTk):
             master=self, initial_theme=self.current_theme)
         self.header_frame.grid(row=0, column=0, padx=10, pady=10, sticky="ew")
 
+        self.create_tab_filter()
+
+        self.grid_columnconfigure(0, weight=1)
+
+    def create_tab_filter(self):
         self.tab_filter = TabFilter(master=self)
         self.tab_filter.grid(row=1, column=0, padx=10, pady=(0, 10),
                              sticky="ew")
 
-        self.grid_columnconfigure(0, weight=1)
-
     def on_closing(self):
         if messagebox.askokcancel("Quit", "Do you want to quit?"):
             try:
+                self.storage.close()
                 self.quit()
                 self.destroy()
             except Exception as e:
@@ -53,68 +65,46 @@ class TransactionApp(customtkinter.CTk):
 
     def load_data_from_excel(self):
         try:
-            df_transactions = pd.read_excel("./resources/data/data.xlsx",
-                                            sheet_name="transactions")
-            df_exchange_rates = pd.read_excel("./resources/data/data.xlsx",
-                                              sheet_name="exchange_rates")
+            df_transactions = self.storage.load()
 
             if not self.check_data_validity(df_transactions):
                 return
 
-            for _, row in df_transactions.iterrows():
-                if row['isdeleted']:
-                    continue
-
-                if row['type'] == "gold":
-                    transaction = GoldTransaction(
-                        row['id'],
-                        row['day'],
-                        row['month'],
-                        row['year'],
-                        row['unit_price'],
-                        row['quantity'],
-                        GoldType(row['gold_type']),
-                        isdeleted=row['isdeleted']
-                    )
-                elif row['type'] == "currency":
-                    exchange_rate = ExchangeRate(
-                        row['exchange_rate_id'],
-                        CurrencyType(row['currency_type']),
-                        row['exchange_rate'],
-                        row['effective_day'],
-                        row['effective_month'],
-                        row['effective_year']
-                    )
-                    transaction = CurrencyTransaction(
-                        row['id'],
-                        row['day'],
-                        row['month'],
-                        row['year'],
-                        row['quantity'],
-                        CurrencyType(row['currency_type']),
-                        exchange_rate,
-                        isdeleted=row['isdeleted']
-                    )
-                else:
-                    continue
-
+            for transaction in self.transaction_loader.build_transactions(
+                    df_transactions):
                 self.transaction_list.add_transaction(transaction)
-
-            for _, row in df_exchange_rates.iterrows():
-                _ = ExchangeRate(
-                    row['id'],
-                    CurrencyType(row['currency_type']),
-                    row['rate'],
-                    row['effective_day'],
-                    row['effective_month'],
-                    row['effective_year']
-                )
+            # With a SQLite backend, queries and pages are read from its
+            # indexes; the loaded transactions back the rows shown.
+            self.transaction_list.set_query_backend(
+                self.storage.get_query_backend())
 
         except FileNotFoundError:
             messagebox.showerror("Error", "Data file not found.")
         except Exception as e:
             messagebox.showerror("Error", f"An error occurred: {e}")
 
+    def sync_transaction(self, id):
+        # The change is already saved, so a failure here only leaves the
+        # screen stale and is reported as such.
+        try:
+            record = self.storage.get_record(id)
+            transaction = None
+            if record is not None:
+                transaction = self.transaction_loader.build_transaction(
+                    record)
+
+            if transaction is not None:
+                self.transaction_list.update_transaction(transaction)
+            elif self.transaction_list.contains(id):
+                self.transaction_list.remove_transaction(
+                    self.transaction_list.get(id))
+
+            self.tab_filter.refresh()
+        except Exception as e:
+            messagebox.showerror(
+                "Error", "The change was saved, but an error occurred "
+                f"while refreshing the transaction list: {e}")
+
     def refresh_data_from_excel(self):
         messagebox.showinfo("Refreshing Data",
                             "Refreshing data. Please wait...")
@@ -129,101 +119,18 @@ class TransactionApp(customtkinter.CTk):
 
         self.create_widget()
 
-    def convert_to_int(self, value, field_name, row_index):
-        try:
-            return int(value)
-        except ValueError:
-            messagebox.showerror("Data Error", f"Invalid '{
-                field_name}' at row {row_index + 1}")
-            return None
-
-    def convert_to_float(self, value, field_name, row_index):
-        try:
-            return float(value)
-        except ValueError:
-            messagebox.showerror("Data Error", f"Invalid '{
-                field_name}' at row {row_index + 1}")
-            return None
-
     def check_data_validity(self, df):
-        for idx, row in df.iterrows():
-            if pd.isna(row['id']) or not isinstance(row['id'], str):
-                messagebox.showerror("Data Error", f"Invalid 'id' at row {
-                    idx + 1}")
-                return False
-
-            day = self.convert_to_int(row['day'], 'day', idx)
-            month = self.convert_to_int(row['month'], 'month', idx)
-            year = self.convert_to_int(row['year'], 'year', idx)
-            if day is None or month is None or year is None:
-                return False
-
-            if not (1 <= day <= 31):
-                messagebox.showerror(
-                    "Data Error", f"Invalid 'day' at row {idx + 1}")
-                return False
-            if not (1 <= month <= 12):
-                messagebox.showerror(
-                    "Data Error", f"Invalid 'month' at row {idx + 1}")
-                return False
-
-            if row['type'] == "gold":
-                unit_price = self.convert_to_float(
-                    row['unit_price'], 'unit_price', idx)
-                quantity = self.convert_to_float(row['quantity'], 'quantity',
-                                                 idx)
-                gold_type = self.convert_to_int(row['gold_type'], 'gold_type',
-                                                idx)
-                if unit_price is None or quantity is None or gold_type is None:
-                    return False
-            elif row['type'] == "currency":
-                quantity = self.convert_to_float(row['quantity'], 'quantity',
-                                                 idx)
-                currency_type = self.convert_to_int(
-                    row['currency_type'], 'currency_type', idx)
-                exchange_rate_id = self.convert_to_int(
-                    row['exchange_rate_id'], 'exchange_rate_id', idx)
-                exchange_rate = self.convert_to_float(
-                    row['exchange_rate'], 'exchange_rate', idx)
-                effective_day = self.convert_to_int(
-                    row['effective_day'], 'effective_day', idx)
-                effective_month = self.convert_to_int(
-                    row['effective_month'], 'effective_month', idx)
-                effective_year = self.convert_to_int(
-                    row['effective_year'], 'effective_year', idx)
-                if quantity is None or currency_type is None or \
-                        exchange_rate_id is None or exchange_rate is \
-                        None or effective_day is None or effective_month is \
-                        None or effective_year is None:
-                    return False
-                if not (1 <= effective_day <= 31):
-                    messagebox.showerror(
-                        "Data Error", f"Invalid 'effective_day' at row {
-                            idx + 1}")
-                    return False
-                if not (1 <= effective_month <= 12):
-                    messagebox.showerror(
-                        "Data Error", f"Invalid 'effective_month' at row {
-                            idx + 1}")
-                    return False
-            else:
-                messagebox.showerror(
-                    "Data Error", f"Invalid 'type' at row {idx + 1}")
-                return False
-        return True
+        report = self.data_validator.validate(df)
+        if report.is_valid():
+            return True
 
-    def update_theme(self, new_theme):
-        update_message = messagebox.showinfo(
-            "Updating Theme", "Updating theme. Please wait a moment...")
+        messagebox.showerror("Data Error", report.format_summary())
+        return False
 
+    def update_theme(self, new_theme):
+        # Recoloring in place keeps the open tabs, pages and selections.
         self.current_theme = new_theme
-        self.header_frame.destroy()
-        self.tab_filter.destroy()
-
-        self.create_widget()
-
-        if update_message:
-            self.focus()
+        self.theme_engine.apply_theme(new_theme)
 
 
 if __name__ == "__main__":
@@ -1,7 +1,6 @@
 from tkinter import ttk, messagebox
 import customtkinter
 import datetime
-import pandas as pd
 
 from enums.gold_type_enum import GoldType
 from enums.currency_type_enum import CurrencyType
@@ -19,21 +18,14 @@ class AddTransactionTabView(customtkinter.CTkTabview):
         self.set("GOLD")
         self.configure(corner_radius=5)
 
-        self.load_exchange_rates_from_excel()
+        self.app = self.master.master.master
+        self.storage = self.app.storage
+        self.load_exchange_rates()
 
         self.create_widgets()
 
-    def load_exchange_rates_from_excel(self):
-        try:
-            df_exchange_rates = pd.read_excel(
-                "./resources/data/data.xlsx", sheet_name="exchange_rates")
-            self.exchange_rates = df_exchange_rates.to_dict('records')
-        except FileNotFoundError:
-            messagebox.showerror("Error", "Data file not found.")
-            self.exchange_rates = []
-        except Exception as e:
-            messagebox.showerror("Error", f"An error occurred: {e}")
-            self.exchange_rates = []
+    def load_exchange_rates(self):
+        self.exchange_rates = self.storage.get_exchange_rates()
 
     def create_widgets(self):
         self.create_tab_add_gold_transaction(self.tab_add_gold_transaction)
@@ -286,9 +278,7 @@ class AddTransactionTabView(customtkinter.CTkTabview):
 
         try:
             new_data = {
-                "id": self.generate_gold_id(
-                    pd.read_excel("./resources/data/data.xlsx",
-                                  sheet_name="transactions")),
+                "id": self.storage.generate_id("gold"),
                 "day": day,
                 "month": month,
                 "year": year,
@@ -298,26 +288,18 @@ class AddTransactionTabView(customtkinter.CTkTabview):
                 "gold_type": GoldType[gold_type].value,
                 "isdeleted": False
             }
-            self.append_to_excel(new_data, "transactions")
-
-            messagebox.showinfo(
-                "Success",
-                "Gold transaction added successfully. Please Refresh Data!")
-            self.focus()
+            self.storage.add_transaction(new_data)
         except Exception as e:
             messagebox.showerror(
                 "Error",
                 f"An error occurred while writing to Excel: {e}")
             self.focus()
+            return
 
-    def generate_gold_id(self, df_transactions):
-        gold_transactions = df_transactions[df_transactions["type"] == "gold"]
-        num_gold_transactions = len(gold_transactions)
-        new_id = f"GLD{num_gold_transactions + 1:03}"
-        while new_id in df_transactions["id"].values:
-            num_gold_transactions += 1
-            new_id = f"GLD{num_gold_transactions + 1:03}"
-        return new_id
+        self.app.sync_transaction(new_data["id"])
+        messagebox.showinfo(
+            "Success", "Gold transaction added successfully.")
+        self.focus()
 
     def combobox_currency_type_callback(self, choice):
         try:
@@ -382,20 +364,18 @@ class AddTransactionTabView(customtkinter.CTkTabview):
             return
 
         try:
-            df_transactions = pd.read_excel(
-                "./resources/data/data.xlsx", sheet_name="transactions")
-            df_exchange_rates = pd.read_excel(
-                "./resources/data/data.xlsx", sheet_name="exchange_rates")
-
             currency_type_enum = CurrencyType[currency_type].value
-            exchange_rate_row = df_exchange_rates[
-                df_exchange_rates["currency_type"] ==
-                currency_type_enum].iloc[0]
+            exchange_rate_row = self.storage.get_exchange_rate(
+                currency_type_enum)
+            if exchange_rate_row is None:
+                messagebox.showerror("Error", "Exchange rate not found.")
+                self.focus()
+                return
             exchange_rate = exchange_rate_row["rate"]
             exchange_rate_id = exchange_rate_row["id"]
 
             new_data = {
-                "id": self.generate_currency_id(df_transactions),
+                "id": self.storage.generate_id("currency"),
                 "day": day,
                 "month": month,
                 "year": year,
@@ -410,54 +390,17 @@ class AddTransactionTabView(customtkinter.CTkTabview):
                 "isdeleted": False
             }
 
-            self.append_to_excel(new_data, "transactions")
-
-            messagebox.showinfo(
-                "Success",
-                "Currency transaction added successfully. Please Refresh Data!"
-            )
-            self.focus()
+            self.storage.add_transaction(new_data)
         except Exception as e:
             messagebox.showerror(
                 "Error", f"An error occurred while writing to Excel: {e}")
             self.focus()
+            return
 
-    def generate_currency_id(self, df_transactions):
-        currency_transactions = df_transactions[
-            df_transactions["type"] == "currency"]
-        num_currency_transactions = len(currency_transactions)
-        new_id = f"CUR{num_currency_transactions + 1:03}"
-        while new_id in df_transactions["id"].values:
-            num_currency_transactions += 1
-            new_id = f"CUR{num_currency_transactions + 1:03}"
-        return new_id
-
-    def append_to_excel(self, new_data, sheet_name):
-        try:
-            df_transactions = pd.read_excel(
-                "./resources/data/data.xlsx", sheet_name="transactions")
-            df_exchange_rates = pd.read_excel(
-                "./resources/data/data.xlsx", sheet_name="exchange_rates")
-
-            if sheet_name == "transactions":
-                df_transactions = pd.concat(
-                    [df_transactions, pd.DataFrame([new_data])],
-                    ignore_index=True)
-            elif sheet_name == "exchange_rates":
-                df_exchange_rates = pd.concat(
-                    [df_exchange_rates, pd.DataFrame([new_data])],
-                    ignore_index=True)
-
-            with pd.ExcelWriter("./resources/data/data.xlsx",
-                                engine="openpyxl", mode="a",
-                                if_sheet_exists="replace") as writer:
-                df_transactions.to_excel(
-                    writer, sheet_name="transactions", index=False)
-                df_exchange_rates.to_excel(
-                    writer, sheet_name="exchange_rates", index=False)
-        except Exception as e:
-            messagebox.showerror(
-                "Error", f"An error occurred while writing to Excel: {e}")
+        self.app.sync_transaction(new_data["id"])
+        messagebox.showinfo(
+            "Success", "Currency transaction added successfully.")
+        self.focus()
 
     def get_exchange_rate_id(self, currency_type):
         for rate in self.exchange_rates:
@@ -0,0 +1,68 @@
+import io
+from concurrent.futures import ThreadPoolExecutor
+import customtkinter
+from PIL import Image
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+
+class ChartRenderer:
+    POLL_DELAY = 50
+
+    # Charts render on one worker thread into plain Agg figures, so Tk is
+    # only touched from the main thread once the PNG is ready.
+    _executor = ThreadPoolExecutor(max_workers=1)
+    _version = None
+    _charts = {}
+
+    @classmethod
+    def get_chart(cls, key, version, plot, *args):
+        # Charts of older data versions can never be shown again.
+        if version != cls._version:
+            cls._charts = {}
+            cls._version = version
+
+        if key not in cls._charts:
+            cls._charts[key] = cls._executor.submit(
+                cls.render_chart, plot, *args)
+        return cls._charts[key]
+
+    @classmethod
+    def render_chart(cls, plot, *args):
+        figure = Figure()
+        FigureCanvasAgg(figure)
+        plot(figure, *args)
+
+        buffer = io.BytesIO()
+        figure.savefig(buffer, format="png")
+        return buffer.getvalue()
+
+    @classmethod
+    def show_chart(cls, master, key, version, plot, *args):
+        chart = cls.get_chart(key, version, plot, *args)
+
+        label = customtkinter.CTkLabel(
+            master=master,
+            text="Loading chart...",
+            font=("Arial", 14),
+            height=480
+        )
+        cls.poll_chart(label, chart)
+        return label
+
+    @classmethod
+    def poll_chart(cls, label, chart):
+        if not label.winfo_exists():
+            return
+        if not chart.done():
+            label.after(cls.POLL_DELAY, lambda: cls.poll_chart(label, chart))
+            return
+
+        if chart.exception() is not None:
+            label.configure(text="Chart unavailable")
+            return
+
+        image = Image.open(io.BytesIO(chart.result()))
+        label.configure(
+            text="",
+            image=customtkinter.CTkImage(light_image=image, size=image.size))
@@ -1,7 +1,6 @@
 from tkinter import ttk, messagebox
 import customtkinter
 from sys import platform
-import pandas as pd
 
 
 class DeleteGoldTransactionWindow(customtkinter.CTkToplevel):
@@ -168,38 +167,22 @@ class DeleteGoldTransactionWindow(customtkinter.CTkToplevel):
 
     def gold_confirm_button_callback(self):
         try:
-            df_transactions = pd.read_excel(
-                "./resources/data/data.xlsx", sheet_name="transactions")
-            df_exchange_rates = pd.read_excel(
-                "./resources/data/data.xlsx", sheet_name="exchange_rates")
-
-            transaction_found = False
-            for idx, transaction in df_transactions.iterrows():
-                if transaction[
-                    "id"
-                ] == self.parent.selected_gold_transaction_code:
-                    df_transactions.at[idx, "isdeleted"] = True
-                    transaction_found = True
-                    break
-
-            if not transaction_found:
+            app = self.parent.master.master.master
+            storage = app.storage
+            transaction_id = self.parent.selected_gold_transaction_code
+
+            if not storage.has_transaction(transaction_id):
                 messagebox.showerror("Error", "Transaction ID not found.")
                 return
 
-            with pd.ExcelWriter("./resources/data/data.xlsx",
-                                engine="openpyxl", mode="a",
-                                if_sheet_exists="replace") as writer:
-                df_transactions.to_excel(
-                    writer, sheet_name="transactions", index=False)
-                df_exchange_rates.to_excel(
-                    writer, sheet_name="exchange_rates", index=False)
-
-            messagebox.showinfo(
-                "Success",
-                "Gold transaction deleted successfully! Please Refresh Data!")
-            self.destroy()
-
+            storage.delete_transaction(transaction_id)
         except Exception as e:
             messagebox.showerror(
                 "Error", f"An error occurred while writing to Excel: {e}")
             self.focus()
+            return
+
+        app.sync_transaction(transaction_id)
+        messagebox.showinfo(
+            "Success", "Gold transaction deleted successfully!")
+        self.destroy()
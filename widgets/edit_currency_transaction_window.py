@@ -3,7 +3,6 @@ from tkinter import ttk, messagebox
 import customtkinter
 from sys import platform
 import datetime
-import pandas as pd
 
 from enums.currency_type_enum import CurrencyType
 
@@ -18,24 +17,17 @@ class EditCurrencyTransactionWindow(customtkinter.CTkToplevel):
         self.configure(fg_color="#d9d9d9")
         self.parent = parent
 
-        self.load_exchange_rates_from_excel()
+        self.app = self.parent.master.master.master
+        self.storage = self.app.storage
+        self.load_exchange_rates()
         self.create_widget()
 
         if platform.startswith("win"):
             self.after(200,
                        lambda: self.iconbitmap("./resources/images/logo.ico"))
 
-    def load_exchange_rates_from_excel(self):
-        try:
-            df_exchange_rates = pd.read_excel(
-                "./resources/data/data.xlsx", sheet_name="exchange_rates")
-            self.exchange_rates = df_exchange_rates.to_dict('records')
-        except FileNotFoundError:
-            messagebox.showerror("Error", "Data file not found.")
-            self.exchange_rates = []
-        except Exception as e:
-            messagebox.showerror("Error", f"An error occurred: {e}")
-            self.exchange_rates = []
+    def load_exchange_rates(self):
+        self.exchange_rates = self.storage.get_exchange_rates()
 
     def create_widget(self):
         edit_frame = customtkinter.CTkFrame(
@@ -262,66 +254,41 @@ class EditCurrencyTransactionWindow(customtkinter.CTkToplevel):
             return
 
         try:
-            df_transactions = pd.read_excel(
-                "./resources/data/data.xlsx", sheet_name="transactions")
-            df_exchange_rates = pd.read_excel(
-                "./resources/data/data.xlsx", sheet_name="exchange_rates")
-
             currency_type_enum = CurrencyType[currency_type].value
-            exchange_rate_row = df_exchange_rates[
-                df_exchange_rates["currency_type"] ==
-                currency_type_enum].iloc[0]
-            exchange_rate = exchange_rate_row["rate"]
-            exchange_rate_id = exchange_rate_row["id"]
-
-            transaction_found = False
-            for idx, transaction in df_transactions.iterrows():
-                if transaction[
-                        "id"
-                ] == self.parent.selected_currency_transaction_code:
-                    df_transactions.at[idx, "day"] = day
-                    df_transactions.at[idx, "month"] = month
-                    df_transactions.at[idx, "year"] = year
-                    df_transactions.at[idx, "quantity"] = quantity
-                    df_transactions.at[idx,
-                                       "currency_type"] = currency_type_enum
-                    df_transactions.at[idx,
-                                       "exchange_rate_id"] = exchange_rate_id
-                    df_transactions.at[idx, "exchange_rate"] = exchange_rate
-                    df_transactions.at[idx,
-                                       "effective_day"
-                                       ] = exchange_rate_row["effective_day"]
-                    df_transactions.at[idx,
-                                       "effective_month"
-                                       ] = exchange_rate_row["effective_month"]
-                    df_transactions.at[idx,
-                                       "effective_year"
-                                       ] = exchange_rate_row["effective_year"]
-                    transaction_found = True
-                    break
-
-            if not transaction_found:
-                messagebox.showerror("Error", "Transaction ID not found.")
+            exchange_rate_row = self.storage.get_exchange_rate(
+                currency_type_enum)
+            if exchange_rate_row is None:
+                messagebox.showerror("Error", "Exchange rate not found.")
+                self.focus()
                 return
 
-            with pd.ExcelWriter("./resources/data/data.xlsx",
-                                engine="openpyxl", mode="a",
-                                if_sheet_exists="replace") as writer:
-                df_transactions.to_excel(
-                    writer, sheet_name="transactions", index=False)
-                df_exchange_rates.to_excel(
-                    writer, sheet_name="exchange_rates", index=False)
-
-            messagebox.showinfo(
-                "Success",
-                "Currency transaction updated successfully! \
-                \nPlease Refresh Data!")
-            self.destroy()
+            transaction_id = self.parent.selected_currency_transaction_code
+            if not self.storage.has_transaction(transaction_id):
+                messagebox.showerror("Error", "Transaction ID not found.")
+                return
 
+            self.storage.update_transaction(transaction_id, {
+                "day": day,
+                "month": month,
+                "year": year,
+                "quantity": quantity,
+                "currency_type": currency_type_enum,
+                "exchange_rate_id": exchange_rate_row["id"],
+                "exchange_rate": exchange_rate_row["rate"],
+                "effective_day": exchange_rate_row["effective_day"],
+                "effective_month": exchange_rate_row["effective_month"],
+                "effective_year": exchange_rate_row["effective_year"]
+            })
         except Exception as e:
             messagebox.showerror(
                 "Error", f"An error occurred while writing to Excel: {e}")
             self.focus()
+            return
+
+        self.app.sync_transaction(transaction_id)
+        messagebox.showinfo(
+            "Success", "Currency transaction updated successfully!")
+        self.destroy()
 
     def validate_and_convert_input(self, input_str):
         try:
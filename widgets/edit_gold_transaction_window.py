@@ -3,7 +3,6 @@ from tkinter import ttk, messagebox
 import customtkinter
 from sys import platform
 import datetime
-import pandas as pd
 
 from enums.gold_type_enum import GoldType
 
@@ -222,42 +221,32 @@ class EditGoldTransactionWindow(customtkinter.CTkToplevel):
             return
 
         try:
-            df_transactions = pd.read_excel(
-                "./resources/data/data.xlsx", sheet_name="transactions")
-
-            transaction_found = False
-            for idx, transaction in df_transactions.iterrows():
-                if transaction["id"
-                               ] == self.parent.selected_gold_transaction_code:
-                    df_transactions.at[idx, "day"] = day
-                    df_transactions.at[idx, "month"] = month
-                    df_transactions.at[idx, "year"] = year
-                    df_transactions.at[idx, "unit_price"] = unit_price
-                    df_transactions.at[idx, "quantity"] = quantity
-                    df_transactions.at[idx, "gold_type"] = \
-                        GoldType[gold_type].value
-                    transaction_found = True
-                    break
-
-            if not transaction_found:
+            app = self.parent.master.master.master
+            storage = app.storage
+            transaction_id = self.parent.selected_gold_transaction_code
+
+            if not storage.has_transaction(transaction_id):
                 messagebox.showerror("Error", "Transaction ID not found.")
                 return
 
-            with pd.ExcelWriter("./resources/data/data.xlsx",
-                                engine="openpyxl", mode="a",
-                                if_sheet_exists="replace") as writer:
-                df_transactions.to_excel(
-                    writer, sheet_name="transactions", index=False)
-
-            messagebox.showinfo(
-                "Success",
-                "Gold transaction updated successfully! Please Refresh Data!")
-            self.destroy()
-
+            storage.update_transaction(transaction_id, {
+                "day": day,
+                "month": month,
+                "year": year,
+                "unit_price": unit_price,
+                "quantity": quantity,
+                "gold_type": GoldType[gold_type].value
+            })
         except Exception as e:
             messagebox.showerror(
                 "Error", f"An error occurred while writing to Excel: {e}")
             self.focus()
+            return
+
+        app.sync_transaction(transaction_id)
+        messagebox.showinfo(
+            "Success", "Gold transaction updated successfully!")
+        self.destroy()
 
     def validate_and_convert_input(self, input_str):
         try:
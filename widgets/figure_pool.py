@@ -0,0 +1,44 @@
+from matplotlib import rcParams
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+
+
+class FigurePool:
+    SUBPLOT_PARAMS = ["left", "right", "bottom", "top", "wspace", "hspace"]
+
+    _canvases = {}
+    _idle_figures = []
+
+    @classmethod
+    def get_canvas(cls, master, name):
+        key = (str(master), name)
+        canvas = cls._canvases.get(key)
+        if canvas is not None:
+            cls.reset_figure(canvas.figure)
+            return canvas
+
+        figure = cls._idle_figures.pop() if cls._idle_figures else Figure()
+        cls.reset_figure(figure)
+        canvas = FigureCanvasTkAgg(figure, master=master)
+        canvas.get_tk_widget().bind(
+            "<Destroy>", lambda event: cls.release(key, canvas), add="+")
+        cls._canvases[key] = canvas
+        return canvas
+
+    @classmethod
+    def reset_figure(cls, figure):
+        figure.clear()
+        figure.set_size_inches(rcParams["figure.figsize"], forward=False)
+        figure.subplots_adjust(**{
+            param: rcParams[f"figure.subplot.{param}"]
+            for param in cls.SUBPLOT_PARAMS})
+
+    @classmethod
+    def release(cls, key, canvas):
+        # Figures outlive their canvas widget, so a closed window hands
+        # them back for the next chart instead of leaving them to pile up.
+        if cls._canvases.get(key) is not canvas:
+            return
+        del cls._canvases[key]
+        canvas.figure.clear()
+        cls._idle_figures.append(canvas.figure)
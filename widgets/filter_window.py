@@ -2,15 +2,22 @@ from tkinter import ttk, messagebox
 import customtkinter
 from sys import platform
 import datetime
+import math
 from datetime import timedelta
 
 from enums.month_label_enum import MonthLabel
-from models.gold_transaction_model import GoldTransaction
-from models.currency_transaction_model import CurrencyTransaction
+from enums.transaction_type_enum import TransactionType
+from models.transaction_query_model import TransactionQuery
 from widgets.header_frame_for_window import HeaderFrameForWindow
+from widgets.virtual_treeview import VirtualTreeview
 
 
 class FilterWindow(customtkinter.CTkToplevel):
+    # Bucket boundaries of the amount selector, in VND. Each bucket includes
+    # its lower edge and excludes its upper edge.
+    AMOUNT_EDGES = [100000000, 500000000, 1000000000]
+    AMOUNT_UNITS = [("B", 1000000000), ("M", 1000000), ("K", 1000)]
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.title("Transaction Management - FILTER")
@@ -18,19 +25,18 @@ class FilterWindow(customtkinter.CTkToplevel):
         self.minsize(1720, 960)
         self.configure(fg_color="white")
 
+        self.transaction_list = self.master.master.transaction_list
+
         self.create_widget()
 
         if platform.startswith("win"):
             self.after(200,
                        lambda: self.iconbitmap("./resources/images/logo.ico"))
 
-        self.transactions = \
-            self.master.master.transaction_list.get_transactions()
-
     def create_widget(self):
         self.header_frame_for_filter_window = HeaderFrameForWindow(
             master=self, label_header="FILTER",
-            submit_event=lambda: self.submit_event(self.transactions),
+            submit_event=self.submit_event,
             show_submit=True)
         self.header_frame_for_filter_window.pack(padx=10, pady=10, fill="x")
 
@@ -151,6 +157,12 @@ class FilterWindow(customtkinter.CTkToplevel):
         self.to_frame_entry_month.insert(0, str(next_month_date.month))
         self.to_frame_entry_year.insert(0, str(next_month_date.year))
 
+        for entry in [self.from_frame_entry_day, self.from_frame_entry_month,
+                      self.from_frame_entry_year, self.to_frame_entry_day,
+                      self.to_frame_entry_month, self.to_frame_entry_year]:
+            entry.bind("<KeyRelease>",
+                       lambda event: self.update_amount_counts())
+
     def create_total_amount_selector_frame(self, frame):
         total_amount_selector_frame = customtkinter.CTkFrame(
             master=frame,
@@ -177,22 +189,166 @@ class FilterWindow(customtkinter.CTkToplevel):
         label_chose_range.pack(padx=20, pady=5, anchor="w")
 
         self.create_optionmenu_chose_range(total_amount_selector_frame)
+        self.create_custom_range_frame(total_amount_selector_frame)
 
     def create_optionmenu_chose_range(self, frame):
         self.optionmenu = customtkinter.CTkOptionMenu(
-            frame,
-            values=["All", "< 100M", "100M - 500M", "500M - 1B", "> 1B"]
+            frame, values=[], width=180,
+            command=self.optionmenu_chose_range_callback
         )
-        self.optionmenu.set("All")
+        self.range_options = {}
+        self.update_range_options()
         self.optionmenu.pack(padx=30, pady=(5, 20), side="left")
 
+    def create_custom_range_frame(self, frame):
+        self.custom_range_frame = customtkinter.CTkFrame(
+            master=frame,
+            fg_color="transparent"
+        )
+
+        self.entry_min_amount = customtkinter.CTkEntry(
+            master=self.custom_range_frame, placeholder_text="Amount from",
+            width=120)
+        self.entry_min_amount.grid(row=0, column=0, padx=5, pady=0)
+
+        self.entry_max_amount = customtkinter.CTkEntry(
+            master=self.custom_range_frame, placeholder_text="Amount under",
+            width=120)
+        self.entry_max_amount.grid(row=0, column=1, padx=5, pady=0)
+
+        self.label_custom_range_count = customtkinter.CTkLabel(
+            master=self.custom_range_frame,
+            text="",
+            font=("Arial", 14),
+            text_color="black",
+            width=160,
+            anchor="w"
+        )
+        self.label_custom_range_count.grid(row=0, column=2, padx=5, pady=0)
+
+        for entry in [self.entry_min_amount, self.entry_max_amount]:
+            entry.bind("<KeyRelease>",
+                       lambda event: self.update_custom_range_count())
+
+    def optionmenu_chose_range_callback(self, choice):
+        if self.range_options[choice] is None:
+            self.custom_range_frame.pack(padx=(0, 20), pady=(5, 20),
+                                         side="left")
+            self.update_custom_range_count()
+        else:
+            self.custom_range_frame.pack_forget()
+
+    def get_amount_ranges(self):
+        edges = [None] + self.AMOUNT_EDGES + [None]
+        return list(zip(edges[:-1], edges[1:]))
+
+    def format_amount_range(self, min_amount, max_amount):
+        if min_amount is None:
+            return "< {}".format(self.format_short_amount(max_amount))
+        if max_amount is None:
+            return "> {}".format(self.format_short_amount(min_amount))
+        return "{} - {}".format(self.format_short_amount(min_amount),
+                                self.format_short_amount(max_amount))
+
+    def format_short_amount(self, amount):
+        for suffix, unit in self.AMOUNT_UNITS:
+            if amount >= unit and amount % unit == 0:
+                return "{}{}".format(amount // unit, suffix)
+        return "{:,}".format(amount)
+
+    def format_range_option(self, label, count):
+        if count is None:
+            return label
+        return "{} ({})".format(label, count)
+
+    def update_range_options(self):
+        # Every option shows how many transactions in the selected dates it
+        # holds before submitting. The counts are left out while the dates
+        # are incomplete.
+        date_range = self.get_selected_date_range()
+        if date_range is None:
+            counts = [None] * (len(self.AMOUNT_EDGES) + 1)
+            total = None
+        else:
+            counts = self.transaction_list.get_amount_histogram(
+                self.AMOUNT_EDGES, TransactionQuery(start_date=date_range[0],
+                                                    end_date=date_range[1]))
+            total = sum(counts)
+
+        options = {self.format_range_option("All", total): (None, None)}
+        for (min_amount, max_amount), count in zip(self.get_amount_ranges(),
+                                                   counts):
+            label = self.format_range_option(
+                self.format_amount_range(min_amount, max_amount), count)
+            options[label] = (min_amount, max_amount)
+        options["Custom"] = None
+
+        selected = 0
+        if self.range_options:
+            selected = list(self.range_options).index(self.optionmenu.get())
+
+        self.range_options = options
+        self.optionmenu.configure(values=list(options))
+        self.optionmenu.set(list(options)[selected])
+
+    def get_custom_amount_range(self):
+        amounts = []
+        for entry in [self.entry_min_amount, self.entry_max_amount]:
+            amount = entry.get().strip().replace(",", "")
+            if not amount:
+                amounts.append(None)
+                continue
+            try:
+                amount = float(amount)
+            except ValueError:
+                return None, "Please enter a valid amount."
+            if not math.isfinite(amount):
+                return None, "Please enter a valid amount."
+            amounts.append(amount)
+        return tuple(amounts), None
+
+    def update_custom_range_count(self):
+        amount_range, error = self.get_custom_amount_range()
+        if amount_range is None:
+            self.label_custom_range_count.configure(text=error)
+            return
+
+        date_range = self.get_selected_date_range()
+        if date_range is None:
+            self.label_custom_range_count.configure(text="")
+            return
+
+        count = len(self.filter_transactions(*date_range, amount_range))
+        self.label_custom_range_count.configure(
+            text="{} transactions".format(count))
+
+    def update_amount_counts(self):
+        self.update_range_options()
+        if self.range_options[self.optionmenu.get()] is None:
+            self.update_custom_range_count()
+
+    def get_selected_date_range(self):
+        dates = []
+        for entries in [(self.from_frame_entry_day,
+                         self.from_frame_entry_month,
+                         self.from_frame_entry_year),
+                        (self.to_frame_entry_day,
+                         self.to_frame_entry_month,
+                         self.to_frame_entry_year)]:
+            day, month, year = [entry.get() for entry in entries]
+            if not all(map(str.isdigit, [day, month, year])) or \
+                    not self.validate_date(day, month, year):
+                return None
+            dates.append(datetime.date(int(year), int(month), int(day)))
+        return tuple(dates)
+
     def create_filter_result_frame(self):
         self.result_frame = customtkinter.CTkScrollableFrame(
             self, fg_color="#dbdbdb", bg_color="#ffffff",
             height=700)
         self.result_frame.pack(padx=10, pady=10, fill="x")
 
-    def submit_event(self, transactions):
+    def submit_event(self):
         for widget in self.result_frame.winfo_children():
             widget.destroy()
 
@@ -202,7 +358,7 @@ class FilterWindow(customtkinter.CTkToplevel):
         to_day_str = self.to_frame_entry_day.get()
         to_month_str = self.to_frame_entry_month.get()
         to_year_str = self.to_frame_entry_year.get()
-        chose_range = self.optionmenu.get()
+        amount_range = self.range_options[self.optionmenu.get()]
 
         if not all([from_day_str, from_month_str, from_year_str, to_day_str,
                     to_month_str, to_year_str]):
@@ -233,15 +389,20 @@ class FilterWindow(customtkinter.CTkToplevel):
             self.after(10, self.lift)
             return
 
-        transactions_filter = self.filter_transactions_by_date(
-            from_day, from_month, from_year, to_day, to_month, to_year,
-            transactions)
+        if amount_range is None:
+            amount_range, error = self.get_custom_amount_range()
+            if amount_range is None:
+                messagebox.showerror("Invalid Input", error)
+                self.after(10, self.lift)
+                return
 
-        transactions_filter = self.filter_transactions_by_amount(
-            transactions_filter, chose_range)
+        filter_result = self.filter_transactions(
+            datetime.date(from_year, from_month, from_day),
+            datetime.date(to_year, to_month, to_day), amount_range)
+        self.update_range_options()
 
         self.create_content_treeview_filter_result(
-            self.result_frame, transactions_filter)
+            self.result_frame, filter_result)
 
     def validate_date(self, day, month, year):
         try:
@@ -267,49 +428,17 @@ class FilterWindow(customtkinter.CTkToplevel):
 
         return True
 
-    def filter_transactions_by_date(self, from_day, from_month, from_year,
-                                    to_day, to_month, to_year, transactions):
-        from_date = datetime.date(from_year, from_month, from_day)
-        to_date = datetime.date(to_year, to_month, to_day)
-
-        transactions_filter = []
-
-        for transaction in transactions:
-            transaction_date = datetime.date(
-                transaction._year, transaction._month, transaction._day)
-            if from_date <= transaction_date <= to_date:
-                transactions_filter.append(transaction)
-
-        return transactions_filter
-
-    def filter_transactions_by_amount(self, transactions, chose_range):
-        transactions_filter = []
-
-        for transaction in transactions:
-            total_amount = transaction._total_amount
-
-            if chose_range == "All":
-                transactions_filter.append(transaction)
-            elif chose_range == "< 100M" and total_amount < 100000000:
-                transactions_filter.append(transaction)
-            elif chose_range == "100M - 500M" and 100000000 <= \
-                    total_amount < 500000000:
-                transactions_filter.append(transaction)
-            elif chose_range == "500M - 1B" and 500000000 <= \
-                    total_amount < 1000000000:
-                transactions_filter.append(transaction)
-            elif chose_range == "> 1B" and total_amount >= 1000000000:
-                transactions_filter.append(transaction)
-
-        return transactions_filter
-
-    def create_content_treeview_filter_result(self, frame, transactions):
-        gold_transactions = [transaction for transaction in transactions
-                             if isinstance(
-                                 transaction, GoldTransaction)]
-        currency_transactions = [transaction for transaction in transactions
-                                 if isinstance(
-                                     transaction, CurrencyTransaction)]
+    def filter_transactions(self, from_date, to_date, amount_range):
+        min_amount, max_amount = amount_range
+        return self.transaction_list.run_query(TransactionQuery(
+            start_date=from_date, end_date=to_date,
+            min_amount=min_amount, max_amount=max_amount))
+
+    def create_content_treeview_filter_result(self, frame, result):
+        gold_transactions = result.get_transactions(TransactionType.GOLD)
+        currency_transactions = result.get_transactions(
+            TransactionType.CURRENCY)
+        aggregate = result.get_aggregate()
 
         frame_gold = customtkinter.CTkFrame(
             frame, fg_color="#ffffff",
@@ -317,7 +446,8 @@ class FilterWindow(customtkinter.CTkToplevel):
         frame_gold.pack(padx=5, pady=5, fill="x")
 
         treeview_gold_transaction = self.create_gold_treeview_filter_result(
-            frame_gold, gold_transactions)
+            frame_gold,
+            aggregate.get_total_amount(TransactionType.GOLD))
         self.populate_treeview_with_gold_filter_result(
             treeview_gold_transaction, gold_transactions)
         treeview_gold_transaction.pack(padx=20, pady=(10, 20), fill="x")
@@ -337,7 +467,8 @@ class FilterWindow(customtkinter.CTkToplevel):
 
         treeview_currency_transaction\
             = self.create_currency_treeview_filter_result(
-                frame_currency, currency_transactions)
+                frame_currency,
+                aggregate.get_total_amount(TransactionType.CURRENCY))
         self.populate_treeview_with_currency_filter_result(
             treeview_currency_transaction, currency_transactions)
         treeview_currency_transaction.pack(padx=20, pady=(10, 20), fill="x")
@@ -385,16 +516,8 @@ class FilterWindow(customtkinter.CTkToplevel):
         frame_header.columnconfigure(0, weight=1)
         frame_header.columnconfigure(1, weight=1)
 
-    def calculate_total_amount_filter_result(self, transactions):
-        total_amount = 0
-        for transaction in transactions:
-            total_amount += transaction._total_amount
-        return total_amount
-
     def create_gold_treeview_filter_result(self, frame,
-                                           gold_transactions):
-        total_amount_gold = self.calculate_total_amount_filter_result(
-            gold_transactions)
+                                           total_amount_gold):
         formatted_total_amount_gold = self.format_price_number(
             total_amount_gold)
         self.create_header_transaction_treeview(
@@ -405,7 +528,7 @@ class FilterWindow(customtkinter.CTkToplevel):
             "Treeview.Heading", font=("Arial", 10, "bold"))
         treeview_style.configure("Treeview", rowheight=25)
 
-        treeview = ttk.Treeview(frame, columns=(
+        treeview = VirtualTreeview(frame, columns=(
             "Transaction Code",
             "Transaction Date",
             "Unit Price (VND/tael)",
@@ -426,10 +549,7 @@ class FilterWindow(customtkinter.CTkToplevel):
         return treeview
 
     def create_currency_treeview_filter_result(self, frame,
-                                               currency_transactions
-                                               ):
-        total_amount_currency = self.calculate_total_amount_filter_result(
-            currency_transactions)
+                                               total_amount_currency):
         formatted_total_amount_currency = self.format_price_number(
             total_amount_currency)
         self.create_header_transaction_treeview(
@@ -440,7 +560,7 @@ class FilterWindow(customtkinter.CTkToplevel):
             "Treeview.Heading", font=("Arial", 10, "bold"))
         treeview_style.configure("Treeview", rowheight=25)
 
-        treeview = ttk.Treeview(frame, columns=(
+        treeview = VirtualTreeview(frame, columns=(
             "Transaction Code",
             "Transaction Date",
             "Quantity",
@@ -459,48 +579,50 @@ class FilterWindow(customtkinter.CTkToplevel):
                          text="Total Amount (VND)", anchor="w")
         return treeview
 
+    def get_gold_row_values(self, transaction):
+        transaction_date = "{} {} {}".format(
+            transaction._day, MonthLabel(transaction._month),
+            transaction._year)
+        formatted_unit_price = self.format_price_number(
+            transaction._unit_price)
+        formatted_total_amount = self.format_price_number(
+            transaction._total_amount)
+        return (
+            transaction._id,
+            transaction_date,
+            formatted_unit_price,
+            transaction._quantity,
+            transaction._gold_type.name,
+            formatted_total_amount
+        )
+
     def populate_treeview_with_gold_filter_result(self, treeview, transactions
                                                   ):
-        for transaction in transactions:
-            if isinstance(transaction, GoldTransaction):
-                transaction_date = "{} {} {}".format(
-                    transaction._day, MonthLabel(transaction._month),
-                    transaction._year)
-                formatted_unit_price = self.format_price_number(
-                    transaction._unit_price)
-                formatted_total_amount = self.format_price_number(
-                    transaction._total_amount)
-                treeview.insert("", "end", values=(
-                    transaction._id,
-                    transaction_date,
-                    formatted_unit_price,
-                    transaction._quantity,
-                    transaction._gold_type.name,
-                    formatted_total_amount
-                ))
+        treeview.set_rows(transactions, self.get_gold_row_values)
+
+    def get_currency_row_values(self, transaction):
+        transaction_date = "{} {} {}".format(
+            transaction._day, MonthLabel(transaction._month),
+            transaction._year)
+        formatted_quantity = self.format_price_number(
+            transaction._quantity)
+        formatted_exchange_rate = self.format_price_number(
+            transaction._exchange_rate._rate)
+        formatted_total_amount = self.format_price_number(
+            transaction._total_amount)
+        return (
+            transaction._id,
+            transaction_date,
+            formatted_quantity,
+            transaction._currency_type.name,
+            formatted_exchange_rate,
+            formatted_total_amount
+        )
 
     def populate_treeview_with_currency_filter_result(self,
                                                       treeview,
                                                       transactions):
-        for transaction in transactions:
-            if isinstance(transaction, CurrencyTransaction):
-                transaction_date = "{} {} {}".format(
-                    transaction._day, MonthLabel(transaction._month),
-                    transaction._year)
-                formatted_quantity = self.format_price_number(
-                    transaction._quantity)
-                formatted_exchange_rate = self.format_price_number(
-                    transaction._exchange_rate._rate)
-                formatted_total_amount = self.format_price_number(
-                    transaction._total_amount)
-                treeview.insert("", "end", values=(
-                    transaction._id,
-                    transaction_date,
-                    formatted_quantity,
-                    transaction._currency_type.name,
-                    formatted_exchange_rate,
-                    formatted_total_amount
-                ))
+        treeview.set_rows(transactions, self.get_currency_row_values)
 
     def format_price_number(self, total_amount):
         if '.' in str(total_amount):
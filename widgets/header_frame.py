@@ -1,7 +1,7 @@
 import customtkinter
-from PIL import Image
 
 from widgets.filter_window import FilterWindow
+from widgets.image_cache import ImageCache
 from widgets.search_window import SearchWindow
 from widgets.add_transaction_window import AddTransactionWindow
 from widgets.report_window import ReportWindow
@@ -11,12 +11,9 @@ class HeaderFrame(customtkinter.CTkFrame):
     def __init__(self, master, initial_theme="Dark-Blue", **kwargs):
         super().__init__(master, **kwargs)
         self.configure(fg_color="#dbdbdb", bg_color="#f2f2f2")
-        self.refresh_icon = customtkinter.CTkImage(
-            Image.open('./resources/images/refresh.ico'))
-        self.filter_icon = customtkinter.CTkImage(
-            Image.open('./resources/images/filter.ico'))
-        self.search_icon = customtkinter.CTkImage(
-            Image.open('./resources/images/search.ico'))
+        self.refresh_icon = ImageCache.get_image("refresh.ico")
+        self.filter_icon = ImageCache.get_image("filter.ico")
+        self.search_icon = ImageCache.get_image("search.ico")
 
         self.label_transaction = customtkinter.CTkLabel(
             self, text="Transaction", text_color="black",
@@ -94,12 +91,6 @@ class HeaderFrame(customtkinter.CTkFrame):
         self.columnconfigure(1, weight=1)
 
     def option_menu_theme_callback(self, choice):
-        if choice == "Dark-Blue":
-            customtkinter.set_default_color_theme("dark-blue")
-        elif choice == "Blue":
-            customtkinter.set_default_color_theme("blue")
-        elif choice == "Green":
-            customtkinter.set_default_color_theme("green")
         self.master.update_theme(choice)
 
     def open_filter_window(self):
@@ -1,16 +1,18 @@
 from tkinter import ttk
 import customtkinter
-from PIL import Image
+
+from widgets.image_cache import ImageCache
 
 
 class HeaderFrameForWindow(customtkinter.CTkFrame):
     def __init__(self, master, label_header, submit_event,
-                 show_submit=True, show_search_bar=False, **kwargs):
+                 show_submit=True, show_search_bar=False,
+                 criteria_change_event=None, **kwargs):
         super().__init__(master, **kwargs)
         self.configure(fg_color="#dbdbdb", bg_color="#ffffff")
+        self.criteria_change_event = criteria_change_event
 
-        self.search_icon = customtkinter.CTkImage(
-            Image.open('./resources/images/search.ico'))
+        self.search_icon = ImageCache.get_image("search.ico")
 
         self.label_transaction = customtkinter.CTkLabel(
             self, text=label_header, text_color="black",
@@ -50,7 +52,7 @@ class HeaderFrameForWindow(customtkinter.CTkFrame):
             self.optionmenu = customtkinter. \
                 CTkOptionMenu(self.search_bar_frame,
                               values=[
-                                  "Code", "Date", "Type"],
+                                  "Code", "Date", "Type", "Combined"],
                               command=self.option_menu_callback)
             self.optionmenu.set("Code")
             self.optionmenu.grid(row=0, column=0, padx=2, pady=0)
@@ -141,3 +143,70 @@ class HeaderFrameForWindow(customtkinter.CTkFrame):
                 self.entry_frame, placeholder_text="Search type... (Ex: Gold)",
                 width=280)
             self.search_entry.grid(row=0, column=1, padx=2, pady=0)
+        elif choice == "Combined":
+            self.entry_frame = customtkinter.CTkFrame(
+                master=self.search_bar_frame,
+                fg_color="transparent"
+            )
+            self.entry_frame.grid(row=0, column=1, padx=2, pady=0)
+
+            self.search_entry = customtkinter.CTkEntry(
+                self.entry_frame, placeholder_text="Code", width=140)
+            self.search_entry.grid(row=0, column=0, padx=2, pady=2)
+
+            self.type_optionmenu = customtkinter.CTkOptionMenu(
+                self.entry_frame, values=["Any type", "Gold", "Currency"],
+                width=120,
+                command=lambda choice: self.on_criteria_changed())
+            self.type_optionmenu.set("Any type")
+            self.type_optionmenu.grid(row=0, column=1, padx=2, pady=2)
+
+            self.entry_min_amount = customtkinter.CTkEntry(
+                self.entry_frame, placeholder_text="Amount from", width=120)
+            self.entry_min_amount.grid(row=0, column=2, padx=2, pady=2)
+
+            self.entry_max_amount = customtkinter.CTkEntry(
+                self.entry_frame, placeholder_text="Amount under", width=120)
+            self.entry_max_amount.grid(row=0, column=3, padx=2, pady=2)
+
+            self.from_date_entries = self.create_date_entries(
+                self.entry_frame, "From", column=0)
+            self.to_date_entries = self.create_date_entries(
+                self.entry_frame, "To", column=2)
+
+            self.preview_label = customtkinter.CTkLabel(
+                self.entry_frame, text="", text_color="black")
+            self.preview_label.grid(row=0, column=4, rowspan=2, padx=5,
+                                    pady=2, sticky="w")
+
+            for entry in [self.search_entry, self.entry_min_amount,
+                          self.entry_max_amount] + \
+                    self.from_date_entries + self.to_date_entries:
+                entry.bind("<KeyRelease>",
+                           lambda event: self.on_criteria_changed())
+
+            self.on_criteria_changed()
+
+    def create_date_entries(self, master, label, column):
+        date_frame = customtkinter.CTkFrame(
+            master=master,
+            fg_color="transparent"
+        )
+        date_frame.grid(row=1, column=column, columnspan=2, padx=2, pady=2,
+                        sticky="w")
+
+        date_label = customtkinter.CTkLabel(
+            master=date_frame, text=label, text_color="black", width=40)
+        date_label.grid(row=0, column=0, padx=2, pady=0)
+
+        entries = []
+        for i, placeholder in enumerate(["Day", "Month", "Year"]):
+            entry = customtkinter.CTkEntry(
+                master=date_frame, placeholder_text=placeholder, width=60)
+            entry.grid(row=0, column=i + 1, padx=2, pady=0)
+            entries.append(entry)
+        return entries
+
+    def on_criteria_changed(self):
+        if self.criteria_change_event is not None:
+            self.criteria_change_event()
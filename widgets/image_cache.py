@@ -0,0 +1,29 @@
+import customtkinter
+from PIL import Image
+
+
+class ImageCache:
+    IMAGE_DIRECTORY = "./resources/images/"
+
+    _sources = {}
+    _images = {}
+
+    @classmethod
+    def get_source(cls, name):
+        if name not in cls._sources:
+            with Image.open(cls.IMAGE_DIRECTORY + name) as image:
+                image.load()
+                cls._sources[name] = image.copy()
+        return cls._sources[name]
+
+    @classmethod
+    def get_image(cls, name, size=(20, 20), dark_name=None):
+        key = (name, dark_name, size)
+        if key not in cls._images:
+            dark_image = None
+            if dark_name is not None:
+                dark_image = cls.get_source(dark_name)
+            cls._images[key] = customtkinter.CTkImage(
+                light_image=cls.get_source(name), dark_image=dark_image,
+                size=size)
+        return cls._images[key]
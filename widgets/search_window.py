@@ -2,16 +2,22 @@ from tkinter import ttk, messagebox
 import customtkinter
 from sys import platform
 import datetime
+import math
 
 from enums.month_label_enum import MonthLabel
-from models.gold_transaction_model import GoldTransaction
-from models.currency_transaction_model import CurrencyTransaction
+from enums.transaction_type_enum import TransactionType
+from models.query_result_model import QueryResult
+from models.transaction_query_model import TransactionQuery
 from widgets.header_frame_for_window import HeaderFrameForWindow
+from widgets.virtual_treeview import VirtualTreeview
 
 
 class SearchWindow(customtkinter.CTkToplevel):
+    PREVIEW_DELAY = 300
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
+        self.preview_job = None
         self.title("Transaction Management - SEARCH")
         self.iconbitmap(default='./resources/images/logo.ico')
         self.minsize(1720, 960)
@@ -23,20 +29,49 @@ class SearchWindow(customtkinter.CTkToplevel):
             self.after(200, lambda: self.iconbitmap(
                 "./resources/images/logo.ico"))
 
-        self.transactions = \
-            self.master.master.transaction_list.get_transactions()
+        self.transaction_list = self.master.master.transaction_list
 
     def create_widget(self):
         self.header_frame_for_search_window = HeaderFrameForWindow(
             master=self, label_header="SEARCH",
             submit_event=lambda: self.submit_event(),
             show_submit=False,
-            show_search_bar=True
+            show_search_bar=True,
+            criteria_change_event=self.schedule_preview
         )
         self.header_frame_for_search_window.pack(padx=10, pady=10, fill="x")
 
         self.create_search_result_frame()
 
+    def destroy(self):
+        if self.preview_job is not None:
+            self.after_cancel(self.preview_job)
+            self.preview_job = None
+        super().destroy()
+
+    def schedule_preview(self):
+        # Typing restarts the delay, so the count runs once the user pauses.
+        if self.preview_job is not None:
+            self.after_cancel(self.preview_job)
+        self.preview_job = self.after(self.PREVIEW_DELAY, self.update_preview)
+
+    def update_preview(self):
+        self.preview_job = None
+        if self.header_frame_for_search_window.optionmenu.get() != \
+                "Combined":
+            return
+
+        query, error = self.get_combined_query()
+        if query is None:
+            text = error
+        else:
+            # The count runs the real query, so submitting the same
+            # criteria afterwards is served from the query cache.
+            count = len(self.transaction_list.run_query(query))
+            text = f"{count} matching transactions"
+        self.header_frame_for_search_window.preview_label.configure(
+            text=text)
+
     def create_search_result_frame(self):
         self.result_frame = customtkinter.CTkScrollableFrame(
             self, fg_color="#dbdbdb", bg_color="#ffffff",
@@ -49,14 +84,23 @@ class SearchWindow(customtkinter.CTkToplevel):
 
         choice = self.header_frame_for_search_window.optionmenu.get()
 
-        for widget in self. \
-                header_frame_for_search_window.entry_frame.winfo_children():
-            if isinstance(widget, customtkinter.CTkEntry):
-                if not widget.get():
-                    messagebox.showerror(
-                        "Missing Input", "Please fill in all fields.")
-                    self.after(10, self.lift)
-                    return
+        if choice == "Combined":
+            query, error = self.get_combined_query()
+            if query is None:
+                messagebox.showerror("Invalid Input", error)
+                self.after(10, self.lift)
+                return
+        else:
+            # Combined criteria are all optional; other modes need every
+            # field filled in.
+            for widget in self.header_frame_for_search_window. \
+                    entry_frame.winfo_children():
+                if isinstance(widget, customtkinter.CTkEntry):
+                    if not widget.get():
+                        messagebox.showerror(
+                            "Missing Input", "Please fill in all fields.")
+                        self.after(10, self.lift)
+                        return
 
         if choice == "Date":
             day = self.header_frame_for_search_window.entry_day.get()
@@ -73,8 +117,8 @@ class SearchWindow(customtkinter.CTkToplevel):
                 self.after(10, self.lift)
                 return
 
-        transactions_search = self.search_transactions(choice)
-        self.total_transactions = len(transactions_search)
+        search_result = self.search_transactions(choice)
+        self.total_transactions = len(search_result)
 
         search_result_label = customtkinter.CTkLabel(
             self.result_frame,
@@ -94,7 +138,7 @@ class SearchWindow(customtkinter.CTkToplevel):
         separator.pack(padx=10, pady=(10, 20), fill="x")
 
         self.create_content_treeview_search_result(
-            self.result_frame, transactions_search)
+            self.result_frame, search_result)
 
     def validate_date(self, day, month, year):
         try:
@@ -121,40 +165,77 @@ class SearchWindow(customtkinter.CTkToplevel):
         return True
 
     def search_transactions(self, choice):
+        query = self.get_search_query(choice)
+        if query is None:
+            return QueryResult([])
+        return self.transaction_list.run_query(query)
+
+    def get_search_query(self, choice):
         if choice == "Code":
             search_text = \
                 self.header_frame_for_search_window.search_entry.get().upper()
-            return [transaction for transaction in self.transactions
-                    if search_text in transaction._id]
+            return TransactionQuery(id_pattern=search_text)
         elif choice == "Date":
-            day = int(self.header_frame_for_search_window.entry_day.get())
-            month = int(self.header_frame_for_search_window._entry_month.get())
-            year = int(self.header_frame_for_search_window.entry_year.get())
-            search_text = f"{day}/{month}/{year}"
-            return [transaction for transaction in self.transactions
-                    if transaction._day == day and transaction._month == month
-                    and transaction._year == year]
+            date = datetime.date(
+                int(self.header_frame_for_search_window.entry_year.get()),
+                int(self.header_frame_for_search_window._entry_month.get()),
+                int(self.header_frame_for_search_window.entry_day.get()))
+            return TransactionQuery(start_date=date, end_date=date)
         elif choice == "Type":
             search_text = \
                 self.header_frame_for_search_window.search_entry.get().upper()
             if search_text == "GOLD":
-                return [transaction for transaction in self.transactions
-                        if isinstance(transaction, GoldTransaction)]
+                return TransactionQuery(transaction_type=TransactionType.GOLD)
             elif search_text == "CURRENCY":
-                return [transaction for transaction in self.transactions
-                        if isinstance(transaction, CurrencyTransaction)]
-            else:
-                return []
-        else:
-            return []
-
-    def create_content_treeview_search_result(self, frame, transactions):
-        gold_transactions = [transaction for transaction in transactions
-                             if isinstance(
-                                 transaction, GoldTransaction)]
-        currency_transactions = [transaction for transaction in transactions
-                                 if isinstance(
-                                     transaction, CurrencyTransaction)]
+                return TransactionQuery(
+                    transaction_type=TransactionType.CURRENCY)
+        elif choice == "Combined":
+            return self.get_combined_query()[0]
+        return None
+
+    def get_combined_query(self):
+        header = self.header_frame_for_search_window
+        criteria = {}
+
+        search_text = header.search_entry.get().strip().upper()
+        if search_text:
+            criteria["id_pattern"] = search_text
+
+        for name, entries in [("start_date", header.from_date_entries),
+                              ("end_date", header.to_date_entries)]:
+            day, month, year = [entry.get().strip() for entry in entries]
+            if not day and not month and not year:
+                continue
+            if not self.validate_date(day, month, year):
+                return None, "Please enter a valid date."
+            criteria[name] = datetime.date(int(year), int(month), int(day))
+
+        type_choice = header.type_optionmenu.get()
+        if type_choice == "Gold":
+            criteria["transaction_type"] = TransactionType.GOLD
+        elif type_choice == "Currency":
+            criteria["transaction_type"] = TransactionType.CURRENCY
+
+        for name, entry in [("min_amount", header.entry_min_amount),
+                            ("max_amount", header.entry_max_amount)]:
+            amount = entry.get().strip().replace(",", "")
+            if not amount:
+                continue
+            try:
+                amount = float(amount)
+            except ValueError:
+                return None, "Please enter a valid amount."
+            if not math.isfinite(amount):
+                return None, "Please enter a valid amount."
+            criteria[name] = amount
+
+        return TransactionQuery(**criteria), None
+
+    def create_content_treeview_search_result(self, frame, result):
+        gold_transactions = result.get_transactions(TransactionType.GOLD)
+        currency_transactions = result.get_transactions(
+            TransactionType.CURRENCY)
+        aggregate = result.get_aggregate()
 
         frame_gold = customtkinter.CTkFrame(
             frame, fg_color="#ffffff",
@@ -164,7 +245,8 @@ class SearchWindow(customtkinter.CTkToplevel):
         if gold_transactions:
             treeview_gold_transaction \
                 = self.create_gold_treeview_search_result(
-                    frame_gold, gold_transactions)
+                    frame_gold,
+                    aggregate.get_total_amount(TransactionType.GOLD))
             self.populate_treeview_with_gold_search_result(
                 treeview_gold_transaction, gold_transactions)
             treeview_gold_transaction.pack(padx=20, pady=(10, 20), fill="x")
@@ -179,7 +261,8 @@ class SearchWindow(customtkinter.CTkToplevel):
         if currency_transactions:
             treeview_currency_transaction \
                 = self.create_currency_treeview_search_result(
-                    frame_currency, currency_transactions)
+                    frame_currency,
+                    aggregate.get_total_amount(TransactionType.CURRENCY))
             self.populate_treeview_with_currency_search_result(
                 treeview_currency_transaction, currency_transactions)
             treeview_currency_transaction.pack(
@@ -230,16 +313,8 @@ class SearchWindow(customtkinter.CTkToplevel):
         frame_header.columnconfigure(0, weight=1)
         frame_header.columnconfigure(1, weight=1)
 
-    def calculate_total_amount_search_result(self, transactions):
-        total_amount = 0
-        for transaction in transactions:
-            total_amount += transaction._total_amount
-        return total_amount
-
     def create_gold_treeview_search_result(self, frame,
-                                           gold_transactions):
-        total_amount_gold = self.calculate_total_amount_search_result(
-            gold_transactions)
+                                           total_amount_gold):
         formatted_total_amount_gold = self.format_price_number(
             total_amount_gold)
         self.create_header_transaction_treeview(
@@ -250,7 +325,7 @@ class SearchWindow(customtkinter.CTkToplevel):
             "Treeview.Heading", font=("Arial", 10, "bold"))
         treeview_style.configure("Treeview", rowheight=25)
 
-        treeview = ttk.Treeview(frame, columns=(
+        treeview = VirtualTreeview(frame, columns=(
             "Transaction Code",
             "Transaction Date",
             "Unit Price (VND/tael)",
@@ -271,10 +346,7 @@ class SearchWindow(customtkinter.CTkToplevel):
         return treeview
 
     def create_currency_treeview_search_result(self, frame,
-                                               currency_transactions
-                                               ):
-        total_amount_currency = self.calculate_total_amount_search_result(
-            currency_transactions)
+                                               total_amount_currency):
         formatted_total_amount_currency = self.format_price_number(
             total_amount_currency)
         self.create_header_transaction_treeview(
@@ -285,7 +357,7 @@ class SearchWindow(customtkinter.CTkToplevel):
             "Treeview.Heading", font=("Arial", 10, "bold"))
         treeview_style.configure("Treeview", rowheight=25)
 
-        treeview = ttk.Treeview(frame, columns=(
+        treeview = VirtualTreeview(frame, columns=(
             "Transaction Code",
             "Transaction Date",
             "Quantity",
@@ -304,48 +376,50 @@ class SearchWindow(customtkinter.CTkToplevel):
                          text="Total Amount (VND)", anchor="w")
         return treeview
 
+    def get_gold_row_values(self, transaction):
+        transaction_date = "{} {} {}".format(
+            transaction._day, MonthLabel(transaction._month),
+            transaction._year)
+        formatted_unit_price = self.format_price_number(
+            transaction._unit_price)
+        formatted_total_amount = self.format_price_number(
+            transaction._total_amount)
+        return (
+            transaction._id,
+            transaction_date,
+            formatted_unit_price,
+            transaction._quantity,
+            transaction._gold_type.name,
+            formatted_total_amount
+        )
+
     def populate_treeview_with_gold_search_result(self, treeview, transactions
                                                   ):
-        for transaction in transactions:
-            if isinstance(transaction, GoldTransaction):
-                transaction_date = "{} {} {}".format(
-                    transaction._day, MonthLabel(transaction._month),
-                    transaction._year)
-                formatted_unit_price = self.format_price_number(
-                    transaction._unit_price)
-                formatted_total_amount = self.format_price_number(
-                    transaction._total_amount)
-                treeview.insert("", "end", values=(
-                    transaction._id,
-                    transaction_date,
-                    formatted_unit_price,
-                    transaction._quantity,
-                    transaction._gold_type.name,
-                    formatted_total_amount
-                ))
+        treeview.set_rows(transactions, self.get_gold_row_values)
+
+    def get_currency_row_values(self, transaction):
+        transaction_date = "{} {} {}".format(
+            transaction._day, MonthLabel(transaction._month),
+            transaction._year)
+        formatted_quantity = self.format_price_number(
+            transaction._quantity)
+        formatted_exchange_rate = self.format_price_number(
+            transaction._exchange_rate._rate)
+        formatted_total_amount = self.format_price_number(
+            transaction._total_amount)
+        return (
+            transaction._id,
+            transaction_date,
+            formatted_quantity,
+            transaction._currency_type.name,
+            formatted_exchange_rate,
+            formatted_total_amount
+        )
 
     def populate_treeview_with_currency_search_result(self,
                                                       treeview,
                                                       transactions):
-        for transaction in transactions:
-            if isinstance(transaction, CurrencyTransaction):
-                transaction_date = "{} {} {}".format(
-                    transaction._day, MonthLabel(transaction._month),
-                    transaction._year)
-                formatted_quantity = self.format_price_number(
-                    transaction._quantity)
-                formatted_exchange_rate = self.format_price_number(
-                    transaction._exchange_rate._rate)
-                formatted_total_amount = self.format_price_number(
-                    transaction._total_amount)
-                treeview.insert("", "end", values=(
-                    transaction._id,
-                    transaction_date,
-                    formatted_quantity,
-                    transaction._currency_type.name,
-                    formatted_exchange_rate,
-                    formatted_total_amount
-                ))
+        treeview.set_rows(transactions, self.get_currency_row_values)
 
     def format_price_number(self, total_amount):
         if '.' in str(total_amount):
@@ -2,8 +2,7 @@ import customtkinter
 from sys import platform
 import datetime
 
-from models.gold_transaction_model import GoldTransaction
-from models.currency_transaction_model import CurrencyTransaction
+from enums.transaction_type_enum import TransactionType
 
 
 class StatisticsDetailsMonthWindow(customtkinter.CTkToplevel):
@@ -137,23 +136,14 @@ class StatisticsDetailsMonthWindow(customtkinter.CTkToplevel):
         return formatted_total_amount
 
     def calculate_weekly_totals(self, weeks):
+        period_totals = \
+            self.parent.transaction_list.get_period_totals(weeks)
+
         week_totals = []
-        for start, end in weeks:
-            gold_total = sum(transaction._total_amount
-                             for transaction in self.transactions
-                             if isinstance(transaction, GoldTransaction)
-                             and start <= datetime.date(transaction._year,
-                                                        transaction._month,
-                                                        transaction._day) <=
-                             end)
-            currency_total = sum(transaction._total_amount
-                                 for transaction in self.transactions
-                                 if isinstance(transaction,
-                                               CurrencyTransaction)
-                                 and
-                                 start <= datetime.date(transaction._year,
-                                                        transaction._month,
-                                                        transaction._day) <=
-                                 end)
+        for i in range(len(weeks)):
+            gold_total = period_totals.get_total_amount(
+                i, TransactionType.GOLD)
+            currency_total = period_totals.get_total_amount(
+                i, TransactionType.CURRENCY)
             week_totals.append((gold_total, currency_total))
         return week_totals
@@ -2,8 +2,7 @@ import customtkinter
 from sys import platform
 import datetime
 
-from models.gold_transaction_model import GoldTransaction
-from models.currency_transaction_model import CurrencyTransaction
+from enums.transaction_type_enum import TransactionType
 
 
 class StatisticsDetailsWeekWindow(customtkinter.CTkToplevel):
@@ -49,20 +48,8 @@ class StatisticsDetailsWeekWindow(customtkinter.CTkToplevel):
         date_statistics_chart.grid(row=0, column=0, columnspan=2,
                                    padx=10, pady=10, sticky="ew")
 
-        current_date = datetime.datetime.now().date()
-
-        start_of_week = current_date - \
-            datetime.timedelta(days=current_date.weekday())
-        end_of_week = start_of_week + datetime.timedelta(days=6)
-
-        transactions_this_week = [
-            txn for txn in self.transactions
-            if start_of_week <=
-            datetime.date(txn._year, txn._month, txn._day) <= end_of_week
-        ]
-
-        gold_daily_totals, currency_daily_totals = self.calculate_daily_totals(
-            transactions_this_week)
+        gold_daily_totals, currency_daily_totals = \
+            self.calculate_daily_totals(datetime.datetime.now().date())
 
         for i, ((gold_date, gold_total), (currency_date, currency_total)) \
                 in enumerate(zip(gold_daily_totals.items(),
@@ -150,31 +137,18 @@ class StatisticsDetailsWeekWindow(customtkinter.CTkToplevel):
         currency_total_amount_value.grid(
             row=0, column=1, sticky="e", padx=0, pady=0)
 
-    def calculate_daily_totals(self, transactions):
+    def calculate_daily_totals(self, date):
+        days = self.parent.get_days_of_week(date)
+        period_totals = self.parent.transaction_list.get_period_totals(
+            days, *self.parent.get_week_range(date))
+
         gold_daily_totals = {}
         currency_daily_totals = {}
-
-        current_date = datetime.datetime.now().date()
-
-        start_of_week = current_date - \
-            datetime.timedelta(days=current_date.weekday())
-        end_of_week = start_of_week + datetime.timedelta(days=6)
-
-        for i in range(7):
-            date = start_of_week + datetime.timedelta(days=i)
-            gold_daily_totals[date] = 0
-            currency_daily_totals[date] = 0
-
-        for transaction in transactions:
-            transaction_date = datetime.date(
-                transaction._year, transaction._month, transaction._day)
-            if start_of_week <= transaction_date <= end_of_week:
-                if isinstance(transaction, GoldTransaction):
-                    gold_daily_totals[transaction_date] += \
-                        transaction._total_amount
-                elif isinstance(transaction, CurrencyTransaction):
-                    currency_daily_totals[transaction_date] += \
-                        transaction._total_amount
+        for i, (date, _) in enumerate(days):
+            gold_daily_totals[date] = period_totals.get_total_amount(
+                i, TransactionType.GOLD)
+            currency_daily_totals[date] = period_totals.get_total_amount(
+                i, TransactionType.CURRENCY)
 
         return gold_daily_totals, currency_daily_totals
 
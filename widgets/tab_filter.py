@@ -2,12 +2,14 @@ from tkinter import ttk
 import customtkinter
 import datetime
 
-from models.gold_transaction_model import GoldTransaction
-from models.currency_transaction_model import CurrencyTransaction
+from enums.transaction_type_enum import TransactionType
+from models.transaction_query_model import TransactionQuery
 from widgets.tab_group_by_sort_by import TabGroupBySortBy
 
 
 class TabFilter(customtkinter.CTkTabview):
+    PREBUILD_DELAY = 200
+
     def __init__(self, master, **kwargs):
         super().__init__(master, **kwargs)
         self.configure(fg_color="#ffffff", bg_color="#f2f2f2",
@@ -18,51 +20,116 @@ class TabFilter(customtkinter.CTkTabview):
         self.tab_future = self.add("FUTURE")
         self.tab_view_all = self.add("VIEW ALL")
 
+        self.tab_builders = {
+            "LAST MONTH": self.create_last_month_widgets,
+            "THIS MONTH": self.create_this_month_widgets,
+            "FUTURE": self.create_future_widgets,
+            "VIEW ALL": self.create_view_all_widgets
+        }
+        self.built_tabs = set()
+        self.total_labels = {}
+        self.tab_views = {}
+        self.prebuild_job = None
+
         self.set("THIS MONTH")
-        self.configure(corner_radius=5)
+        self.configure(corner_radius=5, command=self.on_tab_selected)
 
         self.create_tab_filter_widgets()
 
     def create_tab_filter_widgets(self):
-        last_month_transactions = self.get_transactions_last_month()
-        this_month_transactions = self.get_transactions_this_month()
-        future_transactions = self.get_transactions_future()
-        all_transactions = self.get_transactions_all()
-
-        self.create_tab_with_total_frames(
-            self.tab_last_month, last_month_transactions)
-        self.create_tab_with_total_frames(
-            self.tab_this_month, this_month_transactions)
-        self.create_tab_with_total_frames(
-            self.tab_future, future_transactions)
-        self.create_tab_with_total_frames(
-            self.tab_view_all, all_transactions)
-
-        self.tab_group_by_sort_by_last_month = TabGroupBySortBy(
-            master=self.tab_last_month, transactions=last_month_transactions)
-        self.tab_group_by_sort_by_last_month.pack(
-            padx=10, pady=(0, 10), fill="x")
-        self.tab_group_by_sort_by_this_month = TabGroupBySortBy(
-            master=self.tab_this_month, transactions=this_month_transactions)
-        self.tab_group_by_sort_by_this_month.pack(
-            padx=10, pady=(0, 10), fill="x")
-        self.tab_group_by_sort_by_future = TabGroupBySortBy(
-            master=self.tab_future, transactions=future_transactions)
-        self.tab_group_by_sort_by_future.pack(padx=10, pady=(0, 10), fill="x")
-        self.tab_group_by_sort_by_view_all = TabGroupBySortBy(
-            master=self.tab_view_all, transactions=all_transactions)
-        self.tab_group_by_sort_by_view_all.pack(
-            padx=10, pady=(0, 10), fill="x")
-
-    def create_tab_with_total_frames(self, tab, transactions):
+        # Only the visible tab is built up front. The others are built when
+        # first selected, or one at a time once the window is idle.
+        self.build_tab(self.get())
+        self.prebuild_job = self.after(self.PREBUILD_DELAY,
+                                       self.prebuild_next_tab)
+
+    def on_tab_selected(self):
+        self.build_tab(self.get())
+
+    def build_tab(self, name):
+        if name not in self.built_tabs:
+            self.built_tabs.add(name)
+            self.tab_builders[name]()
+
+    def prebuild_next_tab(self):
+        self.prebuild_job = None
+        for name in self.tab_builders:
+            if name not in self.built_tabs:
+                self.build_tab(name)
+                self.prebuild_job = self.after(self.PREBUILD_DELAY,
+                                               self.prebuild_next_tab)
+                return
+
+    def destroy(self):
+        if self.prebuild_job is not None:
+            self.after_cancel(self.prebuild_job)
+            self.prebuild_job = None
+        super().destroy()
+
+    def create_last_month_widgets(self):
+        self.create_tab_widgets("LAST MONTH", self.tab_last_month)
+
+    def create_this_month_widgets(self):
+        self.create_tab_widgets("THIS MONTH", self.tab_this_month)
+
+    def create_future_widgets(self):
+        self.create_tab_widgets("FUTURE", self.tab_future)
+
+    def create_view_all_widgets(self):
+        self.create_tab_widgets("VIEW ALL", self.tab_view_all)
+
+    def get_tab_data(self, name):
+        transaction_list = self.master.transaction_list
+        aggregate = transaction_list.get_aggregate()
+        if name == "LAST MONTH":
+            return (self.get_last_month_query(), aggregate,
+                    self.get_last_month_period())
+        if name == "THIS MONTH":
+            return (self.get_this_month_query(), aggregate,
+                    self.get_this_month_period())
+        if name == "FUTURE":
+            future_query = self.get_future_query()
+            return (future_query,
+                    transaction_list.run_query(future_query).get_aggregate(),
+                    None)
+        return TransactionQuery(), aggregate, None
+
+    def create_tab_widgets(self, name, tab):
+        query, aggregate, period = self.get_tab_data(name)
+        self.total_labels[name] = self.create_tab_with_total_frames(
+            tab, aggregate, period)
+
+        self.tab_views[name] = TabGroupBySortBy(master=tab, query=query)
+        self.tab_views[name].pack(padx=10, pady=(0, 10), fill="x")
+
+    def refresh(self):
+        # A saved change updates the tabs already built in place, so their
+        # pages, views and scroll positions are kept.
+        for name in self.built_tabs:
+            _, aggregate, period = self.get_tab_data(name)
+            self.update_total_labels(self.total_labels[name], aggregate,
+                                     period)
+            self.tab_views[name].refresh()
+
+    def create_tab_with_total_frames(self, tab, aggregate, period=None):
         total_frame = customtkinter.CTkFrame(
             master=tab, fg_color="transparent")
         total_frame.pack(side="top", fill="x")
 
-        self.create_total_transaction_frame(total_frame, transactions)
-        self.create_total_amount_frame(total_frame, transactions)
+        labels = (
+            self.create_total_transaction_frame(total_frame),
+            self.create_total_amount_frame(total_frame)
+        )
+        self.update_total_labels(labels, aggregate, period)
+        return labels
 
-    def create_total_amount_frame(self, tab, transactions):
+    def update_total_labels(self, labels, aggregate, period=None):
+        transaction_labels, amount_labels = labels
+        self.update_total_transaction_labels(
+            transaction_labels, aggregate, period)
+        self.update_total_amount_labels(amount_labels, aggregate, period)
+
+    def create_total_amount_frame(self, tab):
         total_total_amount_frame = customtkinter.CTkFrame(
             master=tab,
             fg_color="#eaeaea",
@@ -81,22 +148,9 @@ class TabFilter(customtkinter.CTkTabview):
         )
         total_total_amount_title.pack(padx=20, pady=(10, 5), anchor="w")
 
-        gold_total_amount = sum(
-            transaction._total_amount for transaction
-            in transactions if isinstance(transaction, GoldTransaction)
-        )
-        formatted_gold_total_amount = self.format_price_number(
-            gold_total_amount)
-        currency_total_amount = sum(
-            transaction._total_amount for transaction
-            in transactions if isinstance(transaction, CurrencyTransaction)
-        )
-        formatted_currency_total_amount = self.format_price_number(
-            currency_total_amount)
-
         gold_label = customtkinter.CTkLabel(
             master=total_total_amount_frame,
-            text=f"Gold: {formatted_gold_total_amount:>61}",
+            text="",
             font=("Arial", 14),
             text_color="black",
             anchor="w"
@@ -105,7 +159,7 @@ class TabFilter(customtkinter.CTkTabview):
 
         currency_label = customtkinter.CTkLabel(
             master=total_total_amount_frame,
-            text=f"Currency: {formatted_currency_total_amount:>54}",
+            text="",
             font=("Arial", 14),
             text_color="black",
             anchor="w"
@@ -116,19 +170,40 @@ class TabFilter(customtkinter.CTkTabview):
             total_total_amount_frame, orient="horizontal")
         separator.pack(fill="x", padx=10, pady=5)
 
-        grand_total = gold_total_amount + currency_total_amount
-        formatted_grand_total = self.format_price_number(
-            grand_total)
         grand_total_label = customtkinter.CTkLabel(
             master=total_total_amount_frame,
-            text=f"Grand Total: {formatted_grand_total:>50}",
+            text="",
             font=("Arial", 14),
             text_color="black",
             anchor="w"
         )
         grand_total_label.pack(padx=40, pady=(5, 10), anchor="w")
 
-    def create_total_transaction_frame(self, tab, transactions):
+        return gold_label, currency_label, grand_total_label
+
+    def update_total_amount_labels(self, labels, aggregate, period=None):
+        gold_label, currency_label, grand_total_label = labels
+
+        gold_total_amount = aggregate.get_total_amount(
+            TransactionType.GOLD, period=period)
+        formatted_gold_total_amount = self.format_price_number(
+            gold_total_amount)
+        currency_total_amount = aggregate.get_total_amount(
+            TransactionType.CURRENCY, period=period)
+        formatted_currency_total_amount = self.format_price_number(
+            currency_total_amount)
+        grand_total = gold_total_amount + currency_total_amount
+        formatted_grand_total = self.format_price_number(
+            grand_total)
+
+        gold_label.configure(
+            text=f"Gold: {formatted_gold_total_amount:>61}")
+        currency_label.configure(
+            text=f"Currency: {formatted_currency_total_amount:>54}")
+        grand_total_label.configure(
+            text=f"Grand Total: {formatted_grand_total:>50}")
+
+    def create_total_transaction_frame(self, tab):
         total_transaction_frame = customtkinter.CTkFrame(
             master=tab,
             fg_color="#eaeaea",
@@ -147,20 +222,9 @@ class TabFilter(customtkinter.CTkTabview):
         )
         total_transaction_title.pack(padx=20, pady=(10, 5), anchor="w")
 
-        gold_transaction = sum(
-            1 for transaction in transactions if isinstance(transaction,
-                                                            GoldTransaction)
-        )
-
-        currency_transaction = sum(
-            1 for transaction in transactions
-            if isinstance(transaction,
-                          CurrencyTransaction)
-        )
-
         gold_label = customtkinter.CTkLabel(
             master=total_transaction_frame,
-            text=f"Gold: {gold_transaction:>61}",
+            text="",
             font=("Arial", 14),
             text_color="black",
             anchor="w"
@@ -169,7 +233,7 @@ class TabFilter(customtkinter.CTkTabview):
 
         currency_label = customtkinter.CTkLabel(
             master=total_transaction_frame,
-            text=f"Currency: {currency_transaction:>54}",
+            text="",
             font=("Arial", 14),
             text_color="black",
             anchor="w"
@@ -180,56 +244,58 @@ class TabFilter(customtkinter.CTkTabview):
             total_transaction_frame, orient="horizontal")
         separator.pack(fill="x", padx=10, pady=5)
 
-        grand_total = gold_transaction + currency_transaction
         grand_total_label = customtkinter.CTkLabel(
             master=total_transaction_frame,
-            text=f"Grand Total: {grand_total:>50}",
+            text="",
             font=("Arial", 14),
             text_color="black",
             anchor="w"
         )
         grand_total_label.pack(padx=40, pady=(5, 10), anchor="w")
 
-    def get_transactions_last_month(self):
+        return gold_label, currency_label, grand_total_label
+
+    def update_total_transaction_labels(self, labels, aggregate,
+                                        period=None):
+        gold_label, currency_label, grand_total_label = labels
+
+        gold_transaction = aggregate.get_count(
+            TransactionType.GOLD, period=period)
+        currency_transaction = aggregate.get_count(
+            TransactionType.CURRENCY, period=period)
+        grand_total = gold_transaction + currency_transaction
+
+        gold_label.configure(text=f"Gold: {gold_transaction:>61}")
+        currency_label.configure(text=f"Currency: {currency_transaction:>54}")
+        grand_total_label.configure(text=f"Grand Total: {grand_total:>50}")
+
+    def get_last_month_period(self):
         today = datetime.datetime.now()
         if today.month == 1:
-            last_month = 12
-            last_month_year = today.year - 1
-        else:
-            last_month = today.month - 1
-            last_month_year = today.year
-        return self.get_transactions_by_month_year(last_month, last_month_year)
+            return (today.year - 1, 12)
+        return (today.year, today.month - 1)
 
-    def get_transactions_this_month(self):
+    def get_this_month_period(self):
         today = datetime.datetime.now()
-        return self.get_transactions_by_month_year(today.month, today.year)
+        return (today.year, today.month)
 
-    def get_transactions_future(self):
-        today = datetime.datetime.now()
-        future_transactions = []
-        for transaction in self.master.transaction_list.get_transactions():
-            if (
-                transaction._year > today.year
-                or (transaction._year == today.year and
-                    transaction._month > today.month)
-                or (
-                    transaction._year == today.year
-                    and transaction._month == today.month
-                    and transaction._day > today.day
-                )
-            ):
-                future_transactions.append(transaction)
-        return future_transactions
-
-    def get_transactions_all(self):
-        return self.master.transaction_list.get_transactions()
-
-    def get_transactions_by_month_year(self, month, year):
-        transactions_month_year = []
-        for transaction in self.master.transaction_list.get_transactions():
-            if transaction._month == month and transaction._year == year:
-                transactions_month_year.append(transaction)
-        return transactions_month_year
+    def get_last_month_query(self):
+        last_month_year, last_month = self.get_last_month_period()
+        return self.get_month_query(last_month, last_month_year)
+
+    def get_this_month_query(self):
+        this_month_year, this_month = self.get_this_month_period()
+        return self.get_month_query(this_month, this_month_year)
+
+    def get_future_query(self):
+        tomorrow = datetime.date.today() + datetime.timedelta(days=1)
+        return TransactionQuery(start_date=tomorrow)
+
+    def get_month_query(self, month, year):
+        start_date = datetime.date(year, month, 1)
+        end_date = (start_date + datetime.timedelta(days=32)).replace(
+            day=1) - datetime.timedelta(days=1)
+        return TransactionQuery(start_date=start_date, end_date=end_date)
 
     def format_price_number(self, total_amount):
         if '.' in str(total_amount):
@@ -1,6 +1,5 @@
 from tkinter import ttk, messagebox
 import customtkinter
-from PIL import Image
 import datetime
 
 from enum import Enum
@@ -19,6 +18,8 @@ from widgets.delete_gold_transaction_window \
     import DeleteGoldTransactionWindow
 from widgets.delete_currency_transaction_window \
     import DeleteCurrencyTransactionWindow
+from widgets.image_cache import ImageCache
+from widgets.virtual_treeview import VirtualTreeview
 
 
 class TabGroupBySortByType(Enum):
@@ -29,9 +30,12 @@ class TabGroupBySortByType(Enum):
 
 
 class TabGroupBySortBy(customtkinter.CTkTabview):
-    def __init__(self, master, transactions, **kwargs):
+    def __init__(self, master, query, **kwargs):
         super().__init__(master, **kwargs)
-        self.transactions = transactions
+        self.query = query
+        transaction_list = self.master.master.master.transaction_list
+        self.transactions = transaction_list.find(query)
+        self.transaction_ordering = transaction_list.get_ordering(query)
         self.configure(fg_color="#dbdbdb", bg_color="#ffffff")
 
         self.tab_group_by = self.add("GROUP BY")
@@ -43,8 +47,11 @@ class TabGroupBySortBy(customtkinter.CTkTabview):
         self.option_segmented_button_date = True
         self.option_segmented_button_total_amount = True
 
-        self.gold_treeviews = {}
-        self.currency_treeviews = {}
+        self.date_group_slots = []
+        self.date_sort_by_slots = []
+        self.gold_total_amount_slots = []
+        self.currency_total_amount_slots = []
+        self.treeview_rows = {}
 
         self.items_per_page = 10
         self.current_page = 0
@@ -56,6 +63,10 @@ class TabGroupBySortBy(customtkinter.CTkTabview):
         self.sort_by_option = "Date"
         self.sort_by_order = "Descending"
 
+        self.page_cursors = (None, None)
+        self.date_sort_by_page_cursors = (None, None)
+        self.total_amount_sort_by_page_cursors = (None, None)
+
         self.pagination_frame = None
         self.pagination_frame_for_sort_by = None
 
@@ -122,116 +133,127 @@ class TabGroupBySortBy(customtkinter.CTkTabview):
             text=f"Page {self.current_page + 1} of {self.total_pages}")
         self.pagination_label.pack(side="left", expand=True)
 
-    def get_paginated_transactions_by_date(self):
-        sorted_transactions_by_date = self.sort_transactions_by_date(
-            self.transactions)
-        start = self.current_page * self.items_per_page
-        end = start + self.items_per_page
-        return sorted_transactions_by_date[start:end]
-
-    def get_paginated_transactions_sort_by_date(self):
-        sorted_transactions_by_date = self.sort_transactions_by_date(
-            self.transactions, sort_type=self.option_segmented_button_date)
-        start = self.sort_by_current_page * self.items_per_page
-        end = start + self.items_per_page
-        return sorted_transactions_by_date[start:end]
-
-    def get_paginated_transactions_sort_by_total_amount(self):
-        sorted_transactions_by_total_amount = \
-            self.sort_transactions_by_total_amount(
-                self.transactions,
-                sort_type=self.option_segmented_button_total_amount)
-        start = self.sort_by_current_page * self.items_per_page
-        end = start + self.items_per_page
-        return sorted_transactions_by_total_amount[start:end]
-
-    def sort_transactions_by_date(self, transactions, sort_type=True):
-        return sorted(transactions, key=lambda x: (x._year, x._month, x._day),
-                      reverse=sort_type)
-
-    def sort_transactions_by_total_amount(self, transactions, sort_type=True):
-        return sorted(transactions, key=lambda x: x._total_amount,
-                      reverse=sort_type)
-
-    def update_page(self):
-        self.date_frame.pack_forget()
-        self.date_frame.destroy()
+    def get_paginated_transactions_by_date(self, direction=None):
+        transactions, self.page_cursors = self.fetch_page(
+            "date", True, self.page_cursors, direction, self.current_page)
+        return transactions
+
+    def get_paginated_transactions_sort_by_date(self, direction=None):
+        transactions, self.date_sort_by_page_cursors = self.fetch_page(
+            "date", self.option_segmented_button_date,
+            self.date_sort_by_page_cursors, direction,
+            self.sort_by_current_page)
+        return transactions
+
+    def get_paginated_transactions_sort_by_total_amount(self, direction=None):
+        transactions, self.total_amount_sort_by_page_cursors = \
+            self.fetch_page(
+                "total_amount", self.option_segmented_button_total_amount,
+                self.total_amount_sort_by_page_cursors, direction,
+                self.sort_by_current_page)
+        return transactions
+
+    def fetch_page(self, sort_key, descending, cursors, direction, page):
+        # Pages are fetched relative to the rows on screen, so a page turn
+        # reads one page from the cached ordering instead of re-sorting.
+        # Without a direction the page is read by its position, which also
+        # holds after the rows behind the cursors have changed.
+        first_cursor, last_cursor = cursors
+        if direction == "previous":
+            return self.transaction_ordering.get_page_before(
+                sort_key, descending, first_cursor, self.items_per_page)
+        if direction == "next":
+            return self.transaction_ordering.get_page_after(
+                sort_key, descending, last_cursor, self.items_per_page)
+        return self.transaction_ordering.get_page_at(
+            sort_key, descending, page * self.items_per_page,
+            self.items_per_page)
+
+    def update_page(self, direction=None):
+        self.get_date_in_transactions(
+            self.date_frame,
+            self.get_paginated_transactions_by_date(direction))
 
-        self.date_frame = self.create_date_group_by_frame(
-            self.tab_group_by,
-            self.get_paginated_transactions_by_date())
+        if self.pagination_frame is not None:
+            self.pagination_label.configure(
+                text=f"Page {self.current_page + 1} of {self.total_pages}")
 
-        self.pagination_label.configure(
-            text=f"Page {self.current_page + 1} of {self.total_pages}")
+    def refresh(self):
+        # After a change the pages on screen stay where they were and only
+        # their rows and totals are rewritten.
+        transaction_list = self.master.master.master.transaction_list
+        self.transactions = transaction_list.find(self.query)
+        self.transaction_ordering = transaction_list.get_ordering(self.query)
 
-        self.show_default_frame_group_by()
+        self.total_pages = (len(self.transactions) +
+                            self.items_per_page - 1) // self.items_per_page
+        self.current_page = max(min(self.current_page,
+                                    self.total_pages - 1), 0)
+        self.sort_by_current_page = max(min(self.sort_by_current_page,
+                                            self.total_pages - 1), 0)
+
+        self.update_page()
+        self.update_sort_by_page()
+        self.update_content_treeview_by_category(self.transactions)
 
-    def update_sort_by_page(self):
+    def update_sort_by_page(self, direction=None):
         self.sort_by_total_pages = (
             len(self.transactions) + self.items_per_page - 1
         ) // self.items_per_page
 
         if self.sort_by_option == "Date":
-            self.date_sort_by_frame.pack_forget()
-            self.date_sort_by_frame.destroy()
-
-            self.date_sort_by_frame = self.create_date_sort_by_frame(
-                self.tab_sort_by,
-                self.get_paginated_transactions_sort_by_date(),
+            self.get_date_in_transactions_with_option_sort(
+                self.date_sort_by_frame,
+                self.get_paginated_transactions_sort_by_date(direction),
                 option=self.option_segmented_button_date)
 
             self.pagination_label_for_sort_by.configure(
                 text=f"Page {self.sort_by_current_page + 1} of {
                     self.sort_by_total_pages}")
 
-            self.show_default_frame_sort_by()
+            if not self.date_sort_by_frame.winfo_manager():
+                self.show_default_frame_sort_by()
         elif self.sort_by_option == "Total Amount":
-            self.total_amount_sort_by_frame.pack_forget()
-            self.total_amount_sort_by_frame.destroy()
-
-            self.total_amount_sort_by_frame = \
-                self.create_total_amount_sort_by_frame(
-                    self.tab_sort_by,
-                    self.get_paginated_transactions_sort_by_total_amount(),
-                    option=self.option_segmented_button_total_amount)
+            self.create_content_treeview_sort_by_total_amount(
+                self.total_amount_sort_by_frame,
+                self.get_paginated_transactions_sort_by_total_amount(
+                    direction),
+                option=self.option_segmented_button_total_amount)
 
             self.pagination_label_for_sort_by.configure(
                 text=f"Page {self.sort_by_current_page + 1} of {
                     self.sort_by_total_pages}")
 
-            self.show_default_frame_sort_by()
+            if not self.total_amount_sort_by_frame.winfo_manager():
+                self.show_default_frame_sort_by()
 
     def next_page(self):
         if self.current_page < self.total_pages - 1:
             self.current_page += 1
-            self.update_page()
+            self.update_page("next")
 
     def previous_page(self):
         if self.current_page > 0:
             self.current_page -= 1
-            self.update_page()
+            self.update_page("previous")
 
     def next_sort_by_page(self):
         if self.sort_by_current_page < self.sort_by_total_pages - 1:
             self.sort_by_current_page += 1
-            self.update_sort_by_page()
+            self.update_sort_by_page("next")
 
     def previous_sort_by_page(self):
         if self.sort_by_current_page > 0:
             self.sort_by_current_page -= 1
-            self.update_sort_by_page()
+            self.update_sort_by_page("previous")
 
     # Set up Tab View
     def show_default_frame_group_by(self):
-        self.gold_treeviews = {}
-        self.currency_treeviews = {}
         self.show_frame(self.date_frame)
         self.hide_frame(self.category_frame)
         self.create_pagination_controls(self.tab_group_by)
 
     def show_default_frame_sort_by(self):
-        self.gold_treeviews = {}
-        self.currency_treeviews = {}
         if self.sort_by_option == "Date":
             self.show_frame(self.date_sort_by_frame)
             self.hide_frame(self.total_amount_sort_by_frame)
@@ -371,14 +393,29 @@ class TabGroupBySortBy(customtkinter.CTkTabview):
 
         sorted_dates = sorted(unique_dates, reverse=True)
 
-        for date_obj in sorted_dates:
+        self.show_date_groups(parent, self.date_group_slots, sorted_dates,
+                              transactions)
+
+    def show_date_groups(self, parent, slots, dates, transactions):
+        # Page turns refill the date groups already built; groups the page
+        # does not need are hidden rather than destroyed.
+        for index, date_obj in enumerate(dates):
             day = date_obj.day
             month = MonthLabel(date_obj.month)
             year = date_obj.year
 
-            group_by_date_items_frame = self.create_group_by_date_items_frame(
-                parent, day, month, year, transactions=transactions)
-            group_by_date_items_frame.pack(padx=5, pady=(5, 10), fill="x")
+            if index == len(slots):
+                slots.append(self.create_group_by_date_items_frame(
+                    parent, day, month, year, transactions=transactions))
+            else:
+                self.update_group_by_date_items_frame(
+                    slots[index], day, month, year, transactions)
+
+            if not slots[index]["frame"].winfo_manager():
+                slots[index]["frame"].pack(padx=5, pady=(5, 10), fill="x")
+
+        for slot in slots[len(dates):]:
+            slot["frame"].pack_forget()
 
     def create_group_by_date_items_frame(self, parent, day, month, year,
                                          transactions):
@@ -444,14 +481,43 @@ class TabGroupBySortBy(customtkinter.CTkTabview):
         frame_treeviews.grid(row=2, column=0, padx=5,
                              pady=5, sticky="ew", columnspan=3)
 
-        self.create_content_treeview_by_date(
-            frame_treeviews, transactions, day, month, year)
+        gold_treeview, currency_treeview = \
+            self.create_content_treeview_by_date(
+                frame_treeviews, transactions, day, month, year)
 
         frame.columnconfigure(0, weight=0)
         frame.columnconfigure(1, weight=0)
         frame.columnconfigure(2, weight=1)
 
-        return frame
+        return {
+            "frame": frame,
+            "day_label": day_label,
+            "month_label": month_label,
+            "year_label": year_label,
+            "total_amount_label": total_amount_number_label,
+            "gold_treeview": gold_treeview,
+            "currency_treeview": currency_treeview
+        }
+
+    def update_group_by_date_items_frame(self, slot, day, month, year,
+                                         transactions):
+        self.selected_gold_status = False
+        self.selected_currency_status = False
+
+        slot["day_label"].configure(text=str(day))
+        slot["month_label"].configure(text=str(month))
+        slot["year_label"].configure(text=str(year))
+
+        total_amount = self.calculate_total_amount_by_date(
+            transactions, day, month, year)
+        formatted_total_amount = self.format_price_number(
+            total_amount)
+        slot["total_amount_label"].configure(text=str(formatted_total_amount))
+
+        self.populate_treeview_with_gold_transactions_by_date(
+            slot["gold_treeview"], transactions, day, month, year)
+        self.populate_treeview_with_currency_transactions_by_date(
+            slot["currency_treeview"], transactions, day, month, year)
 
     def calculate_total_amount_by_date(self, transactions, day, month, year):
         total_amount = 0
@@ -466,15 +532,11 @@ class TabGroupBySortBy(customtkinter.CTkTabview):
         self.selected_gold_status = False
         self.selected_currency_status = False
 
-        if (day, month, year) not in self.gold_treeviews:
-            gold_treeview = \
-                self.create_gold_transaction_treeview_by_date(frame)
-            self.populate_treeview_with_gold_transactions_by_date(
-                gold_treeview, transactions, day, month, year)
-            gold_treeview.pack(padx=10, pady=10, fill="x")
-            self.gold_treeviews[(day, month, year)] = gold_treeview
-        else:
-            gold_treeview = self.gold_treeviews[(day, month, year)]
+        gold_treeview = \
+            self.create_gold_transaction_treeview_by_date(frame)
+        self.populate_treeview_with_gold_transactions_by_date(
+            gold_treeview, transactions, day, month, year)
+        gold_treeview.pack(padx=10, pady=10, fill="x")
 
         separator_style = ttk.Style()
         separator_style.configure(
@@ -484,27 +546,23 @@ class TabGroupBySortBy(customtkinter.CTkTabview):
             frame, orient="horizontal", style="Separator.TSeparator")
         separator.pack(padx=10, pady=10, fill="x")
 
-        if (day, month, year) not in self.currency_treeviews:
-            currency_treeview = \
-                self.create_currency_transaction_treeview_by_date(
-                    frame)
-            self.populate_treeview_with_currency_transactions_by_date(
-                currency_treeview, transactions, day, month, year)
-            currency_treeview.pack(padx=10, pady=10, fill="x")
-            self.currency_treeviews[(day, month, year)] = currency_treeview
-        else:
-            currency_treeview = self.currency_treeviews[(day, month, year)]
+        currency_treeview = \
+            self.create_currency_transaction_treeview_by_date(
+                frame)
+        self.populate_treeview_with_currency_transactions_by_date(
+            currency_treeview, transactions, day, month, year)
+        currency_treeview.pack(padx=10, pady=10, fill="x")
 
         gold_treeview.bind('<<TreeviewSelect>>', lambda event:
                            self.on_gold_treeview_select(
                                event,
-                               tab_type=TabGroupBySortByType.GROUPBYDATE,
-                               transactions=transactions))
+                               tab_type=TabGroupBySortByType.GROUPBYDATE))
         currency_treeview.bind('<<TreeviewSelect>>',
                                lambda event: self.on_currency_treeview_select(
                                    event,
-                                   tab_type=TabGroupBySortByType.GROUPBYDATE,
-                                   transactions=transactions))
+                                   tab_type=TabGroupBySortByType.GROUPBYDATE))
+
+        return gold_treeview, currency_treeview
 
     def create_gold_transaction_treeview_by_date(self, frame):
         frame_label_actions = customtkinter.CTkFrame(
@@ -525,12 +583,9 @@ class TabGroupBySortBy(customtkinter.CTkTabview):
             font=("Arial", 14))
         label_actions.pack(side="left", padx=5, pady=0)
 
-        details_icon = customtkinter.CTkImage(
-            Image.open('./resources/images/details.ico'))
-        edit_icon = customtkinter.CTkImage(
-            Image.open('./resources/images/edit.ico'))
-        delete_icon = customtkinter.CTkImage(
-            Image.open('./resources/images/delete.ico'))
+        details_icon = ImageCache.get_image("details.ico")
+        edit_icon = ImageCache.get_image("edit.ico")
+        delete_icon = ImageCache.get_image("delete.ico")
 
         btn_details = customtkinter.CTkButton(
             frame_action_buttons,
@@ -619,12 +674,9 @@ class TabGroupBySortBy(customtkinter.CTkTabview):
             font=("Arial", 14))
         label_actions.pack(side="left", padx=5, pady=0)
 
-        details_icon = customtkinter.CTkImage(
-            Image.open('./resources/images/details.ico'))
-        edit_icon = customtkinter.CTkImage(
-            Image.open('./resources/images/edit.ico'))
-        delete_icon = customtkinter.CTkImage(
-            Image.open('./resources/images/delete.ico'))
+        details_icon = ImageCache.get_image("details.ico")
+        edit_icon = ImageCache.get_image("edit.ico")
+        delete_icon = ImageCache.get_image("delete.ico")
 
         btn_details = customtkinter.CTkButton(
             frame_action_buttons,
@@ -694,6 +746,7 @@ class TabGroupBySortBy(customtkinter.CTkTabview):
     def populate_treeview_with_gold_transactions_by_date(self, treeview,
                                                          transactions,
                                                          day, month, year):
+        rows = []
         for transaction in transactions:
             if isinstance(transaction, GoldTransaction):
                 if (transaction._day, MonthLabel(transaction._month),
@@ -705,7 +758,7 @@ class TabGroupBySortBy(customtkinter.CTkTabview):
                         transaction._unit_price)
                     formatted_total_amount = self.format_price_number(
                         transaction._total_amount)
-                    treeview.insert("", "end", values=(
+                    rows.append((
                         transaction._id,
                         # transaction_date,
                         formatted_unit_price,
@@ -713,10 +766,12 @@ class TabGroupBySortBy(customtkinter.CTkTabview):
                         transaction._gold_type.name,
                         formatted_total_amount
                     ))
+        self.set_treeview_rows(treeview, rows)
 
     def populate_treeview_with_currency_transactions_by_date(self, treeview,
                                                              transactions,
                                                              day, month, year):
+        rows = []
         for transaction in transactions:
             if isinstance(transaction, CurrencyTransaction):
                 if (transaction._day, MonthLabel(transaction._month),
@@ -730,7 +785,7 @@ class TabGroupBySortBy(customtkinter.CTkTabview):
                         transaction._exchange_rate._rate)
                     formatted_total_amount = self.format_price_number(
                         transaction._total_amount)
-                    treeview.insert("", "end", values=(
+                    rows.append((
                         transaction._id,
                         # transaction_date,
                         formatted_quantity,
@@ -738,15 +793,21 @@ class TabGroupBySortBy(customtkinter.CTkTabview):
                         formatted_exchange_rate,
                         formatted_total_amount
                     ))
+        self.set_treeview_rows(treeview, rows)
 
     # Group By Category
-    def create_content_treeview_by_category(self, frame, transactions):
+    def split_by_category(self, transactions):
         gold_transactions = [transaction for transaction in transactions
                              if isinstance(
                                  transaction, GoldTransaction)]
         currency_transactions = [transaction for transaction in transactions
                                  if isinstance(
                                      transaction, CurrencyTransaction)]
+        return gold_transactions, currency_transactions
+
+    def create_content_treeview_by_category(self, frame, transactions):
+        gold_transactions, currency_transactions = self.split_by_category(
+            transactions)
 
         frame_gold = customtkinter.CTkFrame(
             frame, fg_color="#ffffff",
@@ -780,18 +841,38 @@ class TabGroupBySortBy(customtkinter.CTkTabview):
             treeview_currency_transaction, currency_transactions)
         treeview_currency_transaction.pack(padx=20, pady=(10, 20), fill="x")
 
+        self.category_gold_treeview = treeview_gold_transaction
+        self.category_currency_treeview = treeview_currency_transaction
+
         treeview_gold_transaction.bind(
             '<<TreeviewSelect>>', lambda event:
             self.on_gold_treeview_select(
                 event,
-                tab_type=TabGroupBySortByType.GROUPBYCATEGORY,
-                transactions=transactions))
+                tab_type=TabGroupBySortByType.GROUPBYCATEGORY))
         treeview_currency_transaction.bind(
             '<<TreeviewSelect>>', lambda event:
             self.on_currency_treeview_select(
                 event,
-                tab_type=TabGroupBySortByType.GROUPBYCATEGORY,
-                transactions=transactions))
+                tab_type=TabGroupBySortByType.GROUPBYCATEGORY))
+
+    def update_content_treeview_by_category(self, transactions):
+        gold_transactions, currency_transactions = self.split_by_category(
+            transactions)
+
+        self.gold_category_total_amount_label.configure(
+            text=self.format_price_number(
+                self.calculate_total_amount_by_category(gold_transactions)))
+        self.currency_category_total_amount_label.configure(
+            text=self.format_price_number(
+                self.calculate_total_amount_by_category(
+                    currency_transactions)))
+
+        for treeview in [self.category_gold_treeview,
+                         self.category_currency_treeview]:
+            if treeview.selection():
+                treeview.selection_remove(*treeview.selection())
+        self.category_gold_treeview.update_rows(gold_transactions)
+        self.category_currency_treeview.update_rows(currency_transactions)
 
     def create_header_transaction_treeview(self, frame, total_amount, label):
         frame_header = customtkinter.CTkFrame(
@@ -836,6 +917,8 @@ class TabGroupBySortBy(customtkinter.CTkTabview):
         frame_header.columnconfigure(0, weight=1)
         frame_header.columnconfigure(1, weight=1)
 
+        return total_amount_number_label
+
     def calculate_total_amount_by_category(self, transactions):
         total_amount = 0
         for transaction in transactions:
@@ -848,8 +931,9 @@ class TabGroupBySortBy(customtkinter.CTkTabview):
             gold_transactions)
         formatted_total_amount_gold = self.format_price_number(
             total_amount_gold)
-        self.create_header_transaction_treeview(
-            frame, formatted_total_amount_gold, "GOLD TRANSACTIONS")
+        self.gold_category_total_amount_label = \
+            self.create_header_transaction_treeview(
+                frame, formatted_total_amount_gold, "GOLD TRANSACTIONS")
 
         frame_label_actions = customtkinter.CTkFrame(
             frame, fg_color="transparent")
@@ -864,12 +948,9 @@ class TabGroupBySortBy(customtkinter.CTkTabview):
             font=("Arial", 14))
         label_actions.pack(side="left", padx=5, pady=0)
 
-        details_icon = customtkinter.CTkImage(
-            Image.open('./resources/images/details.ico'))
-        edit_icon = customtkinter.CTkImage(
-            Image.open('./resources/images/edit.ico'))
-        delete_icon = customtkinter.CTkImage(
-            Image.open('./resources/images/delete.ico'))
+        details_icon = ImageCache.get_image("details.ico")
+        edit_icon = ImageCache.get_image("edit.ico")
+        delete_icon = ImageCache.get_image("delete.ico")
 
         btn_details = customtkinter.CTkButton(
             frame_action_buttons,
@@ -917,7 +998,7 @@ class TabGroupBySortBy(customtkinter.CTkTabview):
             "Treeview.Heading", font=("Arial", 10, "bold"))
         treeview_style.configure("Treeview", rowheight=25)
 
-        treeview = ttk.Treeview(frame, columns=(
+        treeview = VirtualTreeview(frame, columns=(
             "Transaction Code",
             "Transaction Date",
             "Unit Price (VND/tael)",
@@ -944,8 +1025,10 @@ class TabGroupBySortBy(customtkinter.CTkTabview):
             currency_transactions)
         formatted_total_amount_currency = self.format_price_number(
             total_amount_currency)
-        self.create_header_transaction_treeview(
-            frame, formatted_total_amount_currency, "CURRENCY TRANSACTIONS")
+        self.currency_category_total_amount_label = \
+            self.create_header_transaction_treeview(
+                frame, formatted_total_amount_currency,
+                "CURRENCY TRANSACTIONS")
 
         frame_label_actions = customtkinter.CTkFrame(
             frame, fg_color="transparent")
@@ -960,12 +1043,9 @@ class TabGroupBySortBy(customtkinter.CTkTabview):
             font=("Arial", 14))
         label_actions.pack(side="left", padx=5, pady=0)
 
-        details_icon = customtkinter.CTkImage(
-            Image.open('./resources/images/details.ico'))
-        edit_icon = customtkinter.CTkImage(
-            Image.open('./resources/images/edit.ico'))
-        delete_icon = customtkinter.CTkImage(
-            Image.open('./resources/images/delete.ico'))
+        details_icon = ImageCache.get_image("details.ico")
+        edit_icon = ImageCache.get_image("edit.ico")
+        delete_icon = ImageCache.get_image("delete.ico")
 
         btn_details = customtkinter.CTkButton(
             frame_action_buttons,
@@ -1013,7 +1093,7 @@ class TabGroupBySortBy(customtkinter.CTkTabview):
             "Treeview.Heading", font=("Arial", 10, "bold"))
         treeview_style.configure("Treeview", rowheight=25)
 
-        treeview = ttk.Treeview(frame, columns=(
+        treeview = VirtualTreeview(frame, columns=(
             "Transaction Code",
             "Transaction Date",
             "Quantity",
@@ -1032,48 +1112,50 @@ class TabGroupBySortBy(customtkinter.CTkTabview):
                          text="Total Amount (VND)", anchor="w")
         return treeview
 
+    def get_gold_row_values(self, transaction):
+        transaction_date = "{} {} {}".format(
+            transaction._day, MonthLabel(transaction._month),
+            transaction._year)
+        formatted_unit_price = self.format_price_number(
+            transaction._unit_price)
+        formatted_total_amount = self.format_price_number(
+            transaction._total_amount)
+        return (
+            transaction._id,
+            transaction_date,
+            formatted_unit_price,
+            transaction._quantity,
+            transaction._gold_type.name,
+            formatted_total_amount
+        )
+
     def populate_treeview_with_gold_transactions_by_category(self, treeview,
                                                              transactions):
-        for transaction in transactions:
-            if isinstance(transaction, GoldTransaction):
-                transaction_date = "{} {} {}".format(
-                    transaction._day, MonthLabel(transaction._month),
-                    transaction._year)
-                formatted_unit_price = self.format_price_number(
-                    transaction._unit_price)
-                formatted_total_amount = self.format_price_number(
-                    transaction._total_amount)
-                treeview.insert("", "end", values=(
-                    transaction._id,
-                    transaction_date,
-                    formatted_unit_price,
-                    transaction._quantity,
-                    transaction._gold_type.name,
-                    formatted_total_amount
-                ))
+        treeview.set_rows(transactions, self.get_gold_row_values)
+
+    def get_currency_row_values(self, transaction):
+        transaction_date = "{} {} {}".format(
+            transaction._day, MonthLabel(transaction._month),
+            transaction._year)
+        formatted_quantity = self.format_price_number(
+            transaction._quantity)
+        formatted_exchange_rate = self.format_price_number(
+            transaction._exchange_rate._rate)
+        formatted_total_amount = self.format_price_number(
+            transaction._total_amount)
+        return (
+            transaction._id,
+            transaction_date,
+            formatted_quantity,
+            transaction._currency_type.name,
+            formatted_exchange_rate,
+            formatted_total_amount
+        )
 
     def populate_treeview_with_currency_transactions_by_category(self,
                                                                  treeview,
                                                                  transactions):
-        for transaction in transactions:
-            if isinstance(transaction, CurrencyTransaction):
-                transaction_date = "{} {} {}".format(
-                    transaction._day, MonthLabel(transaction._month),
-                    transaction._year)
-                formatted_quantity = self.format_price_number(
-                    transaction._quantity)
-                formatted_exchange_rate = self.format_price_number(
-                    transaction._exchange_rate._rate)
-                formatted_total_amount = self.format_price_number(
-                    transaction._total_amount)
-                treeview.insert("", "end", values=(
-                    transaction._id,
-                    transaction_date,
-                    formatted_quantity,
-                    transaction._currency_type.name,
-                    formatted_exchange_rate,
-                    formatted_total_amount
-                ))
+        treeview.set_rows(transactions, self.get_currency_row_values)
 
     # Sort By Frame
     def create_date_sort_by_frame(self, parent, transactions, option):
@@ -1112,14 +1194,8 @@ class TabGroupBySortBy(customtkinter.CTkTabview):
 
         sorted_dates = sorted(unique_dates, reverse=option)
 
-        for date_obj in sorted_dates:
-            day = date_obj.day
-            month = MonthLabel(date_obj.month)
-            year = date_obj.year
-
-            group_by_date_items_frame = self.create_group_by_date_items_frame(
-                parent, day, month, year, transactions=transactions)
-            group_by_date_items_frame.pack(padx=5, pady=(5, 10), fill="x")
+        self.show_date_groups(parent, self.date_sort_by_slots, sorted_dates,
+                              transactions)
 
     # Sort By Total Amount
     def create_content_treeview_sort_by_total_amount(self, frame,
@@ -1127,10 +1203,53 @@ class TabGroupBySortBy(customtkinter.CTkTabview):
         sorted_transactions = sorted(
             transactions, key=lambda x: x._total_amount, reverse=option)
 
+        shown_slots = []
+        gold_count = 0
+        currency_count = 0
         for transaction in sorted_transactions:
             transaction_list = [transaction]
-            self.create_frame_for_content_treeview(
-                frame, transaction_list)
+            if isinstance(transaction, GoldTransaction):
+                slots = self.gold_total_amount_slots
+                index = gold_count
+                gold_count += 1
+            else:
+                slots = self.currency_total_amount_slots
+                index = currency_count
+                currency_count += 1
+
+            if index == len(slots):
+                slots.append(self.create_frame_for_content_treeview(
+                    frame, transaction_list))
+            else:
+                self.update_frame_for_content_treeview(
+                    slots[index], transaction_list)
+            shown_slots.append(slots[index])
+
+        # Gold and currency items interleave differently on every page, so
+        # the reused items are re-packed in page order.
+        for slot in self.gold_total_amount_slots + \
+                self.currency_total_amount_slots:
+            slot["frame"].pack_forget()
+            slot["separator"].pack_forget()
+        for slot in shown_slots:
+            slot["frame"].pack(padx=5, pady=5, fill="x")
+            slot["separator"].pack(padx=10, pady=10, fill="x")
+
+    def update_frame_for_content_treeview(self, slot, transactions):
+        self.selected_gold_status = False
+        self.selected_currency_status = False
+
+        total_amount = self.calculate_total_amount_sort_by_total_amount(
+            transactions)
+        slot["total_amount_label"].configure(
+            text="{}".format(self.format_price_number(total_amount)))
+
+        if isinstance(transactions[0], GoldTransaction):
+            self.populate_tv_with_gold_sort_by_total_amount(
+                slot["treeview"], transactions)
+        else:
+            self.populate_tv_with_currency_sort_by_total_amount(
+                slot["treeview"], transactions)
 
     def create_frame_for_content_treeview(self, frame, transactions):
         frame_items = customtkinter.CTkFrame(
@@ -1140,7 +1259,7 @@ class TabGroupBySortBy(customtkinter.CTkTabview):
 
         if transactions:
             if isinstance(transactions[0], GoldTransaction):
-                treeview_transaction = \
+                treeview_transaction, total_amount_label = \
                     self.create_gold_tv_sort_by_total_amount(
                         frame_items, transactions)
                 self.populate_tv_with_gold_sort_by_total_amount(
@@ -1149,10 +1268,9 @@ class TabGroupBySortBy(customtkinter.CTkTabview):
                     '<<TreeviewSelect>>', lambda event:
                     self.on_gold_treeview_select(
                         event,
-                        tab_type=TabGroupBySortByType.SORTBYTOTALAMOUNT,
-                        transactions=transactions))
+                        tab_type=TabGroupBySortByType.SORTBYTOTALAMOUNT))
             elif isinstance(transactions[0], CurrencyTransaction):
-                treeview_transaction \
+                treeview_transaction, total_amount_label \
                     = self.create_currency_tv_sort_by_total_amount(
                         frame_items, transactions)
                 self.populate_tv_with_currency_sort_by_total_amount(
@@ -1161,8 +1279,7 @@ class TabGroupBySortBy(customtkinter.CTkTabview):
                     '<<TreeviewSelect>>', lambda event:
                     self.on_currency_treeview_select(
                         event,
-                        tab_type=TabGroupBySortByType.SORTBYTOTALAMOUNT,
-                        transactions=transactions))
+                        tab_type=TabGroupBySortByType.SORTBYTOTALAMOUNT))
 
             treeview_transaction.pack(
                 padx=20, pady=(10, 20), fill="x")
@@ -1175,6 +1292,13 @@ class TabGroupBySortBy(customtkinter.CTkTabview):
             frame, orient="horizontal", style="Separator.TSeparator")
         separator.pack(padx=10, pady=10, fill="x")
 
+        return {
+            "frame": frame_items,
+            "separator": separator,
+            "treeview": treeview_transaction,
+            "total_amount_label": total_amount_label
+        }
+
     def create_header_transaction_treeview_sort_by(self, frame,
                                                    total_amount, label):
         frame_header = customtkinter.CTkFrame(
@@ -1219,6 +1343,8 @@ class TabGroupBySortBy(customtkinter.CTkTabview):
         frame_header.columnconfigure(0, weight=1)
         frame_header.columnconfigure(1, weight=1)
 
+        return total_amount_number_label
+
     def calculate_total_amount_sort_by_total_amount(self, transactions):
         total_amount = 0
         for transaction in transactions:
@@ -1231,7 +1357,7 @@ class TabGroupBySortBy(customtkinter.CTkTabview):
             gold_transactions)
         formatted_total_amount_gold = self.format_price_number(
             total_amount_gold)
-        self.create_header_transaction_treeview_sort_by(
+        total_amount_label = self.create_header_transaction_treeview_sort_by(
             frame, formatted_total_amount_gold, "GOLD TRANSACTIONS")
 
         frame_label_actions = customtkinter.CTkFrame(
@@ -1247,12 +1373,9 @@ class TabGroupBySortBy(customtkinter.CTkTabview):
             font=("Arial", 14))
         label_actions.pack(side="left", padx=5, pady=0)
 
-        details_icon = customtkinter.CTkImage(
-            Image.open('./resources/images/details.ico'))
-        edit_icon = customtkinter.CTkImage(
-            Image.open('./resources/images/edit.ico'))
-        delete_icon = customtkinter.CTkImage(
-            Image.open('./resources/images/delete.ico'))
+        details_icon = ImageCache.get_image("details.ico")
+        edit_icon = ImageCache.get_image("edit.ico")
+        delete_icon = ImageCache.get_image("delete.ico")
 
         btn_details = customtkinter.CTkButton(
             frame_action_buttons,
@@ -1319,7 +1442,7 @@ class TabGroupBySortBy(customtkinter.CTkTabview):
         # treeview.heading("Total Amount (VND)",
         #                  text="Total Amount (VND)", anchor="w")
 
-        return treeview
+        return treeview, total_amount_label
 
     def create_currency_tv_sort_by_total_amount(self, frame,
                                                 currency_transactions
@@ -1329,7 +1452,7 @@ class TabGroupBySortBy(customtkinter.CTkTabview):
                 currency_transactions)
         formatted_total_amount_currency = self.format_price_number(
             total_amount_currency)
-        self.create_header_transaction_treeview_sort_by(
+        total_amount_label = self.create_header_transaction_treeview_sort_by(
             frame, formatted_total_amount_currency, "CURRENCY TRANSACTIONS")
 
         frame_label_actions = customtkinter.CTkFrame(
@@ -1345,12 +1468,9 @@ class TabGroupBySortBy(customtkinter.CTkTabview):
             font=("Arial", 14))
         label_actions.pack(side="left", padx=5, pady=0)
 
-        details_icon = customtkinter.CTkImage(
-            Image.open('./resources/images/details.ico'))
-        edit_icon = customtkinter.CTkImage(
-            Image.open('./resources/images/edit.ico'))
-        delete_icon = customtkinter.CTkImage(
-            Image.open('./resources/images/delete.ico'))
+        details_icon = ImageCache.get_image("details.ico")
+        edit_icon = ImageCache.get_image("edit.ico")
+        delete_icon = ImageCache.get_image("delete.ico")
 
         btn_details = customtkinter.CTkButton(
             frame_action_buttons,
@@ -1416,11 +1536,12 @@ class TabGroupBySortBy(customtkinter.CTkTabview):
                          text="Exchange Rate (VND)", anchor="w")
         # treeview.heading("Total Amount (VND)",
         #                  text="Total Amount (VND)", anchor="w")
-        return treeview
+        return treeview, total_amount_label
 
     def populate_tv_with_gold_sort_by_total_amount(self,
                                                    treeview,
                                                    transactions):
+        rows = []
         for transaction in transactions:
             if isinstance(transaction, GoldTransaction):
                 transaction_date = "{} {} {}".format(
@@ -1430,7 +1551,7 @@ class TabGroupBySortBy(customtkinter.CTkTabview):
                     transaction._unit_price)
                 # formatted_total_amount = self.format_price_number(
                 #     transaction._total_amount)
-                treeview.insert("", "end", values=(
+                rows.append((
                     transaction._id,
                     transaction_date,
                     formatted_unit_price,
@@ -1438,10 +1559,12 @@ class TabGroupBySortBy(customtkinter.CTkTabview):
                     transaction._gold_type.name,
                     # formatted_total_amount
                 ))
+        self.set_treeview_rows(treeview, rows)
 
     def populate_tv_with_currency_sort_by_total_amount(self,
                                                        treeview,
                                                        transactions):
+        rows = []
         for transaction in transactions:
             if isinstance(transaction, CurrencyTransaction):
                 transaction_date = "{} {} {}".format(
@@ -1453,7 +1576,7 @@ class TabGroupBySortBy(customtkinter.CTkTabview):
                     transaction._exchange_rate._rate)
                 # formatted_total_amount = self.format_price_number(
                 #     transaction._total_amount)
-                treeview.insert("", "end", values=(
+                rows.append((
                     transaction._id,
                     transaction_date,
                     formatted_quantity,
@@ -1461,9 +1584,28 @@ class TabGroupBySortBy(customtkinter.CTkTabview):
                     formatted_exchange_rate,
                     # formatted_total_amount
                 ))
+        self.set_treeview_rows(treeview, rows)
 
     # General auxiliary functions
-    def on_gold_treeview_select(self, event, tab_type, transactions):
+    def set_treeview_rows(self, treeview, rows):
+        # Only the rows that differ from what the treeview already shows
+        # are rewritten.
+        if treeview.selection():
+            treeview.selection_remove(*treeview.selection())
+
+        items = treeview.get_children()
+        old_rows = self.treeview_rows.get(treeview, [])
+        for index, values in enumerate(rows):
+            if index >= len(items):
+                treeview.insert("", "end", values=values)
+            elif index >= len(old_rows) or old_rows[index] != values:
+                treeview.item(items[index], values=values)
+
+        if len(items) > len(rows):
+            treeview.delete(*items[len(rows):])
+        self.treeview_rows[treeview] = rows
+
+    def on_gold_treeview_select(self, event, tab_type):
         if tab_type == TabGroupBySortByType.GROUPBYDATE or \
                 tab_type == TabGroupBySortByType.SORTBYDATE:
             treeview = event.widget
@@ -1481,21 +1623,18 @@ class TabGroupBySortBy(customtkinter.CTkTabview):
 
                 self.selected_gold_transaction_date = None
 
-                for transaction in transactions:
-                    if isinstance(transaction, GoldTransaction):
-                        if str(transaction._id) == \
-                                str(self.selected_gold_transaction_code):
-                            day = transaction._day
-                            month = transaction._month
-                            year = transaction._year
+                transaction = self.master.master.master.transaction_list.get(
+                    str(self.selected_gold_transaction_code))
+                if isinstance(transaction, GoldTransaction):
+                    day = transaction._day
+                    month = transaction._month
+                    year = transaction._year
 
-                            month_name = str(MonthLabel(month))
+                    month_name = str(MonthLabel(month))
 
-                            formatted_date = f"{day} {month_name} {year}"
+                    formatted_date = f"{day} {month_name} {year}"
 
-                            self.selected_gold_transaction_date \
-                                = formatted_date
-                            break
+                    self.selected_gold_transaction_date = formatted_date
 
             else:
                 self.selected_gold_status = False
@@ -1533,19 +1672,16 @@ class TabGroupBySortBy(customtkinter.CTkTabview):
 
                 self.selected_gold_total_amount = None
 
-                for transaction in transactions:
-                    if isinstance(transaction, GoldTransaction):
-                        if str(transaction._id) == \
-                                str(self.selected_gold_transaction_code):
-                            formatted_total_amount = self.format_price_number(
-                                transaction._total_amount)
-                            self.selected_gold_total_amount = \
-                                formatted_total_amount
-                            break
+                transaction = self.master.master.master.transaction_list.get(
+                    str(self.selected_gold_transaction_code))
+                if isinstance(transaction, GoldTransaction):
+                    formatted_total_amount = self.format_price_number(
+                        transaction._total_amount)
+                    self.selected_gold_total_amount = formatted_total_amount
             else:
                 self.selected_gold_status = False
 
-    def on_currency_treeview_select(self, event, tab_type, transactions):
+    def on_currency_treeview_select(self, event, tab_type):
         if tab_type == TabGroupBySortByType.GROUPBYDATE or \
                 tab_type == TabGroupBySortByType.SORTBYDATE:
             treeview = event.widget
@@ -1563,21 +1699,18 @@ class TabGroupBySortBy(customtkinter.CTkTabview):
 
                 self.selected_currency_transaction_date = None
 
-                for transaction in transactions:
-                    if isinstance(transaction, CurrencyTransaction):
-                        if str(transaction._id) == \
-                                str(self.selected_currency_transaction_code):
-                            day = transaction._day
-                            month = transaction._month
-                            year = transaction._year
+                transaction = self.master.master.master.transaction_list.get(
+                    str(self.selected_currency_transaction_code))
+                if isinstance(transaction, CurrencyTransaction):
+                    day = transaction._day
+                    month = transaction._month
+                    year = transaction._year
 
-                            month_name = str(MonthLabel(month))
+                    month_name = str(MonthLabel(month))
 
-                            formatted_date = f"{day} {month_name} {year}"
+                    formatted_date = f"{day} {month_name} {year}"
 
-                            self.selected_currency_transaction_date \
-                                = formatted_date
-                            break
+                    self.selected_currency_transaction_date = formatted_date
 
             else:
                 self.selected_currency_status = False
@@ -1615,15 +1748,13 @@ class TabGroupBySortBy(customtkinter.CTkTabview):
 
                 self.selected_currency_total_amount = None
 
-                for transaction in transactions:
-                    if isinstance(transaction, CurrencyTransaction):
-                        if str(transaction._id) == \
-                                str(self.selected_currency_transaction_code):
-                            formatted_total_amount = self.format_price_number(
-                                transaction._total_amount)
-                            self.selected_currency_total_amount = \
-                                formatted_total_amount
-                            break
+                transaction = self.master.master.master.transaction_list.get(
+                    str(self.selected_currency_transaction_code))
+                if isinstance(transaction, CurrencyTransaction):
+                    formatted_total_amount = self.format_price_number(
+                        transaction._total_amount)
+                    self.selected_currency_total_amount = \
+                        formatted_total_amount
 
             else:
                 self.selected_currency_status = False
@@ -2,15 +2,17 @@ from tkinter import ttk
 import customtkinter
 import datetime
 import numpy as np
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from matplotlib.ticker import MaxNLocator
 
 from enums.month_label_enum import MonthLabel
 from enums.gold_type_enum import GoldType
 from enums.currency_type_enum import CurrencyType
+from enums.transaction_type_enum import TransactionType
 from models.gold_transaction_model import GoldTransaction
 from models.currency_transaction_model import CurrencyTransaction
+from models.transaction_aggregate_model import TransactionAggregate
+from widgets.chart_renderer import ChartRenderer
+from widgets.figure_pool import FigurePool
 from widgets.total_details_window import TotalDetailsWindow
 from widgets.statistics_details_month_window \
     import StatisticsDetailsMonthWindow
@@ -19,6 +21,8 @@ from widgets.statistics_details_week_window \
 
 
 class TabReport(customtkinter.CTkTabview):
+    PREBUILD_DELAY = 200
+
     def __init__(self, master, **kwargs):
         super().__init__(master, **kwargs)
         self.total_details_window = None
@@ -28,35 +32,59 @@ class TabReport(customtkinter.CTkTabview):
         self.tab_week = self.add("WEEK")
         self.tab_month = self.add("MONTH")
 
+        self.tab_builders = {
+            "WEEK": self.create_week_widgets,
+            "MONTH": self.create_month_widgets
+        }
+        self.built_tabs = set()
+        self.prebuild_job = None
+
         self.set("MONTH")
-        self.configure(corner_radius=5)
+        self.configure(corner_radius=5, command=self.on_tab_selected)
 
-        self.all_transactions = \
-            self.master.master.master.transaction_list.get_transactions()
+        self.transaction_list = self.master.master.master.transaction_list
 
         self.create_tab_report_widgets()
 
     def create_tab_report_widgets(self):
+        # The WEEK dashboard is drawn once the MONTH one is on screen, or
+        # straight away if it is selected first.
+        self.build_tab(self.get())
+        self.prebuild_job = self.after(self.PREBUILD_DELAY,
+                                       self.prebuild_next_tab)
+
+    def on_tab_selected(self):
+        self.build_tab(self.get())
+
+    def build_tab(self, name):
+        if name not in self.built_tabs:
+            self.built_tabs.add(name)
+            self.tab_builders[name]()
+
+    def prebuild_next_tab(self):
+        self.prebuild_job = None
+        for name in self.tab_builders:
+            if name not in self.built_tabs:
+                self.build_tab(name)
+                self.prebuild_job = self.after(self.PREBUILD_DELAY,
+                                               self.prebuild_next_tab)
+                return
+
+    def destroy(self):
+        if self.prebuild_job is not None:
+            self.after_cancel(self.prebuild_job)
+            self.prebuild_job = None
+        super().destroy()
+
+    def create_month_widgets(self):
         now = datetime.datetime.now()
         current_year = now.year
         current_month = now.month
-        current_week = now.isocalendar()[1]
-
-        transactions_this_month = [
-            txn for txn in self.all_transactions
-            if txn._year == current_year and txn._month == current_month
-        ]
 
-        transactions_this_week = [
-            txn for txn in self.all_transactions
-            if txn._year ==
-            current_year and datetime.date(txn._year,
-                                           txn._month,
-                                           txn._day).isocalendar()[1]
-            == current_week
-        ]
+        transactions_this_month = \
+            self.transaction_list.get_transactions_by_month_year(
+                current_month, current_year)
 
-        # Month
         month_scroll_frame = customtkinter.CTkScrollableFrame(
             self.tab_month, fg_color="transparent",
             height=850)
@@ -74,7 +102,9 @@ class TabReport(customtkinter.CTkTabview):
         month_total_chart = \
             self.create_total_chart_frame(frame_month_1,
                                           transactions_this_month,
-                                          btn_details_status=True)
+                                          btn_details_status=True,
+                                          period=(current_year,
+                                                  current_month))
         month_total_chart.grid(row=0, column=0, padx=5, pady=5, sticky="ew")
 
         month_recent_transaction = \
@@ -96,7 +126,11 @@ class TabReport(customtkinter.CTkTabview):
                                                btn_details_status=True)
         month_statistics_chart.pack(padx=5, pady=(2, 5), fill="x")
 
-        # Week
+    def create_week_widgets(self):
+        transactions_this_week = \
+            self.transaction_list.get_transactions_between(
+                *self.get_week_range(datetime.date.today()))
+
         week_scroll_frame = customtkinter.CTkScrollableFrame(
             self.tab_week, fg_color="transparent",
             height=850)
@@ -137,7 +171,7 @@ class TabReport(customtkinter.CTkTabview):
         week_statistics_chart.pack(padx=5, pady=(2, 5), fill="x")
 
     def create_total_chart_frame(self, parent, transactions,
-                                 btn_details_status):
+                                 btn_details_status, period=None):
         total_chart_frame = customtkinter.CTkFrame(
             master=parent, fg_color="#ffffff",
             border_width=2, border_color="#989DA1",
@@ -168,7 +202,8 @@ class TabReport(customtkinter.CTkTabview):
                 text_color="#5C8ECB",
                 font=("Arial", 14, "bold"),
                 width=30,
-                command=lambda: self.open_total_details_window(transactions)
+                command=lambda: self.open_total_details_window(transactions,
+                                                               period)
             )
             btn_details_report.grid(
                 row=0, column=1, sticky="e", padx=12, pady=0)
@@ -242,7 +277,9 @@ class TabReport(customtkinter.CTkTabview):
         piechart_labels = ["Gold", "Currency"]
         piechart_colors = ["#f5d45f", "#2ea64d"]
 
-        fig, ax = plt.subplots()
+        canvas = FigurePool.get_canvas(total_chart_frame, "total_chart")
+        fig = canvas.figure
+        ax = fig.add_subplot()
         ax.pie(piechart_values, labels=piechart_labels, autopct='%1.1f%%',
                colors=piechart_colors)
         ax.legend(title="Category", loc='center left',
@@ -250,7 +287,6 @@ class TabReport(customtkinter.CTkTabview):
 
         fig.set_size_inches(3, 3)
 
-        canvas = FigureCanvasTkAgg(fig, master=total_chart_frame)
         canvas.draw()
         canvas.get_tk_widget().pack(padx=5, pady=(0, 20), fill="x")
 
@@ -383,36 +419,56 @@ class TabReport(customtkinter.CTkTabview):
 
             return statistics_chart_frame
 
+        # Charts are cached per period and data version, so reopening the
+        # report with unchanged data shows them without rendering again.
+        version = self.transaction_list.get_store().get_version()
+        charts = []
+
         if tab_type == self.tab_month:
             weeks = self.get_weeks_of_month(current_year, current_month)
-            totals = self.get_total_amount_per_week(transactions, weeks)
-
-            self.plot_bar_chart_for_this_month(statistics_chart_frame,
-                                               weeks, totals)
-            self.plot_markers_chart_for_this_month(statistics_chart_frame,
-                                                   weeks, totals)
-            self.plot_gold_bar_chart_for_this_month(statistics_chart_frame,
-                                                    weeks, transactions)
-            self.plot_gold_markers_chart_for_this_month(statistics_chart_frame,
-                                                        weeks, transactions)
-            self.plot_currency_bar_chart_for_this_month(statistics_chart_frame,
-                                                        weeks, transactions)
-            self.plot_currency_markers_chart_for_this_month(
-                statistics_chart_frame, weeks, transactions)
+            period_totals = self.transaction_list.get_period_totals(weeks)
+            totals = self.get_total_amount_per_week(period_totals)
+
+            period = (current_year, current_month)
+            charts = [
+                (self.plot_bar_chart_for_this_month,
+                 (weeks, totals, period_totals)),
+                (self.plot_markers_chart_for_this_month,
+                 (weeks, totals, period_totals)),
+                (self.plot_gold_bar_chart_for_this_month,
+                 (weeks, period_totals)),
+                (self.plot_gold_markers_chart_for_this_month,
+                 (weeks, period_totals)),
+                (self.plot_currency_bar_chart_for_this_month,
+                 (weeks, period_totals)),
+                (self.plot_currency_markers_chart_for_this_month,
+                 (weeks, period_totals))
+            ]
+            chart_pady = (0, 2)
 
         elif tab_type == self.tab_week:
-            self.plot_bar_chart_for_this_week(statistics_chart_frame,
-                                              transactions)
-            self.plot_markers_chart_for_this_week(statistics_chart_frame,
-                                                  transactions)
-            self.plot_gold_bar_chart_for_this_week(statistics_chart_frame,
-                                                   transactions)
-            self.plot_gold_markers_chart_for_this_week(statistics_chart_frame,
-                                                       transactions)
-            self.plot_currency_bar_chart_for_this_week(statistics_chart_frame,
-                                                       transactions)
-            self.plot_currency_markers_chart_for_this_week(
-                statistics_chart_frame, transactions)
+            period = self.get_week_range(now.date())
+            period_totals = self.transaction_list.get_period_totals(
+                self.get_days_of_week(now.date()), *period)
+
+            charts = [
+                (self.plot_bar_chart_for_this_week, (period_totals,)),
+                (self.plot_markers_chart_for_this_week, (period_totals,)),
+                (self.plot_gold_bar_chart_for_this_week, (period_totals,)),
+                (self.plot_gold_markers_chart_for_this_week,
+                 (period_totals,)),
+                (self.plot_currency_bar_chart_for_this_week,
+                 (period_totals,)),
+                (self.plot_currency_markers_chart_for_this_week,
+                 (period_totals,))
+            ]
+            chart_pady = (0, 20)
+
+        for plot, args in charts:
+            chart = ChartRenderer.show_chart(
+                statistics_chart_frame, (plot.__name__, period), version,
+                plot, *args)
+            chart.pack(padx=5, pady=chart_pady, fill="x")
 
         return statistics_chart_frame
 
@@ -446,25 +502,35 @@ class TabReport(customtkinter.CTkTabview):
 
         return weeks
 
-    def plot_bar_chart_for_this_month(self, parent, weeks, totals):
+    def get_week_range(self, date):
+        # The week tab only covers the part of the week in this year.
+        start_of_week = date - datetime.timedelta(days=date.weekday())
+        end_of_week = start_of_week + datetime.timedelta(days=6)
+        return (max(start_of_week, datetime.date(date.year, 1, 1)),
+                min(end_of_week, datetime.date(date.year, 12, 31)))
+
+    def get_days_of_week(self, date):
+        start_of_week = date - datetime.timedelta(days=date.weekday())
+        days = []
+        for i in range(7):
+            day = start_of_week + datetime.timedelta(days=i)
+            days.append((day, day))
+        return days
+
+    def plot_bar_chart_for_this_month(self, fig, weeks, totals,
+                                      period_totals):
         week_labels = [
             f"Week {i+1}\n{start.strftime('%d/%m/%Y')
                            } - {end.strftime('%d/%m/%Y')}"
             for i, (start, end) in enumerate(weeks)
         ]
 
-        gold_totals = [0] * len(weeks)
-        currency_totals = [0] * len(weeks)
-        for i, (start, end) in enumerate(weeks):
-            for txn in self.all_transactions:
-                txn_date = datetime.date(txn._year, txn._month, txn._day)
-                if start <= txn_date <= end:
-                    if isinstance(txn, GoldTransaction):
-                        gold_totals[i] += txn._total_amount
-                    elif isinstance(txn, CurrencyTransaction):
-                        currency_totals[i] += txn._total_amount
-
-        fig, ax = plt.subplots()
+        gold_totals = period_totals.get_total_amounts(
+            TransactionType.GOLD)
+        currency_totals = period_totals.get_total_amounts(
+            TransactionType.CURRENCY)
+
+        ax = fig.add_subplot()
         bar_width = 0.2
         x = np.arange(len(weeks))
 
@@ -513,29 +579,20 @@ class TabReport(customtkinter.CTkTabview):
 
         fig.subplots_adjust(bottom=0.2)
 
-        canvas = FigureCanvasTkAgg(fig, master=parent)
-        canvas.draw()
-        canvas.get_tk_widget().pack(padx=5, pady=(0, 2), fill="x")
-
-    def plot_markers_chart_for_this_month(self, parent, weeks, totals):
+    def plot_markers_chart_for_this_month(self, fig, weeks, totals,
+                                          period_totals):
         week_labels = [
             f"Week {i+1}\n{start.strftime('%d/%m/%Y')
                            } - {end.strftime('%d/%m/%Y')}"
             for i, (start, end) in enumerate(weeks)
         ]
 
-        gold_totals = [0] * len(weeks)
-        currency_totals = [0] * len(weeks)
-        for i, (start, end) in enumerate(weeks):
-            for txn in self.all_transactions:
-                txn_date = datetime.date(txn._year, txn._month, txn._day)
-                if start <= txn_date <= end:
-                    if isinstance(txn, GoldTransaction):
-                        gold_totals[i] += txn._total_amount
-                    elif isinstance(txn, CurrencyTransaction):
-                        currency_totals[i] += txn._total_amount
+        gold_totals = period_totals.get_total_amounts(
+            TransactionType.GOLD)
+        currency_totals = period_totals.get_total_amounts(
+            TransactionType.CURRENCY)
 
-        fig, ax = plt.subplots()
+        ax = fig.add_subplot()
 
         ax.plot(week_labels, gold_totals, marker='o', linestyle='-',
                 label='Gold', color='#f5d45f')
@@ -582,34 +639,22 @@ class TabReport(customtkinter.CTkTabview):
 
         fig.subplots_adjust(bottom=0.2)
 
-        canvas = FigureCanvasTkAgg(fig, master=parent)
-        canvas.draw()
-        canvas.get_tk_widget().pack(padx=5, pady=(0, 2), fill="x")
-
-    def plot_gold_bar_chart_for_this_month(self, parent, weeks, transactions):
+    def plot_gold_bar_chart_for_this_month(self, fig,
+                                           weeks, period_totals):
         week_labels = [
             f"Week {i+1}\n{start.strftime('%d/%m/%Y')
                            } - {end.strftime('%d/%m/%Y')}"
             for i, (start, end) in enumerate(weeks)
         ]
 
-        sjc_totals = [0] * len(weeks)
-        pnj_totals = [0] * len(weeks)
-        doji_totals = [0] * len(weeks)
-
-        for i, (start, end) in enumerate(weeks):
-            for txn in transactions:
-                if isinstance(txn, GoldTransaction):
-                    txn_date = datetime.date(txn._year, txn._month, txn._day)
-                    if start <= txn_date <= end:
-                        if txn._gold_type == GoldType.SJC:
-                            sjc_totals[i] += txn._total_amount
-                        elif txn._gold_type == GoldType.PNJ:
-                            pnj_totals[i] += txn._total_amount
-                        elif txn._gold_type == GoldType.DOJI:
-                            doji_totals[i] += txn._total_amount
-
-        fig, ax = plt.subplots()
+        sjc_totals = period_totals.get_total_amounts(
+            TransactionType.GOLD, GoldType.SJC)
+        pnj_totals = period_totals.get_total_amounts(
+            TransactionType.GOLD, GoldType.PNJ)
+        doji_totals = period_totals.get_total_amounts(
+            TransactionType.GOLD, GoldType.DOJI)
+
+        ax = fig.add_subplot()
         bar_width = 0.2
         x = np.arange(len(weeks))
 
@@ -661,35 +706,22 @@ class TabReport(customtkinter.CTkTabview):
 
         fig.subplots_adjust(bottom=0.2)
 
-        canvas = FigureCanvasTkAgg(fig, master=parent)
-        canvas.draw()
-        canvas.get_tk_widget().pack(padx=5, pady=(0, 2), fill="x")
-
-    def plot_gold_markers_chart_for_this_month(self, parent,
-                                               weeks, transactions):
+    def plot_gold_markers_chart_for_this_month(self, fig,
+                                               weeks, period_totals):
         week_labels = [
             f"Week {i+1}\n{start.strftime('%d/%m/%Y')
                            } - {end.strftime('%d/%m/%Y')}"
             for i, (start, end) in enumerate(weeks)
         ]
 
-        sjc_totals = [0] * len(weeks)
-        pnj_totals = [0] * len(weeks)
-        doji_totals = [0] * len(weeks)
+        sjc_totals = period_totals.get_total_amounts(
+            TransactionType.GOLD, GoldType.SJC)
+        pnj_totals = period_totals.get_total_amounts(
+            TransactionType.GOLD, GoldType.PNJ)
+        doji_totals = period_totals.get_total_amounts(
+            TransactionType.GOLD, GoldType.DOJI)
 
-        for i, (start, end) in enumerate(weeks):
-            for txn in transactions:
-                if isinstance(txn, GoldTransaction):
-                    txn_date = datetime.date(txn._year, txn._month, txn._day)
-                    if start <= txn_date <= end:
-                        if txn._gold_type == GoldType.SJC:
-                            sjc_totals[i] += txn._total_amount
-                        elif txn._gold_type == GoldType.PNJ:
-                            pnj_totals[i] += txn._total_amount
-                        elif txn._gold_type == GoldType.DOJI:
-                            doji_totals[i] += txn._total_amount
-
-        fig, ax = plt.subplots()
+        ax = fig.add_subplot()
 
         ax.plot(week_labels, sjc_totals, marker='o',
                 linestyle='-', label='SJC', color='#f5d45f')
@@ -737,35 +769,22 @@ class TabReport(customtkinter.CTkTabview):
 
         fig.subplots_adjust(bottom=0.2)
 
-        canvas = FigureCanvasTkAgg(fig, master=parent)
-        canvas.draw()
-        canvas.get_tk_widget().pack(padx=5, pady=(0, 2), fill="x")
-
-    def plot_currency_bar_chart_for_this_month(self, parent,
-                                               weeks, transactions):
+    def plot_currency_bar_chart_for_this_month(self, fig,
+                                               weeks, period_totals):
         week_labels = [
             f"Week {i+1}\n{start.strftime('%d/%m/%Y')
                            } - {end.strftime('%d/%m/%Y')}"
             for i, (start, end) in enumerate(weeks)
         ]
 
-        vnd_totals = [0] * len(weeks)
-        usd_totals = [0] * len(weeks)
-        eur_totals = [0] * len(weeks)
-
-        for i, (start, end) in enumerate(weeks):
-            for txn in transactions:
-                if isinstance(txn, CurrencyTransaction):
-                    txn_date = datetime.date(txn._year, txn._month, txn._day)
-                    if start <= txn_date <= end:
-                        if txn._currency_type == CurrencyType.VND:
-                            vnd_totals[i] += txn._total_amount
-                        elif txn._currency_type == CurrencyType.USD:
-                            usd_totals[i] += txn._total_amount
-                        elif txn._currency_type == CurrencyType.EUR:
-                            eur_totals[i] += txn._total_amount
-
-        fig, ax = plt.subplots()
+        vnd_totals = period_totals.get_total_amounts(
+            TransactionType.CURRENCY, CurrencyType.VND)
+        usd_totals = period_totals.get_total_amounts(
+            TransactionType.CURRENCY, CurrencyType.USD)
+        eur_totals = period_totals.get_total_amounts(
+            TransactionType.CURRENCY, CurrencyType.EUR)
+
+        ax = fig.add_subplot()
         bar_width = 0.2
         x = np.arange(len(weeks))
 
@@ -817,35 +836,22 @@ class TabReport(customtkinter.CTkTabview):
 
         fig.subplots_adjust(bottom=0.2)
 
-        canvas = FigureCanvasTkAgg(fig, master=parent)
-        canvas.draw()
-        canvas.get_tk_widget().pack(padx=5, pady=(0, 2), fill="x")
-
-    def plot_currency_markers_chart_for_this_month(self, parent,
-                                                   weeks, transactions):
+    def plot_currency_markers_chart_for_this_month(self, fig,
+                                                   weeks, period_totals):
         week_labels = [
             f"Week {i+1}\n{start.strftime('%d/%m/%Y')
                            } - {end.strftime('%d/%m/%Y')}"
             for i, (start, end) in enumerate(weeks)
         ]
 
-        vnd_totals = [0] * len(weeks)
-        usd_totals = [0] * len(weeks)
-        eur_totals = [0] * len(weeks)
+        vnd_totals = period_totals.get_total_amounts(
+            TransactionType.CURRENCY, CurrencyType.VND)
+        usd_totals = period_totals.get_total_amounts(
+            TransactionType.CURRENCY, CurrencyType.USD)
+        eur_totals = period_totals.get_total_amounts(
+            TransactionType.CURRENCY, CurrencyType.EUR)
 
-        for i, (start, end) in enumerate(weeks):
-            for txn in transactions:
-                if isinstance(txn, CurrencyTransaction):
-                    txn_date = datetime.date(txn._year, txn._month, txn._day)
-                    if start <= txn_date <= end:
-                        if txn._currency_type == CurrencyType.VND:
-                            vnd_totals[i] += txn._total_amount
-                        elif txn._currency_type == CurrencyType.USD:
-                            usd_totals[i] += txn._total_amount
-                        elif txn._currency_type == CurrencyType.EUR:
-                            eur_totals[i] += txn._total_amount
-
-        fig, ax = plt.subplots()
+        ax = fig.add_subplot()
 
         ax.plot(week_labels, vnd_totals, marker='o',
                 linestyle='-', label='VND', color='#006769')
@@ -893,13 +899,9 @@ class TabReport(customtkinter.CTkTabview):
 
         fig.subplots_adjust(bottom=0.2)
 
-        canvas = FigureCanvasTkAgg(fig, master=parent)
-        canvas.draw()
-        canvas.get_tk_widget().pack(padx=5, pady=(0, 2), fill="x")
-
     # WEEK
 
-    def plot_bar_chart_for_this_week(self, parent, transactions):
+    def plot_bar_chart_for_this_week(self, fig, period_totals):
         days = ["Monday", "Tuesday", "Wednesday",
                 "Thursday", "Friday", "Saturday", "Sunday"]
         now = datetime.datetime.now()
@@ -907,26 +909,13 @@ class TabReport(customtkinter.CTkTabview):
         date_labels = [(start_of_week + datetime.timedelta(days=i)
                         ).strftime("%A\n%d/%m/%Y") for i in range(7)]
 
-        totals = {day: 0 for day in days}
-        gold_totals = {day: 0 for day in days}
-        currency_totals = {day: 0 for day in days}
+        total_amounts = period_totals.get_total_amounts()
+        gold_amounts = period_totals.get_total_amounts(
+            TransactionType.GOLD)
+        currency_amounts = period_totals.get_total_amounts(
+            TransactionType.CURRENCY)
 
-        for transaction in transactions:
-            transaction_date = datetime.date(
-                transaction._year, transaction._month, transaction._day)
-            day_of_week = transaction_date.strftime('%A')
-            if day_of_week in totals:
-                totals[day_of_week] += transaction._total_amount
-                if isinstance(transaction, GoldTransaction):
-                    gold_totals[day_of_week] += transaction._total_amount
-                elif isinstance(transaction, CurrencyTransaction):
-                    currency_totals[day_of_week] += transaction._total_amount
-
-        total_amounts = [totals[day] for day in days]
-        gold_amounts = [gold_totals[day] for day in days]
-        currency_amounts = [currency_totals[day] for day in days]
-
-        fig, ax = plt.subplots()
+        ax = fig.add_subplot()
         bar_width = 0.2
         x = np.arange(len(days))
 
@@ -974,39 +963,20 @@ class TabReport(customtkinter.CTkTabview):
 
         fig.subplots_adjust(bottom=0.2)
 
-        canvas = FigureCanvasTkAgg(fig, master=parent)
-        canvas.draw()
-        canvas.get_tk_widget().pack(padx=5, pady=(0, 20), fill="x")
-
-    def plot_markers_chart_for_this_week(self, parent, transactions):
-        days = ["Monday", "Tuesday", "Wednesday", "Thursday",
-                "Friday", "Saturday", "Sunday"]
+    def plot_markers_chart_for_this_week(self, fig, period_totals):
         now = datetime.datetime.now()
         start_of_week = now - datetime.timedelta(days=now.weekday())
         date_labels = [(start_of_week
                         + datetime.timedelta(days=i)).strftime("%A\n%d/%m/%Y")
                        for i in range(7)]
 
-        totals = {day: 0 for day in days}
-        gold_totals = {day: 0 for day in days}
-        currency_totals = {day: 0 for day in days}
+        total_amounts = period_totals.get_total_amounts()
+        gold_amounts = period_totals.get_total_amounts(
+            TransactionType.GOLD)
+        currency_amounts = period_totals.get_total_amounts(
+            TransactionType.CURRENCY)
 
-        for transaction in transactions:
-            transaction_date = datetime.date(
-                transaction._year, transaction._month, transaction._day)
-            day_of_week = transaction_date.strftime('%A')
-            if day_of_week in totals:
-                totals[day_of_week] += transaction._total_amount
-                if isinstance(transaction, GoldTransaction):
-                    gold_totals[day_of_week] += transaction._total_amount
-                elif isinstance(transaction, CurrencyTransaction):
-                    currency_totals[day_of_week] += transaction._total_amount
-
-        total_amounts = [totals[day] for day in days]
-        gold_amounts = [gold_totals[day] for day in days]
-        currency_amounts = [currency_totals[day] for day in days]
-
-        fig, ax = plt.subplots()
+        ax = fig.add_subplot()
 
         ax.plot(date_labels, gold_amounts, marker='o',
                 linestyle='-', label='Gold', color='#f5d45f')
@@ -1053,11 +1023,7 @@ class TabReport(customtkinter.CTkTabview):
 
         fig.subplots_adjust(bottom=0.2)
 
-        canvas = FigureCanvasTkAgg(fig, master=parent)
-        canvas.draw()
-        canvas.get_tk_widget().pack(padx=5, pady=(0, 20), fill="x")
-
-    def plot_gold_bar_chart_for_this_week(self, parent, transactions):
+    def plot_gold_bar_chart_for_this_week(self, fig, period_totals):
         days = ["Monday", "Tuesday", "Wednesday", "Thursday",
                 "Friday", "Saturday", "Sunday"]
         now = datetime.datetime.now()
@@ -1066,29 +1032,14 @@ class TabReport(customtkinter.CTkTabview):
                         + datetime.timedelta(days=i)).strftime("%A\n%d/%m/%Y")
                        for i in range(7)]
 
-        sjc_totals = {day: 0 for day in days}
-        pnj_totals = {day: 0 for day in days}
-        doji_totals = {day: 0 for day in days}
+        sjc_amounts = period_totals.get_total_amounts(
+            TransactionType.GOLD, GoldType.SJC)
+        pnj_amounts = period_totals.get_total_amounts(
+            TransactionType.GOLD, GoldType.PNJ)
+        doji_amounts = period_totals.get_total_amounts(
+            TransactionType.GOLD, GoldType.DOJI)
 
-        for transaction in transactions:
-            if isinstance(transaction, GoldTransaction):
-                transaction_date = datetime.date(transaction._year,
-                                                 transaction._month,
-                                                 transaction._day)
-                day_of_week = transaction_date.strftime('%A')
-                if day_of_week in sjc_totals:
-                    if transaction._gold_type == GoldType.SJC:
-                        sjc_totals[day_of_week] += transaction._total_amount
-                    elif transaction._gold_type == GoldType.PNJ:
-                        pnj_totals[day_of_week] += transaction._total_amount
-                    elif transaction._gold_type == GoldType.DOJI:
-                        doji_totals[day_of_week] += transaction._total_amount
-
-        sjc_amounts = [sjc_totals[day] for day in days]
-        pnj_amounts = [pnj_totals[day] for day in days]
-        doji_amounts = [doji_totals[day] for day in days]
-
-        fig, ax = plt.subplots()
+        ax = fig.add_subplot()
         bar_width = 0.2
         x = np.arange(len(days))
 
@@ -1140,40 +1091,20 @@ class TabReport(customtkinter.CTkTabview):
 
         fig.subplots_adjust(bottom=0.2)
 
-        canvas = FigureCanvasTkAgg(fig, master=parent)
-        canvas.draw()
-        canvas.get_tk_widget().pack(padx=5, pady=(0, 20), fill="x")
-
-    def plot_gold_markers_chart_for_this_week(self, parent, transactions):
-        days = ["Monday", "Tuesday", "Wednesday",
-                "Thursday", "Friday", "Saturday", "Sunday"]
+    def plot_gold_markers_chart_for_this_week(self, fig, period_totals):
         now = datetime.datetime.now()
         start_of_week = now - datetime.timedelta(days=now.weekday())
         date_labels = [(start_of_week + datetime.timedelta(days=i)
                         ).strftime("%A\n%d/%m/%Y") for i in range(7)]
 
-        sjc_totals = {day: 0 for day in days}
-        pnj_totals = {day: 0 for day in days}
-        doji_totals = {day: 0 for day in days}
+        sjc_amounts = period_totals.get_total_amounts(
+            TransactionType.GOLD, GoldType.SJC)
+        pnj_amounts = period_totals.get_total_amounts(
+            TransactionType.GOLD, GoldType.PNJ)
+        doji_amounts = period_totals.get_total_amounts(
+            TransactionType.GOLD, GoldType.DOJI)
 
-        for transaction in transactions:
-            if isinstance(transaction, GoldTransaction):
-                transaction_date = datetime.date(
-                    transaction._year, transaction._month, transaction._day)
-                day_of_week = transaction_date.strftime('%A')
-                if day_of_week in sjc_totals:
-                    if transaction._gold_type == GoldType.SJC:
-                        sjc_totals[day_of_week] += transaction._total_amount
-                    elif transaction._gold_type == GoldType.PNJ:
-                        pnj_totals[day_of_week] += transaction._total_amount
-                    elif transaction._gold_type == GoldType.DOJI:
-                        doji_totals[day_of_week] += transaction._total_amount
-
-        sjc_amounts = [sjc_totals[day] for day in days]
-        pnj_amounts = [pnj_totals[day] for day in days]
-        doji_amounts = [doji_totals[day] for day in days]
-
-        fig, ax = plt.subplots()
+        ax = fig.add_subplot()
 
         ax.plot(date_labels, sjc_amounts, marker='o',
                 linestyle='-', label='SJC', color='#f5d45f')
@@ -1221,11 +1152,7 @@ class TabReport(customtkinter.CTkTabview):
 
         fig.subplots_adjust(bottom=0.2)
 
-        canvas = FigureCanvasTkAgg(fig, master=parent)
-        canvas.draw()
-        canvas.get_tk_widget().pack(padx=5, pady=(0, 20), fill="x")
-
-    def plot_currency_bar_chart_for_this_week(self, parent, transactions):
+    def plot_currency_bar_chart_for_this_week(self, fig, period_totals):
         days = ["Monday", "Tuesday", "Wednesday",
                 "Thursday", "Friday", "Saturday", "Sunday"]
         now = datetime.datetime.now()
@@ -1233,28 +1160,14 @@ class TabReport(customtkinter.CTkTabview):
         date_labels = [(start_of_week + datetime.timedelta(days=i)
                         ).strftime("%A\n%d/%m/%Y") for i in range(7)]
 
-        vnd_totals = {day: 0 for day in days}
-        usd_totals = {day: 0 for day in days}
-        eur_totals = {day: 0 for day in days}
+        vnd_amounts = period_totals.get_total_amounts(
+            TransactionType.CURRENCY, CurrencyType.VND)
+        usd_amounts = period_totals.get_total_amounts(
+            TransactionType.CURRENCY, CurrencyType.USD)
+        eur_amounts = period_totals.get_total_amounts(
+            TransactionType.CURRENCY, CurrencyType.EUR)
 
-        for transaction in transactions:
-            if isinstance(transaction, CurrencyTransaction):
-                transaction_date = datetime.date(
-                    transaction._year, transaction._month, transaction._day)
-                day_of_week = transaction_date.strftime('%A')
-                if day_of_week in vnd_totals:
-                    if transaction._currency_type == CurrencyType.VND:
-                        vnd_totals[day_of_week] += transaction._total_amount
-                    elif transaction._currency_type == CurrencyType.USD:
-                        usd_totals[day_of_week] += transaction._total_amount
-                    elif transaction._currency_type == CurrencyType.EUR:
-                        eur_totals[day_of_week] += transaction._total_amount
-
-        vnd_amounts = [vnd_totals[day] for day in days]
-        usd_amounts = [usd_totals[day] for day in days]
-        eur_amounts = [eur_totals[day] for day in days]
-
-        fig, ax = plt.subplots()
+        ax = fig.add_subplot()
         bar_width = 0.2
         x = np.arange(len(days))
 
@@ -1305,40 +1218,21 @@ class TabReport(customtkinter.CTkTabview):
 
         fig.subplots_adjust(bottom=0.2)
 
-        canvas = FigureCanvasTkAgg(fig, master=parent)
-        canvas.draw()
-        canvas.get_tk_widget().pack(padx=5, pady=(0, 20), fill="x")
-
-    def plot_currency_markers_chart_for_this_week(self, parent, transactions):
-        days = ["Monday", "Tuesday", "Wednesday",
-                "Thursday", "Friday", "Saturday", "Sunday"]
+    def plot_currency_markers_chart_for_this_week(self, fig,
+                                                  period_totals):
         now = datetime.datetime.now()
         start_of_week = now - datetime.timedelta(days=now.weekday())
         date_labels = [(start_of_week + datetime.timedelta(days=i)
                         ).strftime("%A\n%d/%m/%Y") for i in range(7)]
 
-        vnd_totals = {day: 0 for day in days}
-        usd_totals = {day: 0 for day in days}
-        eur_totals = {day: 0 for day in days}
+        vnd_amounts = period_totals.get_total_amounts(
+            TransactionType.CURRENCY, CurrencyType.VND)
+        usd_amounts = period_totals.get_total_amounts(
+            TransactionType.CURRENCY, CurrencyType.USD)
+        eur_amounts = period_totals.get_total_amounts(
+            TransactionType.CURRENCY, CurrencyType.EUR)
 
-        for transaction in transactions:
-            if isinstance(transaction, CurrencyTransaction):
-                transaction_date = datetime.date(
-                    transaction._year, transaction._month, transaction._day)
-                day_of_week = transaction_date.strftime('%A')
-                if day_of_week in vnd_totals:
-                    if transaction._currency_type == CurrencyType.VND:
-                        vnd_totals[day_of_week] += transaction._total_amount
-                    elif transaction._currency_type == CurrencyType.USD:
-                        usd_totals[day_of_week] += transaction._total_amount
-                    elif transaction._currency_type == CurrencyType.EUR:
-                        eur_totals[day_of_week] += transaction._total_amount
-
-        vnd_amounts = [vnd_totals[day] for day in days]
-        usd_amounts = [usd_totals[day] for day in days]
-        eur_amounts = [eur_totals[day] for day in days]
-
-        fig, ax = plt.subplots()
+        ax = fig.add_subplot()
 
         ax.plot(date_labels, vnd_amounts, marker='o',
                 linestyle='-', label='VND', color='#006769')
@@ -1386,23 +1280,8 @@ class TabReport(customtkinter.CTkTabview):
 
         fig.subplots_adjust(bottom=0.2)
 
-        canvas = FigureCanvasTkAgg(fig, master=parent)
-        canvas.draw()
-        canvas.get_tk_widget().pack(padx=5, pady=(0, 20), fill="x")
-
-    def get_total_amount_per_week(self, transactions, weeks):
-        totals = np.zeros(len(weeks))
-        transaction_dates = np.array(
-            [datetime.date(txn._year, txn._month, txn._day)
-             for txn in transactions])
-        transaction_amounts = np.array(
-            [txn._total_amount for txn in transactions])
-
-        for i, (start, end) in enumerate(weeks):
-            mask = (transaction_dates >= start) & (transaction_dates <= end)
-            totals[i] = np.sum(transaction_amounts[mask])
-
-        return totals.tolist()
+    def get_total_amount_per_week(self, period_totals):
+        return period_totals.get_total_amounts()
 
     def create_gold_transaction_treeview(self, frame):
         treeview_style = ttk.Style()
@@ -1522,13 +1401,22 @@ class TabReport(customtkinter.CTkTabview):
             formatted_integer_part, decimal_part)
         return formatted_total_amount
 
-    def open_total_details_window(self, transactions):
+    def open_total_details_window(self, transactions, period=None):
         if self.total_details_window is None \
             or not self.total_details_window \
                 .winfo_exists():
+            if period is None:
+                aggregate = TransactionAggregate(transactions)
+            else:
+                aggregate = self.master.master.master.transaction_list \
+                    .get_aggregate()
             self.total_details_window \
                 = TotalDetailsWindow(
-                    self, transactions=transactions)
+                    self,
+                    create_total_chart=lambda master:
+                    self.create_total_chart_frame(
+                        master, transactions, btn_details_status=False),
+                    aggregate=aggregate, period=period)
             self.total_details_window.after(
                 10, self.total_details_window.lift)
         else:
@@ -0,0 +1,94 @@
+import copy
+import tkinter
+import customtkinter
+
+
+class ThemeEngine:
+    THEME_FILES = {
+        "Dark-Blue": "dark-blue",
+        "Blue": "blue",
+        "Green": "green"
+    }
+
+    # A CTkFrame nested in a frame of the same color is drawn with
+    # top_fg_color, which is still read back through fg_color.
+    COLOR_ALIASES = {
+        ("CTkFrame", "fg_color"): ["top_fg_color"]
+    }
+
+    def __init__(self, root, theme_name):
+        self._root = root
+        self._theme_name = theme_name
+        self._themes = {}
+        self._color_maps = {}
+
+    def get_theme(self, theme_name):
+        return self._themes[theme_name]
+
+    def cache_theme(self, theme_name):
+        # Only the loaded theme can be read, so each one is copied while
+        # it is current.
+        if theme_name not in self._themes:
+            self._themes[theme_name] = copy.deepcopy(
+                customtkinter.ThemeManager.theme)
+
+    def get_color_map(self, old_theme_name, new_theme_name):
+        key = (old_theme_name, new_theme_name)
+        if key not in self._color_maps:
+            old_theme = self.get_theme(old_theme_name)
+            new_theme = self.get_theme(new_theme_name)
+
+            color_map = {}
+            for widget_name, old_options in old_theme.items():
+                new_options = new_theme.get(widget_name, {})
+                for option in old_options:
+                    aliases = self.COLOR_ALIASES.get((widget_name, option), [])
+                    for source in [option] + aliases:
+                        if source not in old_options or \
+                                old_options[source] == new_options.get(source):
+                            continue
+                        color_map.setdefault(widget_name, {}).setdefault(
+                            option, {})[self.freeze(old_options[source])] = \
+                            new_options[source]
+            self._color_maps[key] = color_map
+
+        return self._color_maps[key]
+
+    def apply_theme(self, theme_name):
+        if theme_name == self._theme_name:
+            return
+
+        self.cache_theme(self._theme_name)
+        customtkinter.set_default_color_theme(self.THEME_FILES[theme_name])
+        self.cache_theme(theme_name)
+
+        color_map = self.get_color_map(self._theme_name, theme_name)
+        self._theme_name = theme_name
+
+        # Colors the app set explicitly never match a theme default, so only
+        # widgets still showing the old theme's colors are touched.
+        widgets = [self._root]
+        while widgets:
+            widget = widgets.pop()
+            widgets.extend(widget.winfo_children())
+
+            options = self.get_widget_options(widget, color_map)
+            for option, colors in options.items():
+                try:
+                    current = widget.cget(option)
+                except (ValueError, tkinter.TclError):
+                    continue
+                new_value = colors.get(self.freeze(current))
+                if new_value is not None:
+                    widget.configure(**{option: new_value})
+
+    def get_widget_options(self, widget, color_map):
+        for widget_class in type(widget).__mro__:
+            if widget_class.__name__ in color_map:
+                return color_map[widget_class.__name__]
+        return {}
+
+    def freeze(self, value):
+        if isinstance(value, list):
+            return tuple(value)
+        return value
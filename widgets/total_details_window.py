@@ -1,19 +1,21 @@
 import customtkinter
 from sys import platform
 
-from models.gold_transaction_model import GoldTransaction
-from models.currency_transaction_model import CurrencyTransaction
+from enums.transaction_type_enum import TransactionType
 
 
 class TotalDetailsWindow(customtkinter.CTkToplevel):
-    def __init__(self, parent, transactions, *args, **kwargs):
+    def __init__(self, parent, create_total_chart, aggregate, period=None,
+                 *args, **kwargs):
         super().__init__(parent, *args, **kwargs)
         self.title("Total Details")
         self.iconbitmap(default='./resources/images/logo.ico')
         self.minsize(700, 600)
         self.configure(fg_color="#d9d9d9")
         self.parent = parent
-        self.transactions = transactions
+        self.create_total_chart = create_total_chart
+        self.aggregate = aggregate
+        self.period = period
 
         self.create_widget()
 
@@ -22,10 +24,7 @@ class TotalDetailsWindow(customtkinter.CTkToplevel):
                        lambda: self.iconbitmap("./resources/images/logo.ico"))
 
     def create_widget(self):
-        month_total_chart = \
-            self.parent.create_total_chart_frame(self,
-                                                 self.transactions,
-                                                 btn_details_status=False)
+        month_total_chart = self.create_total_chart(self)
         month_total_chart.pack(padx=10, pady=10, fill="x")
 
         gold_transaction_frame = customtkinter.CTkFrame(
@@ -55,21 +54,14 @@ class TotalDetailsWindow(customtkinter.CTkToplevel):
         )
         gold_title.pack(padx=5, pady=0, fill="x")
 
-        total_amount_transaction = 0
-        gold_total_amount_transaction = 0
-        currency_total_amount_transaction = 0
-        total_amount_quantity_transaction = 0
-        gold_total_amount_quantity_transaction = 0
-        currency_total_amount_quantity_transaction = 0
-        for transaction in self.transactions:
-            total_amount_transaction += transaction._total_amount
-            total_amount_quantity_transaction += 1
-            if isinstance(transaction, GoldTransaction):
-                gold_total_amount_transaction += transaction._total_amount
-                gold_total_amount_quantity_transaction += 1
-            if isinstance(transaction, CurrencyTransaction):
-                currency_total_amount_transaction += transaction._total_amount
-                currency_total_amount_quantity_transaction += 1
+        gold_total_amount_transaction = self.aggregate.get_total_amount(
+            TransactionType.GOLD, period=self.period)
+        currency_total_amount_transaction = self.aggregate.get_total_amount(
+            TransactionType.CURRENCY, period=self.period)
+        gold_total_amount_quantity_transaction = self.aggregate.get_count(
+            TransactionType.GOLD, period=self.period)
+        currency_total_amount_quantity_transaction = self.aggregate.get_count(
+            TransactionType.CURRENCY, period=self.period)
 
         gold_total_value = customtkinter.CTkLabel(
             master=gold_title_and_total_frame,
@@ -0,0 +1,142 @@
+from tkinter import ttk
+
+
+class VirtualTreeview(ttk.Treeview):
+    OVERSCAN = 20
+
+    def __init__(self, master, **kwargs):
+        super().__init__(master, **kwargs)
+        self.rows = []
+        self.get_row_values = None
+        self.offset = 0
+        self.window_start = 0
+        self.window_end = 0
+
+        self.bind("<MouseWheel>", self.on_mouse_wheel)
+        self.bind("<Button-4>", self.on_mouse_wheel)
+        self.bind("<Button-5>", self.on_mouse_wheel)
+        for key in ["<Up>", "<Down>", "<Prior>", "<Next>"]:
+            self.bind(key, self.on_key_press)
+
+    def set_rows(self, rows, get_row_values):
+        self.delete(*self.get_children())
+        self.rows = rows
+        self.get_row_values = get_row_values
+        self.offset = 0
+        self.window_start = 0
+        self.window_end = 0
+        self.render()
+
+    def update_rows(self, rows):
+        # Keeps the scroll position. Inserted rows whose transaction was
+        # replaced are rewritten, the rest of the window is left as is.
+        old_rows = self.rows
+        self.rows = rows
+        max_offset = max(len(rows) - self.get_visible_count(), 0)
+        self.offset = max(0, min(self.offset, max_offset))
+
+        start = max(self.offset - self.OVERSCAN, 0)
+        end = min(self.offset + self.get_visible_count() + self.OVERSCAN,
+                  len(rows))
+        keep_start = max(start, self.window_start)
+        keep_end = min(end, self.window_end)
+        if keep_start >= keep_end:
+            keep_start = keep_end = start
+
+        stale = [str(index)
+                 for index in range(self.window_start, self.window_end)
+                 if not keep_start <= index < keep_end]
+        if stale:
+            self.delete(*stale)
+
+        for index in range(keep_start, keep_end):
+            if rows[index] is not old_rows[index]:
+                self.item(str(index),
+                          values=self.get_row_values(rows[index]))
+        for index in reversed(range(start, keep_start)):
+            self.insert("", 0, iid=str(index),
+                        values=self.get_row_values(rows[index]))
+        for index in range(keep_end, end):
+            self.insert("", "end", iid=str(index),
+                        values=self.get_row_values(rows[index]))
+
+        self.window_start = start
+        self.window_end = end
+        self.render()
+
+    def get_visible_count(self):
+        return int(self.cget("height"))
+
+    def on_mouse_wheel(self, event):
+        if event.num == 4:
+            step = -1
+        elif event.num == 5:
+            step = 1
+        else:
+            step = -event.delta // 120 or (-1 if event.delta > 0 else 1)
+
+        self.scroll_to(self.offset + step)
+        return "break"
+
+    def on_key_press(self, event):
+        # Keyboard moves go through the window too, so every row can be
+        # reached and selected, not only the ones already inserted.
+        if not self.rows:
+            return "break"
+
+        step = 1
+        if event.keysym in ["Prior", "Next"]:
+            step = self.get_visible_count()
+        if event.keysym in ["Up", "Prior"]:
+            step = -step
+
+        focus = self.focus()
+        index = int(focus) + step if focus else self.offset
+        index = max(0, min(index, len(self.rows) - 1))
+
+        if index < self.offset:
+            self.scroll_to(index)
+        elif index >= self.offset + self.get_visible_count():
+            self.scroll_to(index - self.get_visible_count() + 1)
+
+        self.focus(str(index))
+        self.selection_set(str(index))
+        return "break"
+
+    def scroll_to(self, offset):
+        max_offset = max(len(self.rows) - self.get_visible_count(), 0)
+        self.offset = max(0, min(offset, max_offset))
+        self.render()
+
+    def render(self):
+        visible_end = min(self.offset + self.get_visible_count(),
+                          len(self.rows))
+        if self.window_start > self.offset or \
+                self.window_end < visible_end:
+            self.move_window(
+                max(self.offset - self.OVERSCAN, 0),
+                min(visible_end + self.OVERSCAN, len(self.rows)))
+
+        window_size = self.window_end - self.window_start
+        if window_size:
+            self.yview_moveto(
+                (self.offset - self.window_start) / window_size)
+
+    def move_window(self, start, end):
+        # Rows that stay in the window keep their items, and so their
+        # selection; only the rows scrolled past are swapped.
+        old_start, old_end = self.window_start, self.window_end
+        stale = [str(index) for index in range(old_start, old_end)
+                 if not start <= index < end]
+        if stale:
+            self.delete(*stale)
+
+        for index in reversed(range(start, min(end, old_start))):
+            self.insert("", 0, iid=str(index),
+                        values=self.get_row_values(self.rows[index]))
+        for index in range(max(start, old_end), end):
+            self.insert("", "end", iid=str(index),
+                        values=self.get_row_values(self.rows[index]))
+
+        self.window_start = start
+        self.window_end = end